@@ -0,0 +1,52 @@
+"""
+Compares radius queries served locally by BicycleParking with remote get_bicyle_parking calls to a local mock of DataMall with injected latency, reporting queries per second.
+
+Run with ``python benchmarks/bench_bicycle_parking.py [locations] [queries] [latency]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import contextlib
+import io
+import sys
+import time
+
+import numpy as np
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.bicycle import BicycleParking, ISLAND_BOUNDS
+from final_project_n_lavanya.spatial import haversine
+from mock_datamall import PAGE_SIZE, MockDataMall
+
+def main(locations = 5000, queries = 200, latency = 0.02):
+    rng = np.random.default_rng(0)
+    south, west, north, east = ISLAND_BOUNDS
+    lat, long = rng.uniform(south, north, locations), rng.uniform(west, east, locations)
+    records = [{'Description': f'Rack {i}', 'Latitude': lat[i], 'Longitude': long[i], 'RackType': 'Yellow Box', 'RackCount': 10} for i in range(locations)]
+
+    def within(query):
+        # Like DataMall, at most PAGE_SIZE locations are returned per response, paginated through $skip.
+        d = haversine(float(query['Lat']), float(query['Long']), lat, long)
+        skip = int(query.get('$skip', 0))
+        return [records[i] for i in np.flatnonzero(d <= float(query['Dist']))[skip:skip + PAGE_SIZE]]
+
+    qlat, qlong = rng.uniform(south, north, queries), rng.uniform(west, east, queries)
+    with MockDataMall({'BicycleParkingv2': within}, latency = latency) as server:
+        lta.BASE_URL = server.url
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            parking = BicycleParking.prefetch('benchmark')
+        print(f'prefetch: {server.requests} requests, {len(parking.df)} locations in {time.perf_counter() - start:.2f}s')
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(queries):
+                lta.get_bicyle_parking('benchmark', f'{qlat[i]:.6f}', f'{qlong[i]:.6f}')
+        remote = queries / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for i in range(queries):
+        parking.query(f'{qlat[i]:.6f}', f'{qlong[i]:.6f}')
+    local = queries / (time.perf_counter() - start)
+    start = time.perf_counter()
+    parking.query_many(qlat, qlong, 0.5)
+    batched = queries / (time.perf_counter() - start)
+    print(f'remote: {remote:.0f} queries/s  local: {local:.0f} queries/s  local batched: {batched:.0f} queries/s')
+
+if __name__ == '__main__':
+    main(*(f(a) for f, a in zip((int, int, float), sys.argv[1:])))
@@ -0,0 +1,25 @@
+"""
+Measures page throughput of a full BusRoutes fetch at different levels of concurrency, against a local mock of DataMall with injected latency.
+
+Run with ``python benchmarks/bench_concurrent_pages.py [rows] [latency]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import sys
+import time
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from mock_datamall import MockDataMall, bus_routes
+
+def main(rows = 26000, latency = 0.05):
+    records = bus_routes(rows)
+    with MockDataMall({'BusRoutes': records}, latency = latency) as server:
+        lta.BASE_URL = server.url
+        for workers in (1, 2, 4, 8, 16):
+            server.requests = 0
+            start = time.perf_counter()
+            df = lta.get_bus_routes('benchmark', workers = workers)
+            elapsed = time.perf_counter() - start
+            assert df.to_dict('records') == records
+            print(f'workers: {workers:>2}  requests: {server.requests:>3}  time: {elapsed:.3f}s  pages/s: {server.requests / elapsed:.1f}')
+
+if __name__ == '__main__':
+    main(*(f(a) for f, a in zip((int, float), sys.argv[1:])))
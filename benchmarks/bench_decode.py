@@ -0,0 +1,67 @@
+"""
+Measures CPU time per MB of response body for turning paginated JSON responses into typed dataframes, with the standard library decoder and with msgspec, over synthetic pages of the size and shape of the real datasets.
+
+Both paths run the same steps as the paginated get_* functions: decode every page, merge the records, build the dataframe and cast it to the endpoint's schema.
+
+Run with ``python benchmarks/bench_decode.py [repeats]`` from an environment where the package and msgspec are installed (e.g. ``poetry run``).
+"""
+import json
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+
+from final_project_n_lavanya import final_project_n_lavanya
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.schemas import apply_schema
+
+def synthetic_records(endpoint, n, seed = 0):
+    rng = np.random.default_rng(seed)
+    if endpoint == 'TrafficSpeedBandsv2':
+        return [{'LinkID': str(100000 + i), 'RoadName': f'ROAD {i % 3000}', 'RoadCategory': 'ABCDE'[i % 5], 'SpeedBand': int(rng.integers(1, 9)),
+                 'MinimumSpeed': '10', 'MaximumSpeed': '19', 'StartLon': '103.8123', 'StartLat': '1.3123', 'EndLon': '103.8134', 'EndLat': '1.3134'}
+                for i in range(n)]
+    if endpoint == 'BusRoutes':
+        return [{'ServiceNo': str(i % 400), 'Operator': 'SBST', 'Direction': 1 + i % 2, 'StopSequence': i % 80, 'BusStopCode': f'{i % 5000:05d}',
+                 'Distance': round(float(rng.uniform(0, 40)), 1), 'WD_FirstBus': '0530', 'WD_LastBus': '2330', 'SAT_FirstBus': '0530',
+                 'SAT_LastBus': '2330', 'SUN_FirstBus': '0600', 'SUN_LastBus': '2300'} for i in range(n)]
+    return [{'CarParkID': str(i), 'Area': 'Marina', 'Development': f'Block {i % 600}', 'Location': '1.29 103.85', 'AvailableLots': int(rng.integers(0, 900)),
+             'LotType': 'C', 'Agency': 'HDB'} for i in range(n)]
+
+def responses(records):
+    pages = []
+    for skip in range(0, len(records) + 1, final_project_n_lavanya.PAGE_SIZE):
+        r = requests.Response()
+        r.status_code = 200
+        r._content = json.dumps({'odata.metadata': 'x', 'value': records[skip:skip + final_project_n_lavanya.PAGE_SIZE]}).encode()
+        pages.append(r)
+    return pages
+
+def build(client, endpoint, pages):
+    records, rows = None, 0
+    for r in pages:
+        page, n = final_project_n_lavanya._decode(client, r, endpoint)
+        records = final_project_n_lavanya._extend(records, page, rows, n)
+        rows += n
+    return apply_schema(pd.DataFrame(records), endpoint)
+
+def main(repeats = 3):
+    for endpoint, n in [('TrafficSpeedBandsv2', 60000), ('BusRoutes', 26000), ('CarParkAvailabilityv2', 2000)]:
+        pages = responses(synthetic_records(endpoint, n))
+        mb = sum(len(r.content) for r in pages) / 2 ** 20
+        timings = {}
+        for decoder in ['json', 'msgspec']:
+            client = DataMall(decoder = decoder)
+            build(client, endpoint, pages)
+            best = np.inf
+            for _ in range(repeats):
+                start = time.process_time()
+                build(client, endpoint, pages)
+                best = min(best, time.process_time() - start)
+            timings[decoder] = best / mb * 1000
+        print(f'{endpoint:>22}: {mb:5.1f} MB  json: {timings["json"]:5.1f} ms/MB  msgspec: {timings["msgspec"]:5.1f} ms/MB  ({timings["json"] / timings["msgspec"]:.1f}x)')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
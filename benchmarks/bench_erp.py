@@ -0,0 +1,57 @@
+"""
+Times batched ERP charge lookups with an ERPIndex against filtering the get_erp_rates frame per crossing, over a synthetic rate table of the size of the real one.
+
+Run with ``python benchmarks/bench_erp.py [lookups]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.erp import ERPIndex
+
+VEHICLE_TYPES = ['Passenger Cars/Light Goods Vehicles/Taxis', 'Motorcycles', 'Light Goods Vehicles', 'Heavy Goods Vehicles/Small Buses', 'Very Heavy Goods Vehicles/Big Buses', 'Taxis']
+
+def synthetic_rates(zones = 80, seed = 0):
+    """
+    Half-hourly rates from 07:00 to 20:00 for every zone, vehicle type and day type, with a second schedule taking effect for a quarter of the zones.
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    for zone in range(zones):
+        for effective in ['2020-08-03', '2021-01-04'] if zone % 4 == 0 else ['2020-08-03']:
+            for vehicle in VEHICLE_TYPES:
+                for day in ['Weekdays', 'Saturday']:
+                    starts = pd.date_range('07:00', '19:30', freq = '30min')
+                    frames.append(pd.DataFrame({'VehicleType': vehicle, 'DayType': day, 'StartTime': starts.strftime('%H:%M'),
+                                                'EndTime': (starts + pd.Timedelta('30min')).strftime('%H:%M'), 'ZoneID': f'Z{zone:02d}',
+                                                'ChargeAmount': rng.choice([0, 0.5, 1, 2, 3], len(starts)), 'EffectiveDate': effective}))
+    return pd.concat(frames, ignore_index = True)
+
+def main(lookups = 1000000):
+    df = synthetic_rates()
+    start = time.perf_counter()
+    index = ERPIndex.from_rates(df)
+    print(f'rates: {len(df)}  build: {(time.perf_counter() - start) * 1000:.0f}ms')
+    rng = np.random.default_rng(1)
+    zones = np.array([f'Z{z:02d}' for z in range(80)], dtype = object)[rng.integers(0, 80, lookups)]
+    vehicles = np.array(VEHICLE_TYPES, dtype = object)[rng.integers(0, len(VEHICLE_TYPES), lookups)]
+    when = np.datetime64('2020-10-01') + rng.integers(0, 180 * 1440, lookups).astype('timedelta64[m]')
+    index.charge(zones[:10], vehicles[:10], when[:10])
+    start = time.perf_counter()
+    index.charge(zones, vehicles, when)
+    elapsed = time.perf_counter() - start
+    print(f'ERPIndex: {lookups / elapsed / 1e6:.2f}M lookups/s')
+    sample = 200
+    start = time.perf_counter()
+    for z, v, t in zip(zones[:sample], vehicles[:sample], pd.to_datetime(when[:sample])):
+        day = 'Saturday' if t.weekday() == 5 else 'Weekdays'
+        rows = df[(df.ZoneID == z) & (df.VehicleType == v) & (df.DayType == day) & (df.EffectiveDate <= t.strftime('%Y-%m-%d'))]
+        rows = rows[rows.EffectiveDate == rows.EffectiveDate.max()]
+        hhmm = t.strftime('%H:%M')
+        rows[(rows.StartTime <= hhmm) & (rows.EndTime > hhmm)].ChargeAmount.sum()
+    print(f'frame filter: {sample / (time.perf_counter() - start):.0f} lookups/s')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,42 @@
+"""
+Compares flatten_bus_arrivals with pd.json_normalize on the services of a synthetic batch of bus stops, reporting time and memory of the resulting frames.
+
+Run with ``python benchmarks/bench_flatten_arrivals.py [stops] [services_per_stop]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import random
+import sys
+import time
+
+import pandas as pd
+
+from final_project_n_lavanya.final_project_n_lavanya import flatten_bus_arrivals
+
+def synthetic_services(stops, services_per_stop):
+    rng = random.Random(0)
+
+    def bus():
+        return {'OriginCode': f'{rng.randrange(99999):05d}', 'DestinationCode': f'{rng.randrange(99999):05d}',
+                'EstimatedArrival': f'2026-10-17T08:{rng.randrange(60):02d}:{rng.randrange(60):02d}+08:00',
+                'Latitude': f'1.{rng.randrange(10 ** 6):06d}', 'Longitude': f'103.{rng.randrange(10 ** 6):06d}',
+                'VisitNumber': '1', 'Load': rng.choice(['SEA', 'SDA', 'LSD']), 'Feature': 'WAB', 'Type': rng.choice(['SD', 'DD', 'BD'])}
+
+    return [{'ServiceNo': str(rng.randrange(1, 999)), 'Operator': rng.choice(['SBST', 'SMRT', 'TTS', 'GAS']),
+             'NextBus': bus(), 'NextBus2': bus(), 'NextBus3': bus()} for _ in range(stops * services_per_stop)]
+
+def timed(function):
+    start = time.perf_counter()
+    df = function()
+    return time.perf_counter() - start, df.memory_usage(deep = True).sum() / 2 ** 20, len(df)
+
+def main(stops = 5000, services_per_stop = 8):
+    services = synthetic_services(stops, services_per_stop)
+    results = {
+        'pd.json_normalize': timed(lambda: pd.json_normalize(services)),
+        'flatten (wide)': timed(lambda: flatten_bus_arrivals(services, 'wide')),
+        'flatten (long)': timed(lambda: flatten_bus_arrivals(services, 'long')),
+    }
+    for name, (elapsed, memory, rows) in results.items():
+        print(f'{name:<18} rows: {rows:>7}  time: {elapsed:.3f}s  frame memory: {memory:.1f} MiB')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+Compares latency and peak Python memory of each output form of get_bus_routes and get_traffic_speed_bands, and of streaming the same pages with stream_batches, against a local mock DataMall.
+
+Run with ``python benchmarks/bench_formats.py [speed_bands] [routes]`` from the benchmarks directory, in an environment where the package and pyarrow are installed (e.g. ``poetry run``).
+"""
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.client import DataMall
+from mock_datamall import MockDataMall, bus_routes
+
+def speed_bands(n):
+    """
+    Returns n synthetic TrafficSpeedBandsv2 records.
+    """
+    return [{'LinkID': str(100000 + i), 'RoadName': f'ROAD {i % 3000}', 'RoadCategory': 'ABCDE'[i % 5], 'SpeedBand': 1 + i % 8,
+             'MinimumSpeed': '10', 'MaximumSpeed': '19', 'Location': '1.3123 103.8123 1.3134 103.8134'} for i in range(n)]
+
+def measure(fetch):
+    """
+    Returns the best latency of three calls, and the peak memory of a fourth call traced separately, as tracing slows calls down.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            fetch()
+            elapsed = min(elapsed, time.perf_counter() - start)
+        tracemalloc.start()
+        fetch()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+def consume(batches):
+    rows = 0
+    for batch in batches:
+        rows += len(batch)
+    return rows
+
+def main(bands = 60000, routes = 26000):
+    with MockDataMall({'TrafficSpeedBandsv2': speed_bands(bands), 'BusRoutes': bus_routes(routes)}) as server:
+        lta.BASE_URL = server.url
+        with DataMall():
+            for name, endpoint, fetch in [('get_traffic_speed_bands', 'TrafficSpeedBandsv2', lta.get_traffic_speed_bands),
+                                          ('get_bus_routes', 'BusRoutes', lta.get_bus_routes)]:
+                print(name)
+                for output in lta.OUTPUTS:
+                    elapsed, peak = measure(lambda: fetch('benchmark', workers = 4, output = output))
+                    print(f'  {output:>8}: {elapsed * 1000:6.0f}ms  peak {peak / 2 ** 20:6.1f} MiB')
+                for output in ['arrow', 'records']:
+                    elapsed, peak = measure(lambda: consume(lta.stream_batches('benchmark', endpoint, output = output, workers = 4)))
+                    print(f'  stream_batches({output}): {elapsed * 1000:6.0f}ms  peak {peak / 2 ** 20:6.1f} MiB')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Reports the import time of the package as measured by ``python -X importtime``, in fresh interpreters, for importing the main module, fetching records in raw form and fetching a dataframe, along with the modules that take the longest to import.
+
+Run with ``python benchmarks/bench_import.py [runs]`` from the benchmarks directory, in an environment where the package is installed (e.g. ``poetry run``).
+"""
+import subprocess
+import sys
+import time
+
+FETCH = '''
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.client import DataMall
+from mock_datamall import MockDataMall
+with MockDataMall({{'BusStops': [{{'BusStopCode': '01012', 'RoadName': 'Victoria St', 'Latitude': 1.29, 'Longitude': 103.85}}]}}) as server:
+    lta.BASE_URL = server.url
+    lta.get_bus_stops('benchmark', output = {output!r})
+'''
+
+CASES = [('import', 'import final_project_n_lavanya.final_project_n_lavanya'),
+         ('records', FETCH.format(output = 'records')),
+         ('pandas', FETCH.format(output = 'pandas'))]
+
+def run(statement):
+    """
+    Returns the wall time of a fresh interpreter running a statement, and the self import time in microseconds of each module it imported.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output = True, text = True, check = True)
+    elapsed = time.perf_counter() - start
+    modules = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            own, _, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = int(own)
+    return elapsed, modules
+
+def main(runs = 5):
+    for name, statement in CASES:
+        results = [run(statement) for _ in range(runs)]
+        elapsed = min(e for e, _ in results)
+        modules = min((m for _, m in results), key = lambda m: sum(m.values()))
+        top = sorted(modules.items(), key = lambda item: -item[1])[:5]
+        print(f'{name:>8}: {elapsed * 1000:6.0f}ms wall  {sum(modules.values()) / 1000:6.1f}ms importing {len(modules)} modules')
+        print('          ' + ', '.join(f'{module} {own / 1000:.1f}ms' for module, own in top))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
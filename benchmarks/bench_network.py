@@ -0,0 +1,61 @@
+"""
+Times building a BusNetwork from a synthetic get_bus_routes frame of the size of Singapore's network, saving and loading it, and answering shortest-path, fewest-transfer and reachability queries between random stops.
+
+Run with ``python benchmarks/bench_network.py [stops] [services] [queries]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.network import BusNetwork
+
+def synthetic_routes(stops = 5000, services = 350, seed = 0):
+    """
+    Routes that wander across a grid of stops, so that services share stops as real ones do.
+    """
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(stops)))
+    steps = np.array([(0, 1), (1, 0), (0, -1), (-1, 0)])
+    frames = []
+    for service in range(services):
+        n = rng.integers(20, 80)
+        walk = np.cumsum(steps[rng.integers(0, 4, n)], axis = 0) + rng.integers(0, side, 2)
+        walk = np.clip(walk, 0, side - 1)
+        codes = (walk[:, 0] * side + walk[:, 1]) % stops
+        distance = np.concatenate([[0], np.cumsum(rng.uniform(0.2, 0.6, n - 1))]).round(1)
+        for direction, (c, d) in enumerate([(codes, distance), (codes[::-1], distance)], 1):
+            frames.append(pd.DataFrame({'ServiceNo': str(service), 'Direction': direction, 'StopSequence': np.arange(1, n + 1),
+                                        'BusStopCode': [f'{x:05d}' for x in c], 'Distance': d}))
+    return pd.concat(frames, ignore_index = True)
+
+def main(stops = 5000, services = 350, queries = 1000):
+    df = synthetic_routes(stops, services)
+    start = time.perf_counter()
+    network = BusNetwork.from_routes(df)
+    print(f'rows: {len(df)}  stops: {len(network.stops)}  edges: {len(network.indices)}  build: {(time.perf_counter() - start) * 1000:.0f}ms')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'network.npz')
+        network.save(path)
+        start = time.perf_counter()
+        network = BusNetwork.load(path)
+        print(f'load: {(time.perf_counter() - start) * 1000:.1f}ms  file: {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+    rng = np.random.default_rng(1)
+    pairs = network.stops.to_numpy()[rng.integers(0, len(network.stops), (queries, 2))]
+    start = time.perf_counter()
+    network.shortest_path(*pairs[0])
+    print(f'first shortest_path (landmarks): {(time.perf_counter() - start) * 1000:.0f}ms')
+    for name, query in [('shortest_path', lambda a, b: network.shortest_path(a, b)),
+                        ('fewest_transfers', lambda a, b: network.fewest_transfers(a, b)),
+                        ('reachable(10)', lambda a, b: network.reachable(a, 10))]:
+        start = time.perf_counter()
+        for a, b in pairs:
+            query(a, b)
+        elapsed = time.perf_counter() - start
+        print(f'{name:>17}: {queries / elapsed:8.0f} queries/s')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Compares queries on an ODCube with the same queries on the origin-destination dataframe it is built from, on synthetic data, reporting memory and query times.
+
+Run with ``python benchmarks/bench_od_cube.py [rows]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.od import ODCube
+
+def synthetic_frame(rows):
+    rng = np.random.default_rng(0)
+    codes = np.array([f'{i:05d}' for i in rng.choice(99999, 5000, replace = False)])
+    df = pd.DataFrame({
+        'DAY_TYPE': rng.choice(['WEEKDAY', 'WEEKENDS/HOLIDAY'], rows),
+        'TIME_PER_HOUR': rng.integers(0, 24, rows).astype(np.int8),
+        'ORIGIN_PT_CODE': codes[rng.integers(0, len(codes), rows)],
+        'DESTINATION_PT_CODE': codes[rng.integers(0, len(codes), rows)],
+        'TOTAL_TRIPS': rng.integers(1, 500, rows).astype(np.int32),
+    })
+    df = df.drop_duplicates(['DAY_TYPE', 'TIME_PER_HOUR', 'ORIGIN_PT_CODE', 'DESTINATION_PT_CODE'])
+    return df, codes, dict(zip(codes, rng.integers(0, 55, len(codes))))
+
+def timed(function, repeat = 20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main(rows = 5000000):
+    df, codes, areas = synthetic_frame(rows)
+    compact = df.astype({'DAY_TYPE': 'category', 'ORIGIN_PT_CODE': 'category', 'DESTINATION_PT_CODE': 'category'})
+    start = time.perf_counter()
+    cube = ODCube.from_frame(compact)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    cube.transpose()
+    transpose = time.perf_counter() - start
+    origin = codes[0]
+    print(f'rows: {len(df)}  build: {build:.2f}s  transpose (for column queries): {transpose:.2f}s')
+    print(f'memory  object frame: {df.memory_usage(deep = True).sum() / 2 ** 20:.0f} MiB  categorical frame: {compact.memory_usage(deep = True).sum() / 2 ** 20:.0f} MiB  cube: {cube.nbytes / 2 ** 20:.0f} MiB (with transpose: {(cube.nbytes + cube.transpose().nbytes) / 2 ** 20:.0f} MiB)')
+    queries = {
+        'top destinations (weekday, 7-9h)': (
+            lambda: compact[(compact.ORIGIN_PT_CODE == origin) & (compact.DAY_TYPE == 'WEEKDAY') & compact.TIME_PER_HOUR.between(7, 9)].groupby('DESTINATION_PT_CODE').TOTAL_TRIPS.sum().nlargest(10),
+            lambda: cube.top_destinations(origin, 10, 'WEEKDAY', range(7, 10))),
+        'top origins (all)': (
+            lambda: compact[compact.DESTINATION_PT_CODE == origin].groupby('ORIGIN_PT_CODE').TOTAL_TRIPS.sum().nlargest(10),
+            lambda: cube.top_origins(origin, 10)),
+        'origin totals (weekday)': (
+            lambda: compact[compact.DAY_TYPE == 'WEEKDAY'].groupby('ORIGIN_PT_CODE').TOTAL_TRIPS.sum(),
+            lambda: cube.origin_totals('WEEKDAY')),
+        'area flows (weekday, 8h)': (
+            lambda: compact[(compact.DAY_TYPE == 'WEEKDAY') & (compact.TIME_PER_HOUR == 8)].assign(o = lambda d: d.ORIGIN_PT_CODE.map(areas), d = lambda d: d.DESTINATION_PT_CODE.map(areas)).groupby(['o', 'd']).TOTAL_TRIPS.sum(),
+            lambda: cube.flows(areas, 'WEEKDAY', [8])),
+    }
+    for name, (frame_query, cube_query) in queries.items():
+        print(f'{name:<34} dataframe: {timed(frame_query, 3):8.2f}ms  cube: {timed(cube_query):7.2f}ms')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
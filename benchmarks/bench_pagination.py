@@ -0,0 +1,26 @@
+"""
+Measures the time and peak memory of fetching a full paginated dataset from a local mock of DataMall.
+
+Run with ``python benchmarks/bench_pagination.py [rows]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import sys
+import time
+import tracemalloc
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from mock_datamall import MockDataMall, bus_routes
+
+def main(rows = 26000):
+    with MockDataMall({'BusRoutes': bus_routes(rows)}) as server:
+        lta.BASE_URL = server.url
+        tracemalloc.start()
+        start = time.perf_counter()
+        df = lta.get_bus_routes('benchmark')
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    assert len(df) == rows
+    print(f'rows: {len(df)}  pages: {server.requests}  time: {elapsed:.3f}s  peak memory: {peak / 2 ** 20:.1f} MiB')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
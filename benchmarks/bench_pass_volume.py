@@ -0,0 +1,56 @@
+"""
+Compares naive pd.read_csv with the chunked, compactly typed parse of read_pass_vol_csv on a synthetic zipped origin-destination CSV file, reporting time, peak memory and frame memory.
+
+Run with ``python benchmarks/bench_pass_volume.py [rows]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.final_project_n_lavanya import read_pass_vol_csv
+
+def synthetic_archive(path, rows):
+    rng = np.random.default_rng(0)
+    codes = np.array([f'{i:05d}' for i in rng.choice(99999, 5000, replace = False)])
+    df = pd.DataFrame({
+        'YEAR_MONTH': '2020-11',
+        'DAY_TYPE': rng.choice(['WEEKDAY', 'WEEKENDS/HOLIDAY'], rows),
+        'TIME_PER_HOUR': rng.integers(0, 24, rows),
+        'PT_TYPE': 'BUS',
+        'ORIGIN_PT_CODE': codes[rng.integers(0, len(codes), rows)],
+        'DESTINATION_PT_CODE': codes[rng.integers(0, len(codes), rows)],
+        'TOTAL_TRIPS': rng.integers(1, 500, rows),
+    })
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        with archive.open('origin_destination_bus_202011.csv', 'w') as f:
+            df.to_csv(f, index = False)
+
+def measure(parse):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = parse()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20, df.memory_usage(deep = True).sum() / 2 ** 20
+
+def parse_archive(path):
+    with zipfile.ZipFile(path) as archive, archive.open(archive.namelist()[0]) as f:
+        return read_pass_vol_csv(f)
+
+def main(rows = 5000000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'odbus.zip')
+        synthetic_archive(path, rows)
+        results = {'pd.read_csv': measure(lambda: pd.read_csv(path)), 'read_pass_vol_csv': measure(lambda: parse_archive(path))}
+    for name, (elapsed, peak, size) in results.items():
+        print(f'{name:<18} rows: {rows}  time: {elapsed:.2f}s  peak memory: {peak:.0f} MiB  frame memory: {size:.0f} MiB')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Compares fanning out get_bus_arrivals_many over a local mock DataMall that throttles requests beyond a quota, with no limiter, with the fixed rate parameter and with an adaptive RateLimiter on the client.
+
+Run with ``python benchmarks/bench_ratelimit.py [quota] [stops] [workers]`` from the benchmarks directory, in an environment where the package is installed (e.g. ``poetry run``).
+"""
+import contextlib
+import io
+import sys
+import time
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.ratelimit import RateLimiter
+from mock_datamall import MockDataMall
+
+def bus(minute):
+    return {'OriginCode': '77009', 'DestinationCode': '77009', 'EstimatedArrival': f'2020-11-10T08:{minute:02d}:00+08:00',
+            'Latitude': '1.3154', 'Longitude': '103.9059', 'VisitNumber': '1', 'Load': 'SEA', 'Feature': 'WAB', 'Type': 'SD'}
+
+def arrivals(query):
+    """
+    Returns the upcoming buses of one service at a bus stop.
+    """
+    return [{'ServiceNo': '15', 'Operator': 'GAS', 'NextBus': bus(1), 'NextBus2': bus(9), 'NextBus3': bus(17)}]
+
+def main(quota = 200, stops = 3000, workers = 32):
+    codes = [f'{i:05d}' for i in range(stops)]
+    cases = [('no limiter', {}, {}),
+             ('rate = quota / 2', {}, {'rate': quota / 2}),
+             ('RateLimiter', {'limiter': RateLimiter(rate = 20, backoff = 0.1)}, {})]
+    for name, client_options, options in cases:
+        with MockDataMall({'BusArrivals': lambda query: {'Services': arrivals(query)}}, quota = quota) as server:
+            lta.BASE_URL = server.url
+            # The mock's bucket starts full; let it empty between cases like a fresh quota would.
+            time.sleep(1)
+            with DataMall(pool_size = workers, **client_options), contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                found, failures = lta.get_bus_arrivals_many('benchmark', codes, workers = workers, **options)
+                elapsed = time.perf_counter() - start
+            print(f'{name:>16}: {elapsed:5.1f}s  {(stops - len(failures)) / elapsed:6.1f} stops/s  '
+                  f'{len(failures):5d} failed  {server.throttled:5d} throttled of {server.requests} requests')
+            if 'limiter' in client_options:
+                stats = client_options['limiter'].stats()
+                print(f'{"":>18}retries {stats["retries"]}, final rate {stats["rate"]:.0f}/s, achieved {stats["achieved_rate"]:.0f}/s')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,46 @@
+"""
+Prints the memory of each endpoint's dataframe as parsed from JSON and after apply_schema, over synthetic records of the size and shape of the real datasets.
+
+Run with ``python benchmarks/bench_schemas.py`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.schemas import memory_report
+
+def synthetic_frames(seed = 0):
+    rng = np.random.default_rng(seed)
+    hhmm = lambda n, lo, hi: [f'{h % 24:02d}{m:02d}' for h, m in zip(rng.integers(lo, hi, n), rng.integers(0, 60, n))]
+    coordinates = lambda n: (rng.uniform(1.24, 1.46, n).round(6).astype(str), rng.uniform(103.6, 104.0, n).round(6).astype(str))
+    n = 26000
+    routes = pd.DataFrame({'ServiceNo': rng.integers(1, 400, n).astype(str), 'Operator': rng.choice(['SBST', 'SMRT', 'TTS', 'GAS'], n),
+                           'Direction': rng.integers(1, 3, n), 'StopSequence': rng.integers(1, 80, n),
+                           'BusStopCode': [f'{x:05d}' for x in rng.integers(0, 5000, n)], 'Distance': rng.uniform(0, 40, n).round(1)})
+    for day in ['WD', 'SAT', 'SUN']:
+        routes[f'{day}_FirstBus'], routes[f'{day}_LastBus'] = hhmm(n, 5, 7), hhmm(n, 22, 26)
+    n = 5000
+    lat, lon = coordinates(n)
+    stops = pd.DataFrame({'BusStopCode': [f'{x:05d}' for x in range(n)], 'RoadName': rng.choice([f'Road {i}' for i in range(1500)], n),
+                          'Description': [f'Stop {i}' for i in range(n)], 'Latitude': lat.astype(float), 'Longitude': lon.astype(float)})
+    n = 2000
+    lat, lon = coordinates(n)
+    carparks = pd.DataFrame({'CarParkID': [str(i) for i in range(n)], 'Area': rng.choice(['Marina', 'Orchard', ''], n),
+                             'Development': rng.choice([f'Block {i}' for i in range(600)], n), 'Location': [f'{a} {b}' for a, b in zip(lat, lon)],
+                             'AvailableLots': rng.integers(0, 900, n), 'LotType': rng.choice(['C', 'H', 'Y'], n), 'Agency': rng.choice(['HDB', 'LTA', 'URA'], n),
+                             'Latitude': lat, 'Longitude': lon})
+    n = 60000
+    lat, lon = coordinates(n)
+    bands = pd.DataFrame({'LinkID': [str(i) for i in range(n)], 'RoadName': rng.choice([f'Road {i}' for i in range(3000)], n),
+                          'RoadCategory': rng.choice(list('ABCDE'), n), 'SpeedBand': rng.integers(1, 9, n),
+                          'MinimumSpeed': rng.choice(['0', '10', '20', '30'], n), 'MaximumSpeed': rng.choice(['9', '19', '29', '39'], n),
+                          'Location': [f'{a} {b} {a} {b}' for a, b in zip(lat, lon)], 'Latitude': lat, 'Longitude': lon})
+    return {'BusRoutes': routes, 'BusStops': stops, 'CarParkAvailabilityv2': carparks, 'TrafficSpeedBandsv2': bands}
+
+def main():
+    for endpoint, df in synthetic_frames().items():
+        total = memory_report(df, endpoint).loc['Total']
+        print(f'{endpoint:>22}: {len(df):6d} rows  {total.BytesBefore / 2 ** 20:6.2f} MiB -> {total.BytesAfter / 2 ** 20:5.2f} MiB  ({total.Ratio:.0%})')
+    print(memory_report(synthetic_frames()['BusRoutes'], 'BusRoutes'))
+
+if __name__ == '__main__':
+    main()
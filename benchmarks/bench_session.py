@@ -0,0 +1,44 @@
+"""
+Compares one-off requests.get calls with the pooled session of DataMall over repeated calls to a small endpoint, reporting connections opened and p50/p99 latency.
+
+Run with ``python benchmarks/bench_session.py [calls]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import contextlib
+import io
+import sys
+import time
+
+import requests
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.client import DataMall
+from mock_datamall import MockDataMall
+
+def measure(server, calls, fetch):
+    server.connections = 0
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(calls):
+            start = time.perf_counter()
+            fetch()
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    return server.connections, p50, p99
+
+def main(calls = 1000):
+    # TrainServiceAlerts returns a single object under 'value' rather than a list of records.
+    alerts = {'value': {'Status': 1, 'AffectedSegments': [], 'Message': []}}
+    with MockDataMall({'TrainServiceAlerts': lambda query: alerts}) as server:
+        lta.BASE_URL = server.url
+        headers = {'AccountKey': 'benchmark', 'accept': 'application/json'}
+        results = {
+            'requests.get': measure(server, calls, lambda: requests.get(f'{server.url}/TrainServiceAlerts', headers = headers)),
+            'DataMall session': measure(server, calls, lambda client = DataMall(): client.get_train_service_alerts('benchmark')),
+        }
+    for name, (connections, p50, p99) in results.items():
+        print(f'{name:<18} calls: {calls}  connections: {connections:>4}  p50: {p50:.2f}ms  p99: {p99:.2f}ms')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
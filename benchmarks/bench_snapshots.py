@@ -0,0 +1,28 @@
+"""
+Compares a cold start, fetching BusRoutes from a local mock of DataMall with injected latency, with a warm start loading the memory-mapped snapshot.
+
+Run with ``python benchmarks/bench_snapshots.py [rows] [latency]`` from an environment where the package and pyarrow are installed (e.g. ``poetry run``).
+"""
+import sys
+import tempfile
+import time
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.snapshots import SnapshotStore
+from mock_datamall import MockDataMall, bus_routes
+
+def main(rows = 26000, latency = 0.05):
+    with MockDataMall({'BusRoutes': bus_routes(rows)}, latency = latency) as server, tempfile.TemporaryDirectory() as directory:
+        lta.BASE_URL = server.url
+        store = SnapshotStore(directory)
+        start = time.perf_counter()
+        cold = store.load('bus_routes', 'benchmark', workers = 8)
+        cold_time = time.perf_counter() - start
+        start = time.perf_counter()
+        warm = store.load('bus_routes', 'benchmark')
+        warm_time = time.perf_counter() - start
+    assert warm.equals(cold)
+    print(f'rows: {rows}  cold start (network, 8 workers): {cold_time:.3f}s  warm start (mmap): {warm_time:.3f}s')
+
+if __name__ == '__main__':
+    main(*(f(a) for f, a in zip((int, float), sys.argv[1:])))
@@ -0,0 +1,39 @@
+"""
+Compares batched k-nearest and radius queries on a SpatialIndex with a brute-force haversine scan, over synthetic points spread across Singapore.
+
+Run with ``python benchmarks/bench_spatial.py [points] [queries]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import sys
+import time
+
+import numpy as np
+
+from final_project_n_lavanya.spatial import SpatialIndex, haversine
+
+def main(points = 5000, queries = 10000):
+    rng = np.random.default_rng(0)
+    lat, lon = rng.uniform(1.24, 1.46, points), rng.uniform(103.6, 104.0, points)
+    qlat, qlon = rng.uniform(1.24, 1.46, queries), rng.uniform(103.6, 104.0, queries)
+    start = time.perf_counter()
+    index = SpatialIndex(lat, lon)
+    print(f'points: {points}  queries: {queries}  build: {(time.perf_counter() - start) * 1000:.1f}ms')
+
+    def brute_knn():
+        for i in range(queries):
+            d = haversine(qlat[i], qlon[i], lat, lon)
+            np.sort(np.partition(d, 4)[:5])
+
+    def brute_radius():
+        for i in range(queries):
+            d = haversine(qlat[i], qlon[i], lat, lon)
+            np.flatnonzero(d <= 0.5)
+
+    for name, function in [('5-nearest, brute force', brute_knn), ('5-nearest, index', lambda: index.knn(qlat, qlon, 5)),
+                           ('0.5 km radius, brute force', brute_radius), ('0.5 km radius, index', lambda: index.radius(qlat, qlon, 0.5))]:
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        print(f'{name:<28} {elapsed / queries * 1e6:8.1f}us per query  {queries / elapsed:10.0f} queries/s')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
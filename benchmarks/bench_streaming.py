@@ -0,0 +1,52 @@
+"""
+Compares peak Python memory of writing BusRoutes to a CSV file from get_bus_routes against writing it chunk by chunk from iter_bus_routes, for growing numbers of routes served by a local mock DataMall.
+
+Run with ``python benchmarks/bench_streaming.py [chunksize] [routes ...]`` from the benchmarks directory, in an environment where the package is installed (e.g. ``poetry run``).
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.streaming import iter_bus_routes
+from mock_datamall import MockDataMall, bus_routes
+
+def measure(write):
+    """
+    Returns the latency and the peak traced memory of one call.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        start = time.perf_counter()
+        write()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+def main(chunksize = 5000, *sizes):
+    sizes = sizes or (25000, 100000, 200000)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'routes.csv')
+        for n in sizes:
+            with MockDataMall({'BusRoutes': bus_routes(n)}) as server:
+                lta.BASE_URL = server.url
+                with DataMall():
+                    print(f'{n} routes')
+                    elapsed, peak = measure(lambda: lta.get_bus_routes('benchmark', workers = 4).to_csv(path, index = False))
+                    print(f'  get_bus_routes:  {elapsed * 1000:6.0f}ms  peak {peak / 2 ** 20:6.1f} MiB')
+
+                    def stream():
+                        with open(path, 'w') as f:
+                            for i, chunk in enumerate(iter_bus_routes('benchmark', chunksize = chunksize, workers = 4)):
+                                chunk.to_csv(f, index = False, header = i == 0)
+                    elapsed, peak = measure(stream)
+                    print(f'  iter_bus_routes: {elapsed * 1000:6.0f}ms  peak {peak / 2 ** 20:6.1f} MiB')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""
+Compares answering "is this service running at this stop at this time" with a Timetable against filtering the get_bus_routes frame and comparing "HHMM" strings, over a synthetic frame of the size of Singapore's routes.
+
+Run with ``python benchmarks/bench_timetable.py [rows] [queries]`` from an environment where the package is installed (e.g. ``poetry run``).
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.timetable import DAY_TYPES, Timetable
+
+def synthetic_routes(rows = 26000, seed = 0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'ServiceNo': rng.integers(1, 400, rows).astype(str), 'Direction': rng.integers(1, 3, rows),
+                       'BusStopCode': [f'{x:05d}' for x in rng.integers(0, 5000, rows)]})
+    for day in DAY_TYPES:
+        df[f'{day}_FirstBus'] = [f'{h:02d}{m:02d}' for h, m in zip(rng.integers(5, 7, rows), rng.integers(0, 60, rows))]
+        df[f'{day}_LastBus'] = [f'{h % 24:02d}{m:02d}' for h, m in zip(rng.integers(22, 26, rows), rng.integers(0, 60, rows))]
+    return df
+
+def main(rows = 26000, queries = 100000):
+    rng = np.random.default_rng(1)
+    df = synthetic_routes(rows)
+    start = time.perf_counter()
+    timetable = Timetable.from_routes(df)
+    print(f'rows: {rows}  keys: {len(timetable.keys)}  build: {(time.perf_counter() - start) * 1000:.0f}ms')
+    q = df.sample(queries, replace = True, random_state = 0)
+    when = pd.Timestamp('2020-12-07') + pd.to_timedelta(rng.integers(0, 7 * 1440, queries), 'min')
+    start = time.perf_counter()
+    timetable.running(q.BusStopCode.to_numpy(), q.ServiceNo.to_numpy(), q.Direction.to_numpy(), when)
+    indexed = time.perf_counter() - start
+    sample = 200
+    start = time.perf_counter()
+    for stop, service, direction, t in zip(q.BusStopCode[:sample], q.ServiceNo[:sample], q.Direction[:sample], when[:sample]):
+        day = DAY_TYPES[min(t.weekday() - 4, 2)] if t.weekday() > 4 else 'WD'
+        rows_ = df[(df.BusStopCode == stop) & (df.ServiceNo == service) & (df.Direction == direction)]
+        hhmm = t.strftime('%H%M')
+        ((rows_[f'{day}_FirstBus'] <= hhmm) & (rows_[f'{day}_LastBus'] >= hhmm)).any()
+    scan = (time.perf_counter() - start) / sample * queries
+    print(f'{queries} checks  timetable: {indexed * 1000:.0f}ms  frame scan: {scan:.0f}s (extrapolated from {sample})')
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
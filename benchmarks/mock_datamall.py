@@ -0,0 +1,138 @@
+"""
+A local stand-in for the DataMall API, used by the benchmarks in this directory.
+
+Each endpoint is served from an in-memory list of records, paginated through $skip in the same way as DataMall.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+PAGE_SIZE = 500
+
+class MockDataMall:
+    """
+    Serves synthetic DataMall endpoints on a local port in a background thread.
+    
+    Parameters
+    ----------
+    datasets: dict
+        Mapping of endpoint name (e.g. 'BusRoutes') to the full list of records it should serve, to a function of the query parameters returning the records (or a dict served as the whole payload), or to the bytes of a file served as is.
+    
+    latency: float
+        Seconds of delay injected before every response.
+        By default, this is set to 0.
+    
+    quota: float
+        Requests per second served before further requests are answered with 429 Too Many Requests, as a token bucket holding one second of requests.
+        By default, this is set to None so that requests are never throttled.
+    
+    Examples
+    --------
+    >>> with MockDataMall({'BusStops': records}) as server:
+    ...     final_project_n_lavanya.BASE_URL = server.url
+    
+    """
+    def __init__(self, datasets, latency = 0.0, quota = None):
+        self.datasets = datasets
+        self.latency = latency
+        self.quota = quota
+        self.requests = 0
+        self.throttled = 0
+        self._tokens = quota or 0
+        self._updated = time.monotonic()
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._server.server_port}'
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+            wbufsize = -1
+
+            def setup(self):
+                super().setup()
+                with mock._lock:
+                    mock.connections += 1
+
+            def do_GET(self):
+                with mock._lock:
+                    mock.requests += 1
+                    throttled = mock._take()
+                if throttled:
+                    self.send_response(429)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if mock.latency:
+                    time.sleep(mock.latency)
+                url = urlsplit(self.path)
+                endpoint = url.path.strip('/')
+                query = parse_qs(url.query)
+                if isinstance(mock.datasets.get(endpoint), bytes):
+                    body = mock.datasets[endpoint]
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/zip')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                if endpoint not in mock.datasets:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if callable(mock.datasets[endpoint]):
+                    page = mock.datasets[endpoint]({k: v[0] for k, v in query.items()})
+                else:
+                    skip = int(query.get('$skip', ['0'])[0])
+                    page = mock.datasets[endpoint][skip:skip + PAGE_SIZE]
+                # A dict is served as the whole payload, as for BusArrivals, and a list as the 'value' of a page.
+                payload = page if isinstance(page, dict) else {'value': page}
+                body = json.dumps({'odata.metadata': f'{mock.url}/$metadata#{endpoint}', **payload}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _take(self):
+        # Returns whether a request is over the quota, taking a token otherwise. Called under the lock.
+        if self.quota is None:
+            return False
+        now = time.monotonic()
+        self._tokens = min(self.quota, self._tokens + (now - self._updated) * self.quota)
+        self._updated = now
+        if self._tokens < 1:
+            self.throttled += 1
+            return True
+        self._tokens -= 1
+        return False
+
+    def __enter__(self):
+        threading.Thread(target = self._server.serve_forever, daemon = True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+def bus_routes(n):
+    """
+    Returns n synthetic BusRoutes records.
+    """
+    return [{'ServiceNo': str(i // 50), 'Operator': 'SBST', 'Direction': 1 + (i // 25) % 2, 'StopSequence': i % 50 + 1,
+             'BusStopCode': f'{i % 5000:05d}', 'Distance': round((i % 50) * 0.6, 1),
+             'WD_FirstBus': '0530', 'WD_LastBus': '2330', 'SAT_FirstBus': '0530', 'SAT_LastBus': '2330',
+             'SUN_FirstBus': '0600', 'SUN_LastBus': '2330'} for i in range(n)]
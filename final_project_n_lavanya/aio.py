@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import DataMall
+
+class AsyncDataMall:
+    """
+    An asyncio DataMall client exposing an awaitable version of every get_* function.
+    
+    Requests are sent through one pooled DataMall session on a private thread pool, so awaiting a function never blocks the event loop.
+    A semaphore caps how many calls are in flight at once; further calls wait their turn without being queued on the thread pool.
+    
+    Parameters
+    ----------
+    concurrency: int
+        Integer input; this is the maximum number of calls in flight at once.
+        By default, this is set to 10.
+    
+    pool_size: int
+        Integer input; this is the number of connections kept open per host.
+        By default, this is set to the concurrency.
+    
+    keep_alive: bool
+        Boolean input; whether connections are kept open between requests.
+        By default, this is set to True.
+    
+    gzip: bool
+        Boolean input; whether gzip-compressed responses are requested.
+        By default, this is set to True.
+    
+    **kwargs
+        Any other keyword arguments of DataMall, such as cache, changes, typed, decoder and limiter, passed on to the underlying client.
+        A limiter is shared by every call; without one, requests are only capped by the concurrency.
+    
+    Examples
+    --------
+    >>> async with AsyncDataMall(concurrency = 50) as client:
+    ...     frames = await asyncio.gather(*(client.get_bus_arrivals([YOUR_API_KEY], code) for code in stop_codes))
+    >>> async with AsyncDataMall(concurrency = 50, cache = ResponseCache(), limiter = RateLimiter(rate = 20)) as client:
+    ...     stops = await client.get_bus_stops([YOUR_API_KEY])
+    
+    """
+    def __init__(self, concurrency = 10, pool_size = None, keep_alive = True, gzip = True, **kwargs):
+        assert isinstance(concurrency, int) and concurrency >= 1, "Please ensure that the concurrency is entered as a positive integer."
+        self.concurrency = concurrency
+        self.client = DataMall(pool_size or concurrency, keep_alive, gzip, **kwargs)
+        self._executor = ThreadPoolExecutor(concurrency)
+        self._semaphore = None
+
+    async def call(self, function, *args, **kwargs):
+        """
+        Runs a get_* function through the pooled session without blocking the event loop, and returns its result.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._run, function, args, kwargs)
+
+    def _run(self, function, args, kwargs):
+        with self.client:
+            return function(*args, **kwargs)
+
+    async def close(self):
+        """
+        Waits for the thread pool to finish and closes every pooled connection.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def __getattr__(self, name):
+        from . import final_project_n_lavanya
+        if not name.startswith('get_') or not hasattr(final_project_n_lavanya, name):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        function = getattr(final_project_n_lavanya, name)
+
+        async def method(*args, **kwargs):
+            return await self.call(function, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = function.__doc__
+        return method
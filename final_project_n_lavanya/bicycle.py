@@ -0,0 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from . import final_project_n_lavanya
+from .client import current_client
+from .spatial import EARTH_RADIUS_KM, SpatialIndex
+
+# Bounds of the area swept for bicycle parking: (south, west, north, east) in degrees, covering mainland Singapore and its nearby islands.
+ISLAND_BOUNDS = (1.15, 103.59, 1.48, 104.1)
+
+def _get_tile(client, headers, lat, long, dist):
+    """
+    Returns every location of a tile, walking the $skip offsets of its query until a page comes back short, as a response holds at most PAGE_SIZE records.
+    """
+    records, skip = [], 0
+    while True:
+        r = client.get(f'{final_project_n_lavanya.BASE_URL}/BicycleParkingv2?Lat={lat:.6f}&Long={long:.6f}&Dist={dist}&$skip={skip}', headers = headers)
+        assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
+        page = r.json()['value']
+        records.extend(page)
+        if len(page) < final_project_n_lavanya.PAGE_SIZE:
+            return records
+        skip += final_project_n_lavanya.PAGE_SIZE
+
+class BicycleParking:
+    """
+    Every bicycle parking location in Singapore, fetched once by sweeping the island in tiles and served locally from a spatial index.
+    
+    query answers the same question as get_bicyle_parking, the bicycle parking locations within a radius of a point, without a request per point.
+    
+    Parameters
+    ----------
+    df: Pandas DataFrame
+        The bicycle parking locations, with Latitude and Longitude columns.
+    
+    fetched_at: datetime-like
+        The time the locations were fetched.
+        By default, this is set to the current time in Singapore.
+    
+    Examples
+    --------
+    >>> parking = BicycleParking.prefetch([YOUR_API_KEY])
+    >>> parking.query('1.36666', '103.76666')
+    >>> parking.query_many(lats, longs, 0.2)
+    
+    """
+    def __init__(self, df, fetched_at = None):
+        self.df = df.reset_index(drop = True)
+        self.fetched_at = pd.Timestamp(fetched_at) if fetched_at is not None else final_project_n_lavanya._accessed()
+        self.index = SpatialIndex.from_frame(self.df)
+
+    @classmethod
+    def prefetch(cls, api_key, dist = 2.0, workers = 8, bounds = ISLAND_BOUNDS):
+        """
+        Returns a BicycleParking holding every location within the bounds, found by querying BicycleParkingv2 around the centres of a grid of square tiles.
+        
+        Parameters
+        ----------
+        api_key: str
+            Character input.
+            Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+        
+        dist: float
+            Numeric input; this is the radius of each tile query in kilometres. Tiles are spaced so that their circles cover the whole area.
+            By default, this is set to 2.0.
+        
+        workers: int
+            Integer input; this is the number of tile requests in flight at once.
+            By default, this is set to 8.
+        
+        bounds: tuple
+            The (south, west, north, east) bounds of the area swept, in degrees.
+            By default, this is set to ISLAND_BOUNDS.
+        
+        """
+        assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+        south, west, north, east = bounds
+        # A circle covers the square tile it is centred on when the side of the tile is at most the radius times the square root of 2.
+        step = np.degrees(dist * np.sqrt(2) / EARTH_RADIUS_KM)
+        lats = np.arange(south + step / 2, north + step / 2, step)
+        longs = np.arange(west + step / 2, east + step / 2, step / np.cos(np.radians((south + north) / 2)))
+        client = current_client()
+        headers = {'AccountKey': api_key, 'accept': 'application/json'}
+        with ThreadPoolExecutor(workers) as pool:
+            tiles = pool.map(lambda point: _get_tile(client, headers, point[0], point[1], dist), [(lat, long) for lat in lats for long in longs])
+            records = [record for tile in tiles for record in tile]
+        df = final_project_n_lavanya._typed(pd.DataFrame(records), 'BicycleParkingv2')
+        if len(df):
+            # Neighbouring tiles overlap, so locations near their edges are returned more than once.
+            df = df.drop_duplicates(subset = [c for c in ['Description', 'Latitude', 'Longitude', 'RackType'] if c in df.columns])
+        print(f'{len(lats) * len(longs)} tiles swept; {len(df)} bicycle parking locations found.')
+        return cls(df)
+
+    def query_many(self, lat, long, dist = 0.5):
+        """
+        Returns the row positions of the locations within dist kilometres of each of many points, nearest first, as a list of NumPy arrays.
+        """
+        return self.index.radius(np.asarray(lat, dtype = float), np.asarray(long, dtype = float), float(dist))[1]
+
+    def query(self, lat, long, dist = '0.5'):
+        """
+        Returns a Pandas DataFrame containing bicycle parking locations within a radius, in the same form as get_bicyle_parking.
+        
+        Parameters
+        ----------
+        lat: str
+            Character input; this is the latitude of the point of search.
+        
+        long: str
+            Character input, this is the longitude of the point of search.
+        
+        dist: str
+            Character input, this is the radius of search in kilometres.
+            By default, this is set to 0.5.
+        
+        Returns
+        -------
+        Pandas DataFrame
+            The output is a dataframe containing bicycle parking locations within a radius, nearest first, with the time they were fetched as the time accessed.
+        
+        """
+        positions = self.query_many([float(lat)], [float(long)], float(dist))[0]
+        r_json_df = self.df.iloc[positions].reset_index(drop = True)
+        r_json_df['Date and Time Accessed'] = pd.Series(self.fetched_at, index = r_json_df.index)
+        r_json_df.attrs['accessed'] = self.fetched_at
+        return r_json_df
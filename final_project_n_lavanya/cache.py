@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+# Seconds for which a response of each endpoint is reused. Static datasets are kept for a day, real-time feeds for roughly their update interval,
+# and endpoints returning short-lived download links for less than the lifetime of the link. Endpoints not listed here are never cached.
+DEFAULT_TTLS = {
+    'BusArrivals': 15,
+    'BusServices': 86400,
+    'BusRoutes': 86400,
+    'BusStops': 86400,
+    'TaxiStands': 86400,
+    'ERPRates': 86400,
+    'BicycleParkingv2': 86400,
+    'RoadOpenings': 3600,
+    'RoadWorks': 3600,
+    'Taxi-Availability': 60,
+    'CarParkAvailabilityv2': 60,
+    'TrainServiceAlerts': 60,
+    'Traffic_Imagesv2': 60,
+    'TrafficIncidents': 120,
+    'FaultyTrafficLights': 120,
+    'VMS': 120,
+    'EstTravelTimes': 300,
+    'TrafficSpeedBandsv2': 300,
+    'PV/Bus': 240,
+    'PV/ODBus': 240,
+    'PV/Train': 240,
+    'PV/ODTrain': 240,
+    'GeospatialWholeIsland': 240,
+    'FacilitiesMaintenance': 240,
+}
+
+def endpoint_of(url):
+    """
+    Returns the DataMall endpoint name of a request URL, e.g. 'BusRoutes' or 'PV/ODBus'.
+    """
+    path = urlsplit(url).path
+    return path.split('/ltaodataservice/', 1)[1] if '/ltaodataservice/' in path else path.strip('/')
+
+class ResponseCache:
+    """
+    An in-memory cache of successful responses keyed by request URL (endpoint and parameters) and account key, with a time to live per endpoint and least-recently-used eviction under a memory budget.
+    
+    Pass it to a DataMall client to put it in front of every get_* function sent through that client.
+    
+    Parameters
+    ----------
+    ttls: dict
+        Mapping of endpoint name to the number of seconds its responses are reused; these update the defaults in DEFAULT_TTLS.
+        An endpoint with a time to live of 0 is never cached.
+        By default, this is set to None so that DEFAULT_TTLS is used as is.
+    
+    max_bytes: int
+        Integer input; this is the memory budget for cached response bodies in bytes.
+        By default, this is set to 64 MiB.
+    
+    Examples
+    --------
+    >>> cache = ResponseCache(ttls = {'BusArrivals': 0}, max_bytes = 256 * 2 ** 20)
+    >>> client = DataMall(cache = cache)
+    >>> client.get_bus_routes([YOUR_API_KEY])
+    >>> cache.stats()
+    
+    """
+    def __init__(self, ttls = None, max_bytes = 64 * 2 ** 20):
+        assert isinstance(max_bytes, int) and max_bytes >= 0, "Please ensure that the memory budget is entered as a non-negative integer."
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # The lock cannot be pickled; a copy sent to another process gets its own.
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def ttl(self, url):
+        """
+        Returns the number of seconds a response to the given URL is reused.
+        """
+        return self.ttls.get(endpoint_of(url), 0)
+
+    def get(self, url, account_key = None):
+        """
+        Returns the cached response to the given URL sent with the given account key, or None if there is none or it has expired.
+        Lookups of endpoints that are never cached are not counted as misses.
+        """
+        if self.ttl(url) <= 0:
+            return None
+        # Responses are kept per account key, so that a cache shared between clients or keys never serves one key's response to another.
+        key = (account_key, url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, url, response, account_key = None):
+        """
+        Caches a successful response to the given URL sent with the given account key, evicting the least recently used responses beyond the memory budget.
+        """
+        ttl = self.ttl(url)
+        size = len(response.content)
+        if response.status_code != 200 or ttl <= 0 or size > self.max_bytes:
+            return
+        key = (account_key, url)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, response)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        self.size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        """
+        Removes every cached response.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """
+        Returns a dictionary of the hit, miss and eviction counters, the number of cached responses and their size in bytes.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': len(self._entries), 'bytes': self.size}
@@ -0,0 +1,92 @@
+import hashlib
+import threading
+
+class _NoChange:
+    def __repr__(self):
+        return 'NO_CHANGE'
+
+    def __bool__(self):
+        return False
+
+# Returned by polled get_* functions in place of a dataframe when the content has not changed since the previous call and the ChangeDetector is set to return it.
+NO_CHANGE = _NoChange()
+
+def _copy(output):
+    # Arrow tables are immutable and have no copy method, so they are shared.
+    return output.copy() if hasattr(output, 'copy') else output
+
+class ChangeDetector:
+    """
+    Detects when a polled endpoint returns the same content as on the previous request, so that the previously built dataframe is reused instead of parsing the response again.
+    
+    Requests carry the ETag and Last-Modified validators of the previous response when the API provided them, and a 304 response counts as unchanged.
+    Otherwise the body is compared with the previous one through a BLAKE2 digest.
+    Pass it to a DataMall client to use it for get_train_service_alerts, get_faulty_traffic_lights, get_road_openings, get_road_works and get_variable_messages.
+    
+    Parameters
+    ----------
+    sentinel: bool
+        Boolean input; whether to return NO_CHANGE instead of a copy of the previous dataframe when the content has not changed.
+        By default, this is set to False.
+    
+    Examples
+    --------
+    >>> changes = ChangeDetector()
+    >>> client = DataMall(changes = changes)
+    >>> client.get_road_works([YOUR_API_KEY])
+    >>> changes.stats()
+    
+    """
+    def __init__(self, sentinel = False):
+        self.sentinel = sentinel
+        self.changed = 0
+        self.unchanged = 0
+        self.parse_seconds_saved = 0.0
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def conditional_headers(self, url):
+        """
+        Returns the If-None-Match and If-Modified-Since headers for a request to the given URL, built from the validators of the previous response.
+        """
+        state = self._state.get(url)
+        headers = {}
+        if state is not None:
+            if state['etag']:
+                headers['If-None-Match'] = state['etag']
+            if state['last_modified']:
+                headers['If-Modified-Since'] = state['last_modified']
+        return headers
+
+    def previous(self, url, r):
+        """
+        Returns the dataframe built from the previous response to the given URL (or NO_CHANGE) if the response shows that the content has not changed, or None otherwise.
+        """
+        with self._lock:
+            state = self._state.get(url)
+            if state is None or (r.status_code != 304 and hashlib.blake2b(r.content, digest_size = 16).digest() != state['digest']):
+                return None
+            self.unchanged += 1
+            self.parse_seconds_saved += state['parse_seconds']
+        return NO_CHANGE if self.sentinel else _copy(state['df'])
+
+    def store(self, url, r, df, parse_seconds):
+        """
+        Records the validators and digest of a changed response to the given URL, with the dataframe built from it and the seconds it took to build.
+        """
+        with self._lock:
+            self.changed += 1
+            self._state[url] = {
+                'etag': r.headers.get('ETag'),
+                'last_modified': r.headers.get('Last-Modified'),
+                'digest': hashlib.blake2b(r.content, digest_size = 16).digest(),
+                'df': _copy(df),
+                'parse_seconds': parse_seconds,
+            }
+
+    def stats(self):
+        """
+        Returns a dictionary of the number of changed and unchanged responses and the seconds of parsing saved on unchanged ones.
+        """
+        with self._lock:
+            return {'changed': self.changed, 'unchanged': self.unchanged, 'parse_seconds_saved': self.parse_seconds_saved}
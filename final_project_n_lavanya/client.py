@@ -0,0 +1,154 @@
+import contextvars
+import threading
+
+from .decode import _msgspec, msgspec
+from .lazy import LazyModule
+
+requests = LazyModule('requests')
+
+_current = contextvars.ContextVar('final_project_n_lavanya_client', default = None)
+_default = None
+
+def current_client():
+    """
+    Returns the client that the get_* functions currently send their requests through.
+    
+    This is the innermost client activated with a ``with`` block, or otherwise a shared default client created on first use.
+    
+    Returns
+    -------
+    DataMall
+        The active client.
+    
+    """
+    global _default
+    client = _current.get()
+    if client is None:
+        if _default is None:
+            _default = DataMall()
+        client = _default
+    return client
+
+class DataMall:
+    """
+    A DataMall client owning a pooled HTTP session that is reused across requests.
+    
+    Every get_* function sends its requests through the active client, so connections are kept alive and reused between calls instead of being opened for each request.
+    A client is activated for the duration of a ``with`` block, and each get_* function is also available as a method of the client.
+    
+    Parameters
+    ----------
+    pool_size: int
+        Integer input; this is the number of connections kept open per host.
+        By default, this is set to 10.
+    
+    keep_alive: bool
+        Boolean input; whether connections are kept open between requests.
+        By default, this is set to True.
+    
+    gzip: bool
+        Boolean input; whether gzip-compressed responses are requested.
+        By default, this is set to True.
+    
+    cache: ResponseCache
+        A response cache put in front of every request sent through the client.
+        By default, this is set to None so that every request reaches the API.
+    
+    changes: ChangeDetector
+        A change detector used by the polled get_* functions to skip parsing responses whose content has not changed.
+        By default, this is set to None so that every response is parsed.
+    
+    typed: bool
+        Boolean input; whether the get_* functions cast their dataframes to the compact dtypes of their endpoint's schema (see schemas.SCHEMAS).
+        By default, this is set to True; set it to False for the columns as parsed from JSON.
+    
+    decoder: str
+        Character input; this is how JSON responses are decoded into dataframes: 'msgspec' decodes them straight into columns without building a dict per record, and 'json' uses the standard library; both give the same values.
+        By default, this is set to 'auto' so that msgspec is used when it is installed.
+    
+    limiter: RateLimiter
+        A rate limiter shared by every request sent through the client, from any thread, which adapts its rate to throttling and retries throttled and failed requests.
+        By default, this is set to None so that requests are sent as soon as they are made and never retried.
+    
+    Examples
+    --------
+    >>> client = DataMall(pool_size = 20)
+    >>> client.get_bus_stops([YOUR_API_KEY])
+    >>> with DataMall(pool_size = 20):
+    ...     get_bus_routes([YOUR_API_KEY], workers = 16)
+    >>> DataMall(cache = ResponseCache()).get_bus_stops([YOUR_API_KEY])
+    >>> DataMall(limiter = RateLimiter(rate = 20)).get_bus_routes([YOUR_API_KEY], workers = 8)
+    
+    """
+    def __init__(self, pool_size = 10, keep_alive = True, gzip = True, cache = None, changes = None, typed = True, decoder = 'auto', limiter = None):
+        assert isinstance(pool_size, int) and pool_size >= 1, "Please ensure that the pool size is entered as a positive integer."
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.gzip = gzip
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections = pool_size, pool_maxsize = pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate' if gzip else 'identity'
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+        self.cache = cache
+        self.changes = changes
+        self.typed = typed
+        self.limiter = limiter
+        assert decoder in ('auto', 'msgspec', 'json'), "Please ensure that the decoder is one of 'auto', 'msgspec' or 'json'."
+        if decoder == 'msgspec':
+            _msgspec()
+        self.decoder = decoder if decoder != 'auto' else ('json' if msgspec is None else 'msgspec')
+        self._local = threading.local()
+
+    def get(self, url, headers = None, stream = False):
+        """
+        Sends a GET request through the pooled session and returns the response, or returns the cached response to the same URL and AccountKey header if it is still fresh.
+        Streamed responses, whose body is read as it arrives, are never cached. Requests that miss the cache go through the client's rate limiter, if any.
+        """
+        if stream:
+            return self._send(url, headers, stream = True)
+        account_key = (headers or {}).get('AccountKey')
+        if self.cache is not None:
+            r = self.cache.get(url, account_key)
+            if r is not None:
+                return r
+        r = self._send(url, headers)
+        if self.cache is not None:
+            self.cache.put(url, r, account_key)
+        return r
+
+    def _send(self, url, headers, stream = False):
+        request = lambda: self.session.get(url, headers = headers, stream = stream)
+        return request() if self.limiter is None else self.limiter.send(request)
+
+    def close(self):
+        """
+        Closes every pooled connection.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        # Tokens are kept per thread, as the same client may be active in several threads at once.
+        if not hasattr(self._local, 'tokens'):
+            self._local.tokens = []
+        self._local.tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._local.tokens.pop())
+
+    def __getattr__(self, name):
+        from . import final_project_n_lavanya
+        if not name.startswith('get_') or not hasattr(final_project_n_lavanya, name):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        function = getattr(final_project_n_lavanya, name)
+
+        def method(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = function.__doc__
+        return method
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+# The DayType of each weekday, Monday first, in get_erp_rates; ERP does not operate on Sundays.
+WEEKDAY_DAY_TYPES = ['Weekdays'] * 5 + ['Saturday', None]
+
+def _minutes(hhmm):
+    """
+    Returns "HH:MM" strings as minutes after midnight.
+    """
+    parts = pd.Series(hhmm, dtype = str).str.split(':', n = 1, expand = True).astype(int)
+    return (parts[0] * 60 + parts[1]).to_numpy(dtype = np.int64)
+
+class ERPIndex:
+    """
+    ERP rates as sorted arrays, to look up the charge of many gantry crossings in one vectorised call.
+    
+    Rates are grouped by zone, vehicle type and day type. Each group can hold several schedules, each of which takes effect on its EffectiveDate and replaces the one before.
+    A lookup finds the schedule in force with one searchsorted call and the time interval within it with another.
+    
+    Examples
+    --------
+    >>> index = ERPIndex.from_rates(get_erp_rates([YOUR_API_KEY]))
+    >>> index.charge('AY1', 'Passenger Cars/Light Goods Vehicles/Taxis', '2020-12-07 08:15')
+    >>> index.charge(trips.ZoneID, trips.VehicleType, trips.Crossed)
+    
+    """
+    def __init__(self, zones, vehicle_types, day_types, schedule_keys, interval_keys, interval_ends, charges):
+        self.zones = pd.Index(zones)
+        self.vehicle_types = pd.Index(vehicle_types)
+        self.day_types = pd.Index(day_types)
+        # Group (z, v, d) is numbered (z * len(vehicle_types) + v) * len(day_types) + d.
+        # Schedule s of group g in force from day t since the epoch has schedule_keys[s] = g << 32 | t, sorted.
+        self.schedule_keys = schedule_keys
+        # Interval i of schedule s starting at minute m has interval_keys[i] = s * 1440 + m, sorted, and runs until interval_ends[i].
+        self.interval_keys = interval_keys
+        self.interval_ends = interval_ends
+        self.charges = charges
+
+    @classmethod
+    def from_rates(cls, df):
+        """
+        Returns an ERPIndex built from a dataframe with the ZoneID, VehicleType, DayType, StartTime, EndTime, ChargeAmount and EffectiveDate columns of get_erp_rates.
+        An EndTime that is not after the StartTime, such as "00:00", is taken as the end of the day.
+        """
+        zone, zones = pd.factorize(df.ZoneID.astype(str), sort = True)
+        vehicle, vehicle_types = pd.factorize(df.VehicleType.astype(str), sort = True)
+        day, day_types = pd.factorize(df.DayType.astype(str), sort = True)
+        group = (zone.astype(np.int64) * len(vehicle_types) + vehicle) * len(day_types) + day
+        effective = pd.to_datetime(df.EffectiveDate).to_numpy().astype('datetime64[D]').astype(np.int64)
+        schedule, schedule_keys = pd.factorize(group << 32 | effective, sort = True)
+        start = _minutes(df.StartTime)
+        end = _minutes(df.EndTime)
+        end = np.where(end <= start, 1440, end)
+        interval_keys = schedule.astype(np.int64) * 1440 + start
+        order = np.argsort(interval_keys, kind = 'stable')
+        charges = pd.to_numeric(df.ChargeAmount).to_numpy(dtype = np.float64)
+        return cls(zones, vehicle_types, day_types, np.asarray(schedule_keys), interval_keys[order], end[order], charges[order])
+
+    def charge(self, zone, vehicle_type, when, day_type = None):
+        """
+        Returns an array of the ERP charge in dollars for each crossing of a zone by a vehicle type at a date and time, broadcasting over all arguments.
+        The charge is 0 where no rate applies, including unknown zones and vehicle types.
+        
+        Times with a time zone are converted to Singapore time; times without one are taken to be Singapore time already.
+        By default, the day type is that of the date in WEEKDAY_DAY_TYPES, so that crossings on Sundays are free; pass day_type, such as for public holidays, to override it.
+        """
+        when = pd.DatetimeIndex(np.atleast_1d(pd.to_datetime(when)))
+        if when.tz is not None:
+            when = when.tz_convert('Asia/Singapore').tz_localize(None)
+        when = when.to_numpy().astype('datetime64[m]')
+        days = when.astype('datetime64[D]')
+        minute = (when - days).astype(np.int64)
+        days = days.astype(np.int64)
+        z = self.zones.get_indexer(np.atleast_1d(np.asarray(zone, dtype = object)))
+        v = self.vehicle_types.get_indexer(np.atleast_1d(np.asarray(vehicle_type, dtype = object)))
+        if day_type is None:
+            # 1970-01-01 was a Thursday.
+            d = self.day_types.get_indexer(WEEKDAY_DAY_TYPES)[(days + 3) % 7]
+        else:
+            d = self.day_types.get_indexer(np.atleast_1d(np.asarray(day_type, dtype = object)))
+        z, v, d, days, minute = np.broadcast_arrays(z, v, d, days, minute)
+        known = (z >= 0) & (v >= 0) & (d >= 0)
+        group = (z.astype(np.int64) * len(self.vehicle_types) + v) * len(self.day_types) + d
+        key = group << 32 | days
+        s = np.searchsorted(self.schedule_keys, key, side = 'right') - 1
+        known &= (s >= 0) & (self.schedule_keys[s] >> 32 == group)
+        i = np.searchsorted(self.interval_keys, s * 1440 + minute, side = 'right') - 1
+        known &= (i >= 0) & (self.interval_keys[i] // 1440 == s) & (minute < self.interval_ends[i])
+        return np.where(known, self.charges[i], 0.0)
@@ -1,10 +1,471 @@
-import requests
-import json
+import contextlib
 import os
-import pandas as pd
 import datetime
+import email.utils
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-def get_bus_arrivals(api_key, bus_stop_code, service_no = ''):
+from .changes import NO_CHANGE
+from .client import current_client
+from .decode import decode_columns
+from .formats import OUTPUTS, from_frame, to_arrow, to_records, to_structured
+from .lazy import LazyModule
+from .ratelimit import RateLimiter
+from .schemas import apply_schema
+
+# pandas and NumPy are imported on first use, so that importing this module, or fetching records with output = 'records', does not load them.
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+
+BASE_URL = 'http://datamall2.mytransport.sg/ltaodataservice'
+
+# DataMall returns at most this many records per response; the rest are reached through the $skip parameter.
+PAGE_SIZE = 500
+
+# The time zone of the time accessed stamped on real-time data.
+TIMEZONE = 'Asia/Singapore'
+
+def _decode(client, r, endpoint):
+    """
+    Returns the records under 'value' of a response of an endpoint and their number.
+    The records are a dict of column lists when the client decodes with msgspec, and a list of dicts otherwise; either can be passed to pd.DataFrame.
+    """
+    if client.decoder == 'msgspec':
+        columns = decode_columns(r.content, endpoint)
+        if columns is not None:
+            return columns, len(next(iter(columns.values()), []))
+    records = r.json()['value']
+    return records, len(records)
+
+def _extend(records, page, rows, n):
+    """
+    Returns the records of the pages so far, holding rows records, extended with a page of n records in the form returned by _decode.
+    """
+    if records is None:
+        return page
+    if isinstance(page, list):
+        records.extend(page)
+        return records
+    # Columns first seen on this page are missing from the pages before, and columns missing from this page are missing from it.
+    for name, values in page.items():
+        if name not in records:
+            records[name] = [None] * rows
+        records[name].extend(values)
+    for name in records.keys() - page.keys():
+        records[name].extend([None] * n)
+    return records
+
+def _get_page(client, headers, endpoint, skip):
+    """
+    Returns the response, the records and the number of records of the page of a paginated endpoint starting at the given offset.
+    """
+    r = client.get(f'{BASE_URL}/{endpoint}?$skip={skip}', headers = headers)
+    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
+    return (r, *_decode(client, r, endpoint))
+
+def _iter_pages(client, headers, endpoint, workers = 1):
+    """
+    Yields the response, the records and the number of records of each page of a paginated endpoint, in order, walking the $skip offsets until a page comes back short.
+    With several workers, the pages ahead of the one being yielded are requested while it is processed, and those past the first short page are discarded.
+    """
+    if workers == 1:
+        skip = 0
+        while True:
+            r, page, n = _get_page(client, headers, endpoint, skip)
+            yield r, page, n
+            if n < PAGE_SIZE:
+                return
+            skip += PAGE_SIZE
+    with ThreadPoolExecutor(workers) as pool:
+        pending = deque(pool.submit(_get_page, client, headers, endpoint, i * PAGE_SIZE) for i in range(workers))
+        skip = workers * PAGE_SIZE
+        try:
+            while True:
+                r, page, n = pending.popleft().result()
+                if n < PAGE_SIZE:
+                    yield r, page, n
+                    return
+                pending.append(pool.submit(_get_page, client, headers, endpoint, skip))
+                skip += PAGE_SIZE
+                yield r, page, n
+        finally:
+            for future in pending:
+                future.cancel()
+
+def _get_pages(api_key, endpoint, workers = 1):
+    """
+    Returns the last response and the list of records of a paginated endpoint, walking the $skip offsets until a page comes back short.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    endpoint: str
+        Character input; this is the name of the DataMall endpoint, e.g. 'BusRoutes'.
+    
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        Pages ahead of the one being read are requested speculatively, and those past the first short page are discarded.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    Returns
+    -------
+    tuple
+        The last response received and the records of every page, in order, as a list of dicts or, when the active client decodes with msgspec, a dict of column lists.
+    
+    """
+    client = current_client()
+    headers = {'AccountKey': api_key, 'accept': 'application/json'}
+    records, rows = None, 0
+    for r, page, n in _iter_pages(client, headers, endpoint, workers):
+        records = _extend(records, page, rows, n)
+        rows += n
+    return r, records
+
+def _convert(client, r, records, endpoint, output):
+    """
+    Returns the records of a response of an endpoint in one of the forms of formats.OUTPUTS other than 'pandas', without building a dataframe.
+    """
+    if endpoint == 'TrainServiceAlerts':
+        # The value of TrainServiceAlerts is a single alert object rather than a list of records.
+        records = [records]
+    if endpoint in LOCATION_ENDPOINTS:
+        records = _split_location_records(records)
+    if output == 'records':
+        return to_records(records)
+    if output == 'numpy':
+        return to_structured(records, endpoint, client.typed)
+    return to_arrow(records, endpoint, client.typed, _accessed(r))
+
+def _batch(client, r, records, endpoint, output):
+    """
+    Returns the records of a response of a paginated endpoint in one of the forms of formats.OUTPUTS, typed and stamped as the get_ functions return them.
+    """
+    if output != 'pandas':
+        return _convert(client, r, records, endpoint, output)
+    batch = pd.DataFrame(records)
+    batch = _split_location(batch) if endpoint in LOCATION_ENDPOINTS else batch
+    batch = apply_schema(batch, endpoint) if client.typed else batch
+    return _stamp(batch, r)
+
+def stream_batches(api_key, endpoint, output = 'arrow', workers = 1):
+    """
+    Yields the records of a paginated endpoint one page at a time, as soon as each page arrives, instead of returning them all at the end.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    endpoint: str
+        Character input; this is the name of the paginated DataMall endpoint, e.g. 'BusRoutes' or 'TrafficSpeedBandsv2'.
+    
+    output: str
+        Character input; this is the form of each batch: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'arrow'.
+    
+    workers: int
+        Integer input; this is the number of pages requested in parallel, ahead of the batch being processed.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    Returns
+    -------
+    generator
+        The output is a generator of batches of up to 500 records each, in order.
+    
+    Examples
+    --------
+    >>> for batch in stream_batches([YOUR_API_KEY], 'TrafficSpeedBandsv2', workers = 4):
+    ...     producer.send(batch)
+    
+    """
+    assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    client = current_client()
+    headers = {'AccountKey': api_key, 'accept': 'application/json'}
+    for r, page, n in _iter_pages(client, headers, endpoint, workers):
+        yield _batch(client, r, page, endpoint, output)
+
+def _get_polled(api_key, endpoint, output = 'pandas'):
+    """
+    Returns the response of a polled endpoint and the dataframe (or other output) built from it, reusing the previous one when the active client has a ChangeDetector and the content has not changed.
+    """
+    client = current_client()
+    url = f'{BASE_URL}/{endpoint}'
+    headers = {'AccountKey': api_key, 'accept': 'application/json'}
+    changes = client.changes
+    # Each form of output is tracked separately, so that an unchanged response returns what was built for the same output.
+    key = url if output == 'pandas' else f'{url}#{output}'
+    if changes is not None:
+        headers.update(changes.conditional_headers(key))
+    r = client.get(url, headers = headers)
+    assert r.status_code in (200, 304), "Request is unsuccessful. Please ensure that the API key is valid."
+    build = lambda records: pd.DataFrame(records) if output == 'pandas' else _convert(client, r, records, endpoint, output)
+    if changes is None:
+        return r, build(_decode(client, r, endpoint)[0])
+    previous = changes.previous(key, r)
+    if previous is not None:
+        return r, previous
+    start = time.perf_counter()
+    r_json_df = build(_decode(client, r, endpoint)[0])
+    changes.store(key, r, r_json_df, time.perf_counter() - start)
+    return r, r_json_df
+
+def _typed(df, endpoint):
+    """
+    Returns the dataframe of an endpoint cast to the compact dtypes of its schema, unless the active client was created with typed = False.
+    """
+    return apply_schema(df, endpoint) if current_client().typed else df
+
+def _accessed(r = None):
+    """
+    Returns the time a response was served as a timezone-aware Pandas Timestamp in Singapore time, from its Date header where available and otherwise from the local clock.
+    """
+    date = r.headers.get('Date') if r is not None else None
+    if date:
+        try:
+            accessed = pd.Timestamp(email.utils.parsedate_to_datetime(date))
+            return (accessed.tz_localize('UTC') if accessed.tzinfo is None else accessed).tz_convert(TIMEZONE)
+        except (TypeError, ValueError):
+            pass
+    return pd.Timestamp.now(tz = TIMEZONE)
+
+def _stamp(df, r = None):
+    """
+    Stamps a dataframe with the time its response was served, as the datetime64 'Date and Time Accessed' column and as df.attrs['accessed'].
+    A single Timestamp broadcast over the column takes 8 bytes per row, and frames concatenated across polls can be indexed by it.
+    """
+    accessed = _accessed(r)
+    df['Date and Time Accessed'] = pd.Series(accessed, index = df.index, dtype = f'datetime64[ns, {TIMEZONE}]')
+    df.attrs['accessed'] = accessed
+    return df
+
+# Endpoints whose Location field holds coordinates, split into Latitude and Longitude columns of their dataframes.
+LOCATION_ENDPOINTS = ['CarParkAvailabilityv2', 'TrafficSpeedBandsv2']
+
+def _split_location(df):
+    """
+    Adds the Latitude and Longitude columns of a dataframe with a Location column holding "latitude longitude ...".
+    """
+    if 'Location' in df.columns:
+        # Reindexing, rather than selecting, keeps both columns when no Location of the frame has two coordinates.
+        df[['Latitude', 'Longitude']] = df.Location.str.split(expand = True).reindex(columns = [0, 1]) if len(df) else None
+    return df
+
+def _split_location_records(records):
+    """
+    Adds Latitude and Longitude to records, as a list of dicts or a dict of column lists, with a Location field, as _split_location does for dataframes.
+    The coordinates are kept as the strings of Location, to be cast by the schema of the endpoint like the other fields.
+    """
+    if isinstance(records, dict):
+        if 'Location' in records:
+            parts = [value.split() if isinstance(value, str) else [] for value in records['Location']]
+            records['Latitude'] = [p[0] if len(p) > 0 else None for p in parts]
+            records['Longitude'] = [p[1] if len(p) > 1 else None for p in parts]
+        return records
+    if any('Location' in record for record in records):
+        for record in records:
+            value = record.get('Location')
+            parts = value.split() if isinstance(value, str) else []
+            record['Latitude'] = parts[0] if len(parts) > 0 else None
+            record['Longitude'] = parts[1] if len(parts) > 1 else None
+    return records
+
+def _last_month():
+    """
+    Returns the previous calendar month as a YYYYMM string, as of the time of the call.
+    """
+    return (datetime.date.today().replace(day = 1) - datetime.timedelta(days = 1)).strftime("%Y%m")
+
+# Compact dtypes of the columns of the passenger volume CSV files.
+PASS_VOLUME_DTYPES = {
+    'YEAR_MONTH': 'category',
+    'DAY_TYPE': 'category',
+    'TIME_PER_HOUR': 'int8',
+    'PT_TYPE': 'category',
+    'PT_CODE': 'category',
+    'ORIGIN_PT_CODE': 'category',
+    'DESTINATION_PT_CODE': 'category',
+    'TOTAL_TAP_IN_VOLUME': 'int32',
+    'TOTAL_TAP_OUT_VOLUME': 'int32',
+    'TOTAL_TRIPS': 'int32',
+}
+
+def _concat_chunks(chunks):
+    """
+    Concatenates dataframes with the same columns one column at a time, releasing each column of the chunks once it is copied, and merging the categories of categorical columns.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    columns = {}
+    for name in list(chunks[0].columns):
+        parts = [chunk.pop(name) for chunk in chunks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[name] = pd.api.types.union_categoricals(parts)
+        else:
+            columns[name] = np.concatenate([part.to_numpy() for part in parts])
+        del parts
+    return pd.DataFrame(columns, copy = False)
+
+def read_pass_vol_csv(file, chunksize = 250000):
+    """
+    Returns a Pandas DataFrame of a passenger volume CSV file, parsed in chunks with the compact dtypes of PASS_VOLUME_DTYPES.
+    
+    Parameters
+    ----------
+    file: str or file-like object
+        The path or open binary file of the CSV file.
+    
+    chunksize: int
+        Integer input; this is the number of rows parsed at a time.
+        By default, this is set to 250000.
+    
+    Returns
+    -------
+    Pandas DataFrame
+        The output is a dataframe with categorical day types and stop or station codes, int8 hours and int32 volumes.
+    
+    Examples
+    --------
+    >>> read_pass_vol_csv('origin_destination_bus_202011.csv')
+    
+    """
+    chunks = list(pd.read_csv(file, chunksize = chunksize, dtype = PASS_VOLUME_DTYPES))
+    return _concat_chunks(chunks)
+
+@contextlib.contextmanager
+def _open_pass_vol(link):
+    """
+    Streams the zipped CSV file behind a passenger volume link to a temporary file and yields the CSV file inside it, opened to be decompressed as it is read.
+    """
+    with tempfile.TemporaryFile() as f:
+        with current_client().get(link, stream = True) as r:
+            assert r.status_code == 200, "Download is unsuccessful. The link may have expired; please request it again."
+            for block in r.iter_content(chunk_size = 1 << 20):
+                f.write(block)
+        f.seek(0)
+        with zipfile.ZipFile(f) as archive:
+            name = next(n for n in archive.namelist() if n.lower().endswith('.csv'))
+            with archive.open(name) as csv:
+                yield csv
+
+def _download_pass_vol(link, chunksize = 250000):
+    """
+    Returns the CSV file behind a passenger volume link parsed with read_pass_vol_csv.
+    """
+    with _open_pass_vol(link) as csv:
+        return read_pass_vol_csv(csv, chunksize)
+
+NEXT_BUS_KEYS = ['NextBus', 'NextBus2', 'NextBus3']
+
+# Fields of each NextBus, NextBus2 and NextBus3 entry of a BusArrivals service.
+NEXT_BUS_FIELDS = ['OriginCode', 'DestinationCode', 'EstimatedArrival', 'Latitude', 'Longitude', 'VisitNumber', 'Load', 'Feature', 'Type']
+
+def _arrival_columns(services, bus_stop_code = None):
+    """
+    Returns the long-format column lists of a list of BusArrivals services, with one entry per upcoming bus in service order.
+    NextBus entries without an EstimatedArrival are skipped as they are collected, so that memory follows the number of buses rather than three entries per service.
+    """
+    entries = []
+    for service in services:
+        for sequence, key in enumerate(NEXT_BUS_KEYS, 1):
+            bus = service.get(key) or {}
+            if bus.get('EstimatedArrival'):
+                entries.append((service, sequence, bus))
+    columns = {}
+    if bus_stop_code is not None:
+        columns['BusStopCode'] = [bus_stop_code] * len(entries)
+    columns['ServiceNo'] = [service.get('ServiceNo') for service, _, _ in entries]
+    columns['Operator'] = [service.get('Operator') for service, _, _ in entries]
+    columns['Sequence'] = [sequence for _, sequence, _ in entries]
+    for field in NEXT_BUS_FIELDS:
+        columns[field] = [bus.get(field) for _, _, bus in entries]
+    return columns
+
+def _type_arrival_columns(df, prefix = ''):
+    """
+    Converts the NextBus columns of a dataframe in place: EstimatedArrival to datetime64 in Singapore time, coordinates and VisitNumber to float32 and Load, Feature and Type to categoricals.
+    """
+    arrival = df[f'{prefix}EstimatedArrival'].fillna('')
+    if (arrival.str[19:].isin(['+08:00', ''])).all():
+        # Arrival times are given in Singapore time, so the offset can be dropped and the rest parsed by NumPy, which is much faster than parsing each offset.
+        naive = pd.Series(arrival.str[:19].replace('', 'NaT').to_numpy(dtype = 'datetime64[s]'), index = df.index)
+        df[f'{prefix}EstimatedArrival'] = naive.astype('datetime64[ns]').dt.tz_localize('Asia/Singapore')
+    else:
+        df[f'{prefix}EstimatedArrival'] = pd.to_datetime(arrival.where(arrival != ''), utc = True).dt.tz_convert('Asia/Singapore')
+    for field in ['Latitude', 'Longitude', 'VisitNumber']:
+        column = df[f'{prefix}{field}']
+        df[f'{prefix}{field}'] = column.where(column != '').astype('float32')
+    for field in ['Load', 'Feature', 'Type']:
+        column = df[f'{prefix}{field}']
+        df[f'{prefix}{field}'] = column.where(column != '').astype('category')
+    return df
+
+def _arrivals_frame(columns):
+    """
+    Returns a typed long-format arrivals dataframe from the column lists of _arrival_columns.
+    """
+    # Without any rows, as when every bus stop of a batch fails, the columns would be float64, which the parsing of the arrival times rejects.
+    df = pd.DataFrame(columns, dtype = object if not columns['Sequence'] else None)
+    df['Sequence'] = df.Sequence.astype('int8')
+    df['Operator'] = df.Operator.astype('category')
+    return _type_arrival_columns(df)
+
+def _wide_arrival_columns(services):
+    """
+    Returns the wide-format column lists of a list of BusArrivals services, with one entry per service and the fields of each upcoming bus prefixed by its NextBus key.
+    """
+    columns = {'ServiceNo': [service.get('ServiceNo') for service in services], 'Operator': [service.get('Operator') for service in services]}
+    for key in NEXT_BUS_KEYS:
+        buses = [service.get(key) or {} for service in services]
+        for field in NEXT_BUS_FIELDS:
+            columns[f'{key}_{field}'] = [bus.get(field) for bus in buses]
+    return columns
+
+def flatten_bus_arrivals(services, layout = 'long'):
+    """
+    Returns a Pandas DataFrame of typed columns built from the nested NextBus, NextBus2 and NextBus3 entries of BusArrivals services.
+    
+    Parameters
+    ----------
+    services: list of dict
+        The 'Services' list of a BusArrivals response.
+    
+    layout: str
+        Character input; either 'long' for one row per service per upcoming bus, numbered 1 to 3 in the Sequence column, or 'wide' for one row per service with the columns of each upcoming bus prefixed by its NextBus key.
+        By default, this is set to 'long'.
+    
+    Returns
+    -------
+    Pandas DataFrame
+        The output is a dataframe with EstimatedArrival as datetime64 in Singapore time, Latitude and Longitude as float32 and Load, Feature and Type as categoricals.
+    
+    Examples
+    --------
+    >>> flatten_bus_arrivals(r.json()['Services'])
+    >>> flatten_bus_arrivals(r.json()['Services'], 'wide')
+    
+    """
+    assert layout in ('long', 'wide'), "Please ensure that the layout is either 'long' or 'wide'."
+    if layout == 'long':
+        return _arrivals_frame(_arrival_columns(services))
+    columns = _wide_arrival_columns(services)
+    # As in _arrivals_frame, a bus stop without any service in operation would give float64 columns, which the parsing of the arrival times rejects.
+    df = pd.DataFrame(columns, dtype = object if not services else None)
+    df['Operator'] = df.Operator.astype('category')
+    for key in NEXT_BUS_KEYS:
+        _type_arrival_columns(df, f'{key}_')
+    return df
+
+def get_bus_arrivals(api_key, bus_stop_code, service_no = '', flatten = None, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing detailed service information (first stop, last stop, peak / offpeak frequency of dispatch) for all buses in operation at the time of request.
     
@@ -21,6 +482,15 @@ def get_bus_arrivals(api_key, bus_stop_code, service_no = ''):
         Character input; this is the bus service number(s) you are requesting data for.
         By default, this is set to an empty string to provide data for all bus services at the requested bus stop.
     
+    flatten: str
+        Character input; either 'long' or 'wide' to flatten the NextBus, NextBus2 and NextBus3 columns into typed columns (see flatten_bus_arrivals).
+        By default, this is set to None so that these columns hold the nested entries as returned by the API.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        Outputs other than 'pandas' hold the values as returned by the API, flattened into the columns of flatten_bus_arrivals when flatten is given.
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -30,22 +500,121 @@ def get_bus_arrivals(api_key, bus_stop_code, service_no = ''):
     --------
     >>> get_bus_arrivals([YOUR_API_KEY], '55269')
     >>> get_bus_arrivals([YOUR_API_KEY], '83139', '15')
+    >>> get_bus_arrivals([YOUR_API_KEY], '83139', flatten = 'long')
+    >>> get_bus_arrivals([YOUR_API_KEY], '83139', flatten = 'wide', output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
     assert isinstance(bus_stop_code, str), "Please ensure that the bus stop code is entered as a string."
     assert isinstance(api_key, str), "Please ensure that the bus service number is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/BusArrivals?BusStopCode={bus_stop_code}&ServiceNo={service_no}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/BusArrivals?BusStopCode={bus_stop_code}&ServiceNo={service_no}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
     r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['Services'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    if output != 'pandas':
+        assert flatten in (None, 'long', 'wide'), "Please ensure that the layout is either 'long' or 'wide'."
+        services = r_json['Services']
+        records = services if flatten is None else _arrival_columns(services) if flatten == 'long' else _wide_arrival_columns(services)
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'BusArrivals', output)
+    if flatten is None:
+        r_json_df = pd.DataFrame(r_json['Services'])
+    else:
+        r_json_df = flatten_bus_arrivals(r_json['Services'], flatten)
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_bus_services(api_key):
+def _get_arrival_columns(client, headers, bus_stop_code, service_no, throttle):
+    """
+    Requests the arrivals at one bus stop and returns them as long-format column lists.
+    """
+    if throttle is not None:
+        throttle.acquire()
+    r = client.get(f'{BASE_URL}/BusArrivals?BusStopCode={bus_stop_code}&ServiceNo={service_no}', headers = headers)
+    assert r.status_code == 200, f"Request is unsuccessful with status code {r.status_code}."
+    return _arrival_columns(r.json()['Services'], bus_stop_code)
+
+def get_bus_arrivals_many(api_key, stop_codes, service_no = '', workers = 10, rate = None):
+    """
+    Returns a pair of Pandas DataFrames containing the upcoming buses at many bus stops, requested concurrently, and the bus stops whose requests failed.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    stop_codes: iterable of str
+        Character inputs; these are the bus stop reference codes for the bus stops you are requesting data for.
+        Any iterable is accepted, including a generator; codes are read as requests are issued.
+    
+    service_no: str
+        Character input; this is the bus service number(s) you are requesting data for.
+        By default, this is set to an empty string to provide data for all bus services at each bus stop.
+    
+    workers: int
+        Integer input; this is the number of requests in flight at once.
+        By default, this is set to 10.
+    
+    rate: float
+        Numeric input; this is the maximum number of requests started per second.
+        By default, this is set to None so that requests are only rate limited by the limiter of the active client, if any (see ratelimit.RateLimiter).
+    
+    Returns
+    -------
+    tuple of Pandas DataFrames
+        The first dataframe contains one row per bus stop, service and upcoming bus, keyed by BusStopCode, ServiceNo and Sequence (1 to 3), with the typed columns of flatten_bus_arrivals.
+        The second dataframe contains the BusStopCode and error message of every bus stop whose request failed; these do not abort the batch.
+    
+    Examples
+    --------
+    >>> arrivals, failures = get_bus_arrivals_many([YOUR_API_KEY], ['55269', '83139'])
+    >>> arrivals, failures = get_bus_arrivals_many([YOUR_API_KEY], stop_codes, workers = 32, rate = 50)
+    
+    """
+    assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert isinstance(service_no, str), "Please ensure that the bus service number is entered as a string."
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    client = current_client()
+    headers = {'AccountKey': api_key, 'accept': 'application/json'}
+    # A fixed rate for this batch alone, on top of the client's own limiter if it has one.
+    throttle = RateLimiter(rate, burst = 1) if rate else None
+    columns = _arrival_columns([], '')
+    failures = {'BusStopCode': [], 'Error': []}
+    stop_codes = iter(stop_codes)
+    # Each worker appends its rows to the shared column lists under the lock, so that no per-stop frames or responses are kept.
+    lock = threading.Lock()
+
+    def fetch(bus_stop_code):
+        assert isinstance(bus_stop_code, str), "Please ensure that the bus stop code is entered as a string."
+        stop_columns = _get_arrival_columns(client, headers, bus_stop_code, service_no, throttle)
+        with lock:
+            for name, values in stop_columns.items():
+                columns[name].extend(values)
+
+    with ThreadPoolExecutor(workers) as pool:
+        pending = {}
+        while True:
+            for bus_stop_code in stop_codes:
+                pending[pool.submit(fetch, bus_stop_code)] = bus_stop_code
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            done, _ = wait(pending, return_when = FIRST_COMPLETED)
+            for future in done:
+                bus_stop_code = pending.pop(future)
+                if future.exception() is not None:
+                    failures['BusStopCode'].append(bus_stop_code)
+                    failures['Error'].append(str(future.exception()) or type(future.exception()).__name__)
+    arrivals_df = _arrivals_frame(columns)
+    failures_df = pd.DataFrame(failures)
+    print(f'{len(arrivals_df)} arrivals retrieved; {len(failures_df)} bus stop(s) failed.')
+    return arrivals_df, failures_df
+
+def get_bus_services(api_key, workers = 1, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing detailed service information (first stop, last stop, peak / offpeak frequency of dispatch) for all bus services.
     
@@ -55,6 +624,14 @@ def get_bus_services(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -63,18 +640,23 @@ def get_bus_services(api_key):
     Examples
     --------
     >>> get_bus_services([YOUR_API_KEY])
+    >>> get_bus_services([YOUR_API_KEY], workers = 8)
+    >>> get_bus_services([YOUR_API_KEY], workers = 8, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/BusServices', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'BusServices', workers)
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'BusServices', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'BusServices')
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_bus_routes(api_key):
+def get_bus_routes(api_key, workers = 1, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing detailed route information (all bus stops along each route, first/last bus timings for each stop) for all services.
 
@@ -84,6 +666,14 @@ def get_bus_routes(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -92,18 +682,23 @@ def get_bus_routes(api_key):
     Examples
     --------
     >>> get_bus_routes([YOUR_API_KEY])
+    >>> get_bus_routes([YOUR_API_KEY], workers = 8)
+    >>> get_bus_routes([YOUR_API_KEY], workers = 8, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/BusRoutes', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'BusRoutes', workers)
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'BusRoutes', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'BusRoutes')
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_bus_stops(api_key):
+def get_bus_stops(api_key, workers = 1, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing detailed information (bus stop code, location coordinates) for all bus stops currently being serviced by buses.
 
@@ -113,6 +708,14 @@ def get_bus_stops(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -121,18 +724,23 @@ def get_bus_stops(api_key):
     Examples
     --------
     >>> get_bus_stops([YOUR_API_KEY])
+    >>> get_bus_stops([YOUR_API_KEY], workers = 8)
+    >>> get_bus_stops([YOUR_API_KEY], workers = 8, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/BusStops', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'BusStops', workers)
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'BusStops', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'BusStops')
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_pass_vol_bus(api_key, date = (datetime.date.today().replace(day = 1) - datetime.timedelta(days = 1)).strftime("%Y%m")):
+def get_pass_vol_bus(api_key, date = None, download = False, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing tap in and tap out passenger volume by weekdays and weekends for individual bus stops for up to the last 3 months.
     
@@ -146,28 +754,49 @@ def get_pass_vol_bus(api_key, date = (datetime.date.today().replace(day = 1) - d
         Character input; this is the starting date of the data.
         By default, this is set such that the last 1 month of data is returned.
     
+    download: bool
+        Boolean input; whether to download and parse the zipped CSV file behind the link returned by the API.
+        The file is streamed to disk and parsed in chunks with compact dtypes (see read_pass_vol_csv).
+        By default, this is set to False so that the link itself is returned.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing tap in and tap out passenger volume by weekdays and weekends for individual bus stop for up to the last 3 months.
+        If download is True, the output is the parsed data of the linked CSV file; otherwise it is a dataframe containing the link.
+        With another output, the same data is returned in that form; the parsed CSV file is converted from its dataframe.
     
     Examples
     --------
     >>> get_pass_vol_bus([YOUR_API_KEY])
     >>> get_pass_vol_bus([YOUR_API_KEY], '202011')
+    >>> get_pass_vol_bus([YOUR_API_KEY], '202011', download = True)
+    >>> get_pass_vol_bus([YOUR_API_KEY], '202011', download = True, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    date = _last_month() if date is None else date
     assert isinstance(date, str), "Please ensure that the date is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/PV/Bus?Date={date}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/PV/Bus?Date={date}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
     r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    if download:
+        r_json_df = _download_pass_vol(r_json['value'][0]['Link'])
+        r_json_df = r_json_df if output == 'pandas' else from_frame(r_json_df, output)
+    elif output != 'pandas':
+        r_json_df = _convert(current_client(), r, r_json['value'], 'PV/Bus', output)
+    else:
+        r_json_df = pd.DataFrame(r_json['value'])
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_pass_vol_odbus(api_key, date = (datetime.date.today().replace(day = 1) - datetime.timedelta(days = 1)).strftime("%Y%m")):
+def get_pass_vol_odbus(api_key, date = None, download = False, output = 'pandas'):
     """
     Returns a Pandas DataFrame contianing number of trips by weekdays and weekends from origin to destination bus stops for up to the last 3 months.
     
@@ -181,28 +810,49 @@ def get_pass_vol_odbus(api_key, date = (datetime.date.today().replace(day = 1) -
         Character input; this is the starting date of the data.
         By default, this is set such that the last 1 month of data is returned.
     
+    download: bool
+        Boolean input; whether to download and parse the zipped CSV file behind the link returned by the API.
+        The file is streamed to disk and parsed in chunks with compact dtypes (see read_pass_vol_csv).
+        By default, this is set to False so that the link itself is returned.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing number of trips by weekdays and weekends from origin to destination bus stops for up to the last 3 months.
+        If download is True, the output is the parsed data of the linked CSV file; otherwise it is a dataframe containing the link.
+        With another output, the same data is returned in that form; the parsed CSV file is converted from its dataframe.
     
     Examples
     --------
     >>> get_pass_vol_odbus([YOUR_API_KEY])
     >>> get_pass_vol_odbus([YOUR_API_KEY], '202011')
+    >>> get_pass_vol_odbus([YOUR_API_KEY], '202011', download = True)
+    >>> get_pass_vol_odbus([YOUR_API_KEY], '202011', download = True, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    date = _last_month() if date is None else date
     assert isinstance(date, str), "Please ensure that the date is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/PV/ODBus?Date={date}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/PV/ODBus?Date={date}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
     r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    if download:
+        r_json_df = _download_pass_vol(r_json['value'][0]['Link'])
+        r_json_df = r_json_df if output == 'pandas' else from_frame(r_json_df, output)
+    elif output != 'pandas':
+        r_json_df = _convert(current_client(), r, r_json['value'], 'PV/ODBus', output)
+    else:
+        r_json_df = pd.DataFrame(r_json['value'])
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_pass_vol_odtrain(api_key, date = (datetime.date.today().replace(day = 1) - datetime.timedelta(days = 1)).strftime("%Y%m")):
+def get_pass_vol_odtrain(api_key, date = None, download = False, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing number of trips by weekdays and weekends from origin to destination train stations for up to the last 3 months.
     
@@ -216,28 +866,49 @@ def get_pass_vol_odtrain(api_key, date = (datetime.date.today().replace(day = 1)
         Character input; this is the starting date of the data.
         By default, this is set such that the last 1 month of data is returned.
     
+    download: bool
+        Boolean input; whether to download and parse the zipped CSV file behind the link returned by the API.
+        The file is streamed to disk and parsed in chunks with compact dtypes (see read_pass_vol_csv).
+        By default, this is set to False so that the link itself is returned.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing number of trips by weekdays and weekends from origin to destination train stations for up to the last 3 months.
+        If download is True, the output is the parsed data of the linked CSV file; otherwise it is a dataframe containing the link.
+        With another output, the same data is returned in that form; the parsed CSV file is converted from its dataframe.
     
     Examples
     --------
     >>> get_pass_vol_odtrain([YOUR_API_KEY])
     >>> get_pass_vol_odtrain([YOUR_API_KEY], '202011')
+    >>> get_pass_vol_odtrain([YOUR_API_KEY], '202011', download = True)
+    >>> get_pass_vol_odtrain([YOUR_API_KEY], '202011', download = True, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    date = _last_month() if date is None else date
     assert isinstance(date, str), "Please ensure that the date is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/PV/ODTrain?Date={date}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/PV/ODTrain?Date={date}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
     r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    if download:
+        r_json_df = _download_pass_vol(r_json['value'][0]['Link'])
+        r_json_df = r_json_df if output == 'pandas' else from_frame(r_json_df, output)
+    elif output != 'pandas':
+        r_json_df = _convert(current_client(), r, r_json['value'], 'PV/ODTrain', output)
+    else:
+        r_json_df = pd.DataFrame(r_json['value'])
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_pass_vol_train(api_key, date = (datetime.date.today().replace(day = 1) - datetime.timedelta(days = 1)).strftime("%Y%m")):
+def get_pass_vol_train(api_key, date = None, download = False, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing tap in and tap out passenger volume by weekdays and weekends for individual train stations for up to the last 3 months.
     
@@ -251,28 +922,49 @@ def get_pass_vol_train(api_key, date = (datetime.date.today().replace(day = 1) -
         Character input; this is the starting date of the data.
         By default, this is set such that the last 1 month of data is returned.
     
+    download: bool
+        Boolean input; whether to download and parse the zipped CSV file behind the link returned by the API.
+        The file is streamed to disk and parsed in chunks with compact dtypes (see read_pass_vol_csv).
+        By default, this is set to False so that the link itself is returned.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing tap in and tap out passenger volume by weekdays and weekends for individual train stations for up to the last 3 months.
+        If download is True, the output is the parsed data of the linked CSV file; otherwise it is a dataframe containing the link.
+        With another output, the same data is returned in that form; the parsed CSV file is converted from its dataframe.
     
     Examples
     --------
     >>> get_pass_vol_train([YOUR_API_KEY])
     >>> get_pass_vol_train([YOUR_API_KEY], 202011)
+    >>> get_pass_vol_train([YOUR_API_KEY], '202011', download = True)
+    >>> get_pass_vol_train([YOUR_API_KEY], '202011', download = True, output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    date = _last_month() if date is None else date
     assert isinstance(date, str), "Please ensure that the date is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/PV/Train?Date={date}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/PV/Train?Date={date}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
     r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    if download:
+        r_json_df = _download_pass_vol(r_json['value'][0]['Link'])
+        r_json_df = r_json_df if output == 'pandas' else from_frame(r_json_df, output)
+    elif output != 'pandas':
+        r_json_df = _convert(current_client(), r, r_json['value'], 'PV/Train', output)
+    else:
+        r_json_df = pd.DataFrame(r_json['value'])
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_taxi_availability(api_key):
+def get_taxi_availability(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing location coordinates of all Taxis that are currently available for hire at the time of request. "Hired" or "Busy" taxis are not included.
 
@@ -282,6 +974,10 @@ def get_taxi_availability(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -290,20 +986,22 @@ def get_taxi_availability(api_key):
     Examples
     --------
     >>> get_taxi_availability([YOUR_API_KEY])
+    >>> get_taxi_availability([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/Taxi-Availability', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'Taxi-Availability')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'Taxi-Availability', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'Taxi-Availability')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_taxi_stands(api_key):
+def get_taxi_stands(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing detailed information of Taxi stands, such as location and whether is it barrier free, at the time of request.
 
@@ -313,6 +1011,10 @@ def get_taxi_stands(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key, at the time of request.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -321,20 +1023,25 @@ def get_taxi_stands(api_key):
     Examples
     --------
     >>> get_taxi_stands([YOUR_API_KEY])
+    >>> get_taxi_stands([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/TaxiStands', headers = headers)
+    r = current_client().get(f'{BASE_URL}/TaxiStands', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'TaxiStands')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'TaxiStands', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'TaxiStands')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_train_service_alerts(api_key):
+def get_train_service_alerts(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing detailed information on train service unavailability during scheduled operating hours, such as affected line and stations etc., at the time of request.
 
@@ -344,28 +1051,38 @@ def get_train_service_alerts(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        Outputs other than 'pandas' hold the alert object returned by the API as a single record.
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing detailed information on train service unavailability during scheduled operating hours, such as affected line and stations etc., at the time of request.
+        If the active DataMall client has a ChangeDetector and the content has not changed since the previous call, this is the previous dataframe (or NO_CHANGE).
     
     Examples
     --------
     >>> get_train_service_alerts([YOUR_API_KEY])
+    >>> get_train_service_alerts([YOUR_API_KEY], output = 'records')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/TrainServiceAlerts', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, r_json_df = _get_polled(api_key, 'TrainServiceAlerts', output)
+    if r_json_df is NO_CHANGE:
+        print(f'Status Code: {r.status_code}. Content is unchanged.')
+        return r_json_df
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return r_json_df
+    r_json_df = _typed(r_json_df, 'TrainServiceAlerts')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_carpark_availability(api_key):
+def get_carpark_availability(api_key, workers = 1, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing number of available lots for HDB, LTA and URA carpark data at the time of request.
 
@@ -375,6 +1092,14 @@ def get_carpark_availability(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -383,21 +1108,24 @@ def get_carpark_availability(api_key):
     Examples
     --------
     >>> get_car_park_availability([YOUR_API_KEY])
+    >>> get_car_park_availability([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/CarParkAvailabilityv2', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    r_json_df[['Latitude', 'Longitude']] = r_json_df.Location.str.split(expand = True).drop([2, 3], axis = 1)
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'CarParkAvailabilityv2', workers)
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'CarParkAvailabilityv2', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _split_location(r_json_df)
+    r_json_df = _typed(r_json_df, 'CarParkAvailabilityv2')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_erp_rates(api_key):
+def get_erp_rates(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing ERP rates of all vehicle types across all timings for each zone.
 
@@ -407,6 +1135,10 @@ def get_erp_rates(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -415,18 +1147,21 @@ def get_erp_rates(api_key):
     Examples
     --------
     >>> get_erp_rates([YOUR_API_KEY])
+    >>> get_erp_rates([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/ERPRates', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'ERPRates')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'ERPRates', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'ERPRates')
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_est_travel_times(api_key):
+def get_est_travel_times(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing estimated travel times of expressways (in segments) at the time of request.
 
@@ -436,6 +1171,10 @@ def get_est_travel_times(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -444,20 +1183,25 @@ def get_est_travel_times(api_key):
     Examples
     --------
     >>> get_est_travel_times([YOUR_API_KEY])
+    >>> get_est_travel_times([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/EstTravelTimes', headers = headers)
+    r = current_client().get(f'{BASE_URL}/EstTravelTimes', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'EstTravelTimes')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'EstTravelTimes', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'EstTravelTimes')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_faulty_traffic_lights(api_key):
+def get_faulty_traffic_lights(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing alerts of traffic lights that are currently faulty, or currently undergoing scheduled maintenance at the time of request.
 
@@ -467,28 +1211,37 @@ def get_faulty_traffic_lights(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing alerts of traffic lights that are currently faulty, or currently undergoing scheduled maintenance at the time of request.
+        If the active DataMall client has a ChangeDetector and the content has not changed since the previous call, this is the previous dataframe (or NO_CHANGE).
     
     Examples
     --------
     >>> get_faulty_traffic_lights([YOUR_API_KEY])
+    >>> get_faulty_traffic_lights([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/FaultyTrafficLights', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, r_json_df = _get_polled(api_key, 'FaultyTrafficLights', output)
+    if r_json_df is NO_CHANGE:
+        print(f'Status Code: {r.status_code}. Content is unchanged.')
+        return r_json_df
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return r_json_df
+    r_json_df = _typed(r_json_df, 'FaultyTrafficLights')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_road_openings(api_key):
+def get_road_openings(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing all planned road openings at the time of request.
 
@@ -498,28 +1251,37 @@ def get_road_openings(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing all planned road openings at the time of request.
+        If the active DataMall client has a ChangeDetector and the content has not changed since the previous call, this is the previous dataframe (or NO_CHANGE).
     
     Examples
     --------
     >>> get_road_openings([YOUR_API_KEY])
+    >>> get_road_openings([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/RoadOpenings', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, r_json_df = _get_polled(api_key, 'RoadOpenings', output)
+    if r_json_df is NO_CHANGE:
+        print(f'Status Code: {r.status_code}. Content is unchanged.')
+        return r_json_df
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return r_json_df
+    r_json_df = _typed(r_json_df, 'RoadOpenings')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_road_works(api_key):
+def get_road_works(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing all road works being / to be carried out at the time of request.
 
@@ -529,28 +1291,37 @@ def get_road_works(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing all road works being / to be carried out at the time of request.
+        If the active DataMall client has a ChangeDetector and the content has not changed since the previous call, this is the previous dataframe (or NO_CHANGE).
     
     Examples
     --------
     >>> get_road_works([YOUR_API_KEY])
+    >>> get_road_works([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/RoadWorks', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, r_json_df = _get_polled(api_key, 'RoadWorks', output)
+    if r_json_df is NO_CHANGE:
+        print(f'Status Code: {r.status_code}. Content is unchanged.')
+        return r_json_df
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return r_json_df
+    r_json_df = _typed(r_json_df, 'RoadWorks')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_traffic_images(api_key):
+def get_traffic_images(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing links to images of live traffic conditions along expressways and Woodlands & Tuas Checkpoints at the time of request.
 
@@ -560,6 +1331,10 @@ def get_traffic_images(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -568,20 +1343,25 @@ def get_traffic_images(api_key):
     Examples
     --------
     >>> get_traffic_images([YOUR_API_KEY])
+    >>> get_traffic_images([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/Traffic_Imagesv2', headers = headers)
+    r = current_client().get(f'{BASE_URL}/Traffic_Imagesv2', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'Traffic_Imagesv2')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'Traffic_Imagesv2', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'Traffic_Imagesv2')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_traffic_incidents(api_key):
+def get_traffic_incidents(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing incidents currently happening on the roads, such as Accidents, Vehicle Breakdowns, Road Blocks, Traffic Diversions etc., at the time of request.
     
@@ -591,6 +1371,10 @@ def get_traffic_incidents(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -599,20 +1383,25 @@ def get_traffic_incidents(api_key):
     Examples
     --------
     >>> get_traffic_incidents([YOUR_API_KEY])
+    >>> get_traffic_incidents([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/TrafficIncidents', headers = headers)
+    r = current_client().get(f'{BASE_URL}/TrafficIncidents', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'TrafficIncidents')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'TrafficIncidents', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'TrafficIncidents')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_traffic_speed_bands(api_key):
+def get_traffic_speed_bands(api_key, workers = 1, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing traffic speeds on expressways and arterial roads, expressed in speed bands at the time of request.
     
@@ -622,6 +1411,14 @@ def get_traffic_speed_bands(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -630,21 +1427,24 @@ def get_traffic_speed_bands(api_key):
     Examples
     --------
     >>> get_traffic_speed_bands([YOUR_API_KEY])
+    >>> get_traffic_speed_bands([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/TrafficSpeedBandsv2', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    r_json_df[['Latitude', 'Longitude']] = r_json_df.Location.str.split(expand = True).drop([2, 3], axis = 1)
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, records = _get_pages(api_key, 'TrafficSpeedBandsv2', workers)
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'TrafficSpeedBandsv2', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _split_location(r_json_df)
+    r_json_df = _typed(r_json_df, 'TrafficSpeedBandsv2')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_variable_messages(api_key):
+def get_variable_messages(api_key, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing traffic advisories (via variable message services) concerning current traffic conditions that are displayed on EMAS signboards along expressways and arterial roads at the time of request.
     
@@ -654,28 +1454,37 @@ def get_variable_messages(api_key):
         Character input.
         Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
         The output is a dataframe containing traffic advisories (via variable message services) concerning current traffic conditions that are displayed on EMAS signboards along expressways and arterial roads at the time of request.
+        If the active DataMall client has a ChangeDetector and the content has not changed since the previous call, this is the previous dataframe (or NO_CHANGE).
     
     Examples
     --------
     >>> get_variable_messages([YOUR_API_KEY])
+    >>> get_variable_messages([YOUR_API_KEY], output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
-    headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get('http://datamall2.mytransport.sg/ltaodataservice/VMS', headers = headers)
-    assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    r, r_json_df = _get_polled(api_key, 'VMS', output)
+    if r_json_df is NO_CHANGE:
+        print(f'Status Code: {r.status_code}. Content is unchanged.')
+        return r_json_df
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return r_json_df
+    r_json_df = _typed(r_json_df, 'VMS')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_bicyle_parking(api_key, lat, long, dist = '0.5'):
+def get_bicyle_parking(api_key, lat, long, dist = '0.5', output = 'pandas'):
     """
     Returns a Pandas DataFrame containing bicycle parking locations within a radius at the time of request.
     
@@ -695,6 +1504,10 @@ def get_bicyle_parking(api_key, lat, long, dist = '0.5'):
         Character input, this is the radius of search in kilometres.
         By default, this is set to 0.5.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -704,23 +1517,28 @@ def get_bicyle_parking(api_key, lat, long, dist = '0.5'):
     --------
     >>> get_bicycle_parking([YOUR_API_KEY], '1.36666', '103.76666')
     >>> get_bicycle_parking([YOUR_API_KEY], '1.36666', '103.76666', '2.0')
+    >>> get_bicycle_parking([YOUR_API_KEY], '1.36666', '103.76666', '2.0', output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
     assert isinstance(lat, str), "Please ensure that the latitude is entered as a string."
     assert isinstance(long, str), "Please ensure that the longitude is entered as a string."
-    assert isinstance(distance, str), "Please ensure that the distance is entered as a string."
+    assert isinstance(dist, str), "Please ensure that the distance is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/BicycleParkingv2?Lat={lat}&Long={long}&Dist={dist}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/BicycleParkingv2?Lat={lat}&Long={long}&Dist={dist}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'BicycleParkingv2')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'BicycleParkingv2', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'BicycleParkingv2')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_geospatial(api_key, ID):
+def get_geospatial(api_key, ID, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing SHP files of the requested geospatial layer at the time of request.
     
@@ -734,6 +1552,10 @@ def get_geospatial(api_key, ID):
         Character input; this refers to the name of the geospatial layer.
         Please refer to Annex E in https://datamall.lta.gov.sg/content/dam/datamall/datasets/LTA_DataMall_API_User_Guide.pdf for list of allowed IDs.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -742,21 +1564,26 @@ def get_geospatial(api_key, ID):
     Examples
     --------
     >>> get_geospatial([YOUR_API_KEY], 'RoadHump')
+    >>> get_geospatial([YOUR_API_KEY], 'RoadHump', output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
     assert isinstance(ID, str), "Please ensure that the ID is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/GeospatialWholeIsland?ID={ID}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/GeospatialWholeIsland?ID={ID}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'GeospatialWholeIsland')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'GeospatialWholeIsland', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'GeospatialWholeIsland')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
 
-def get_facilities_maintenance(api_key, station_code):
+def get_facilities_maintenance(api_key, station_code, output = 'pandas'):
     """
     Returns a Pandas DataFrame containing pre-signed links to JSON file containing facilities maintenance schedules of the particular station at the time of request.
     
@@ -769,6 +1596,10 @@ def get_facilities_maintenance(api_key, station_code):
     station_code: str
         Character input; this is the code for the train station data is requested for.
     
+    output: str
+        Character input; this is the form of the output: 'pandas' for a dataframe, 'records' for a list of dicts, one per record, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
     Returns
     -------
     Pandas DataFrame
@@ -777,16 +1608,21 @@ def get_facilities_maintenance(api_key, station_code):
     Examples
     --------
     >>> get_facilities_maintenance([YOUR_API_KEY], 'NS1')
+    >>> get_facilities_maintenance([YOUR_API_KEY], 'NS1', output = 'arrow')
     
     """
     assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
     assert isinstance(station_code, str), "Please ensure that the ID is entered as a string."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
     headers = {'AccountKey': api_key, 'accept': 'application/json'}
-    r = requests.get(f'http://datamall2.mytransport.sg/ltaodataservice/FacilitiesMaintenance?StationCode={station_code}', headers = headers)
+    r = current_client().get(f'{BASE_URL}/FacilitiesMaintenance?StationCode={station_code}', headers = headers)
     assert r.status_code == 200, "Request is unsuccessful. Please ensure that the API key is valid."
-    r_json = r.json()
-    r_json_df = pd.DataFrame(r_json['value'])
-    now = datetime.datetime.now()
-    r_json_df['Date and Time Accessed'] = now.strftime("%Y-%m-%d %H:%M:%S")
+    records, _ = _decode(current_client(), r, 'FacilitiesMaintenance')
+    if output != 'pandas':
+        print(f'Status Code: {r.status_code}. Request is successful.')
+        return _convert(current_client(), r, records, 'FacilitiesMaintenance', output)
+    r_json_df = pd.DataFrame(records)
+    r_json_df = _typed(r_json_df, 'FacilitiesMaintenance')
+    r_json_df = _stamp(r_json_df, r)
     print(f'Status Code: {r.status_code}. Request is successful.')
     return r_json_df
\ No newline at end of file
@@ -0,0 +1,113 @@
+from .lazy import LazyModule
+from .schemas import SCHEMAS
+
+np = LazyModule('numpy')
+
+# The forms in which the get_* functions return their data, besides the default 'pandas'.
+OUTPUTS = ['pandas', 'records', 'numpy', 'arrow']
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow output requires pyarrow. Please install it with `pip install pyarrow`.")
+    return pyarrow
+
+def to_columns(records):
+    """
+    Returns records, as a list of dicts or a dict of column lists, as a dict of column lists.
+    """
+    if isinstance(records, dict):
+        return records
+    names = dict.fromkeys(name for record in records for name in record)
+    return {name: [record.get(name) for record in records] for name in names}
+
+def to_records(records):
+    """
+    Returns records, as a list of dicts or a dict of column lists, as a list of dicts.
+    """
+    if isinstance(records, list):
+        return records
+    names = list(records)
+    return [dict(zip(names, row)) for row in zip(*records.values())]
+
+def _numpy_column(values, dtype):
+    """
+    Returns a column as a NumPy array of the dtype of its schema, falling back to float32 for integers with missing values and to objects for anything that does not parse.
+    """
+    if dtype == 'datetime':
+        try:
+            return np.array(values, dtype = 'datetime64[ns]')
+        except (TypeError, ValueError):
+            return np.array(values, dtype = object)
+    if dtype not in ('category', ''):
+        try:
+            return np.array(values, dtype = dtype)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return np.array([np.nan if v is None or v == '' else v for v in values], dtype = np.float32)
+        except (TypeError, ValueError):
+            pass
+    column = np.empty(len(values), dtype = object)
+    column[:] = values
+    return column
+
+def to_structured(records, endpoint, typed = True):
+    """
+    Returns records as a NumPy structured array with one field per column.
+    With typed = True, numeric and date columns take the dtypes of the endpoint's schema; all other columns hold references to the decoded Python objects, so that strings are not copied.
+    Each field of the array, such as array['SpeedBand'], is a view that does not copy.
+    """
+    columns = to_columns(records)
+    schema = SCHEMAS.get(endpoint, {}) if typed else {}
+    arrays = {name: _numpy_column(values, schema.get(name, '')) for name, values in columns.items()}
+    n = len(next(iter(arrays.values()), []))
+    array = np.empty(n, dtype = [(name, column.dtype) for name, column in arrays.items()])
+    for name, column in arrays.items():
+        array[name] = column
+    return array
+
+def _arrow_column(pa, values, dtype):
+    """
+    Returns a column as a pyarrow Array of the type of its schema. Numeric columns are built from their NumPy array, which Arrow uses without copying.
+    """
+    if dtype not in (None, 'category'):
+        column = _numpy_column(values, dtype)
+        if column.dtype != object:
+            return pa.array(column)
+    try:
+        column = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        column = pa.array([None if v is None else str(v) for v in values])
+    if dtype == 'category':
+        try:
+            return column.dictionary_encode()
+        except pa.ArrowNotImplementedError:
+            pass
+    return column
+
+def to_arrow(records, endpoint, typed = True, accessed = None):
+    """
+    Returns records as a pyarrow Table, with the column types of the endpoint's schema when typed = True, and the time accessed, if any, in the schema metadata.
+    Numeric columns of the table can be viewed as NumPy arrays with column.to_numpy(zero_copy_only = True), without copying.
+    Requires pyarrow.
+    """
+    pa = _pyarrow()
+    schema = SCHEMAS.get(endpoint, {}) if typed else {}
+    table = pa.table({name: _arrow_column(pa, values, schema.get(name)) for name, values in to_columns(records).items()})
+    if accessed is not None:
+        table = table.replace_schema_metadata({'accessed': accessed.isoformat()})
+    return table
+
+def from_frame(df, output):
+    """
+    Returns a dataframe in one of the forms of OUTPUTS, for data that is parsed into a dataframe before it is returned, such as passenger volume CSV files.
+    """
+    if output == 'pandas':
+        return df
+    if output == 'records':
+        return df.to_dict('records')
+    if output == 'numpy':
+        return df.to_records(index = False)
+    return _pyarrow().Table.from_pandas(df, preserve_index = False)
@@ -0,0 +1,135 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from . import final_project_n_lavanya
+from .client import DataMall, current_client
+
+# Passenger volume datasets, by kind, with the get_* function that fetches one month of them.
+KINDS = {
+    'bus': 'get_pass_vol_bus',
+    'odbus': 'get_pass_vol_odbus',
+    'train': 'get_pass_vol_train',
+    'odtrain': 'get_pass_vol_odtrain',
+}
+
+def month_range(start, end):
+    """
+    Returns the list of months from start to end inclusive, as YYYYMM strings.
+    """
+    assert isinstance(start, str) and isinstance(end, str), "Please ensure that the months are entered as strings."
+    months = pd.period_range(f'{start[:4]}-{start[4:]}', f'{end[:4]}-{end[4:]}', freq = 'M')
+    return [month.strftime('%Y%m') for month in months]
+
+def _cache_path(cache_dir, kind, month):
+    return os.path.join(cache_dir, f'pass_vol_{kind}_{month}.feather')
+
+# The client of a worker process, set up by _start_worker; None in the calling process, which fetches through its active client.
+_worker_client = None
+
+def _client_options(client):
+    """
+    Returns the settings of a client to be set up again in worker processes. The cache and rate limiter are copied, so that each process has its own.
+    """
+    return {'keep_alive': client.keep_alive, 'gzip': client.gzip, 'cache': client.cache, 'typed': client.typed, 'decoder': client.decoder, 'limiter': client.limiter}
+
+def _start_worker(base_url, options):
+    """
+    Sets up a worker process of load_pass_vol_history with the base URL and client settings of the calling process.
+    """
+    global _worker_client
+    # The worker imports the package afresh, so the base URL of the calling process is passed on to it; this only changes the worker's own copy of the module.
+    final_project_n_lavanya.BASE_URL = base_url
+    # A fresh client, as connections pooled by a parent process must not be shared with its children.
+    _worker_client = DataMall(pool_size = 1, **options)
+
+def _fetch_month(api_key, kind, month, cache_dir):
+    """
+    Fetches and parses one month of a passenger volume dataset. If cache_dir is given, the month is written there and its path is returned instead of the dataframe.
+    """
+    with _worker_client or current_client():
+        df = getattr(final_project_n_lavanya, KINDS[kind])(api_key, month, download = True)
+    if 'YEAR_MONTH' not in df.columns:
+        df['YEAR_MONTH'] = pd.Categorical([f'{month[:4]}-{month[4:]}'] * len(df))
+    if cache_dir is None:
+        return df
+    from .snapshots import _feather
+    path = _cache_path(cache_dir, kind, month)
+    _feather().write_feather(df, f'{path}.tmp', compression = 'uncompressed')
+    os.replace(f'{path}.tmp', path)
+    return path
+
+def load_pass_vol_history(api_key, kind, start, end, processes = None, cache_dir = None):
+    """
+    Returns a Pandas DataFrame containing a range of months of a passenger volume dataset, fetched and parsed in parallel across processes.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    kind: str
+        Character input; one of 'bus', 'odbus', 'train' and 'odtrain'.
+    
+    start: str
+        Character input; this is the first month of data, as YYYYMM.
+    
+    end: str
+        Character input; this is the last month of data, as YYYYMM.
+    
+    processes: int
+        Integer input; this is the number of worker processes. With 1, months are fetched one after another in the calling process.
+        By default, this is set to None so that there is one process per month, up to the number of CPUs.
+    
+    cache_dir: str
+        Character input; this is a directory where each month is kept as a Feather file once ingested, so that it is read from there instead of fetched again. Requires pyarrow.
+        By default, this is set to None so that every month is fetched.
+    
+    Months are fetched through the active DataMall client. Worker processes each get a client with its settings and their own copies of its response cache and rate limiter,
+    which are not shared between processes: with a limiter, each of the processes may send requests at its full rate.
+    
+    Returns
+    -------
+    Pandas DataFrame
+        The output is a dataframe of the rows of every month in order, with the compact dtypes of read_pass_vol_csv and a categorical YEAR_MONTH column.
+    
+    Examples
+    --------
+    >>> load_pass_vol_history([YOUR_API_KEY], 'odbus', '202009', '202011')
+    >>> load_pass_vol_history([YOUR_API_KEY], 'train', '202009', '202011', cache_dir = '~/.cache/datamall')
+    
+    """
+    assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert kind in KINDS, f"Please ensure that the kind is one of {', '.join(KINDS)}."
+    months = month_range(start, end)
+    if cache_dir is not None:
+        cache_dir = os.path.expanduser(cache_dir)
+        os.makedirs(cache_dir, exist_ok = True)
+    results = {}
+    missing = []
+    for month in months:
+        if cache_dir is not None and os.path.exists(_cache_path(cache_dir, kind, month)):
+            results[month] = _cache_path(cache_dir, kind, month)
+        else:
+            missing.append(month)
+    args = [(api_key, kind, month, cache_dir) for month in missing]
+    processes = processes or min(len(missing), os.cpu_count() or 1)
+    if processes <= 1:
+        for month, arg in zip(missing, args):
+            results[month] = _fetch_month(*arg)
+    else:
+        worker = (final_project_n_lavanya.BASE_URL, _client_options(current_client()))
+        with ProcessPoolExecutor(processes, initializer = _start_worker, initargs = worker) as pool:
+            for month, result in zip(missing, pool.map(_fetch_month, *zip(*args))):
+                results[month] = result
+    frames = []
+    for month in months:
+        result = results.pop(month)
+        if isinstance(result, str):
+            from .snapshots import _feather
+            result = _feather().read_table(result, memory_map = True).to_pandas()
+        frames.append(result)
+    # The months are merged one column at a time, so that at most one column is held twice.
+    return final_project_n_lavanya._concat_chunks(frames)
@@ -0,0 +1,30 @@
+import importlib
+
+class LazyModule:
+    """
+    A stand-in for a module that is only imported on first attribute access, so that importing the package does not pay for pandas, NumPy or requests until a function needs them.
+    
+    Parameters
+    ----------
+    name: str
+        Character input; this is the name of the module, e.g. 'pandas'.
+    
+    Examples
+    --------
+    >>> pd = LazyModule('pandas')
+    >>> pd.DataFrame(records)
+    
+    """
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+
+    def __getattr__(self, attr):
+        # importlib holds the import lock while the module runs, so threads touching it for the first time at once import it once.
+        module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __setattr__(self, attr, value):
+        setattr(importlib.import_module(self._name), attr, value)
+
+    def __repr__(self):
+        return f'<lazy module {self._name!r}>'
@@ -0,0 +1,246 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+def _ranges(starts, ends):
+    """
+    Returns the concatenation of the integer ranges [starts[i], ends[i]).
+    """
+    lengths = ends - starts
+    return np.repeat(ends - lengths.cumsum(), lengths) + np.arange(lengths.sum())
+
+def _dijkstra(indptr, indices, weights, source):
+    """
+    Returns the list of shortest distances from a node to every node of a graph in compressed sparse row form, inf where it cannot be reached.
+    The arrays are memoryviews, which are read one element at a time about as fast as lists and without copying them.
+    """
+    distance = [np.inf] * (len(indptr) - 1)
+    distance[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, i = heapq.heappop(heap)
+        if d > distance[i]:
+            continue
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            if d + weights[k] < distance[j]:
+                distance[j] = d + weights[k]
+                heapq.heappush(heap, (distance[j], j))
+    return distance
+
+class BusNetwork:
+    """
+    The bus network as compact arrays: a graph of bus stops whose edges are consecutive stops of a service, in compressed sparse row form, and the ordered stops of every service and direction.
+    
+    Build it with BusNetwork.from_routes from the output of get_bus_routes, and keep it on disk with save and load.
+    
+    Examples
+    --------
+    >>> network = BusNetwork.from_routes(get_bus_routes([YOUR_API_KEY], workers = 8))
+    >>> network.shortest_path('01012', '75009')
+    >>> network.fewest_transfers('01012', '75009')
+    >>> network.reachable('01012', 10)
+    >>> network.save('network.npz')
+    
+    """
+    def __init__(self, stops, indptr, indices, weights, services, directions, pattern_ptr, pattern_stops, pattern_distance):
+        self.stops = pd.Index(stops)
+        # Edges: the neighbours of stop i are indices[indptr[i]:indptr[i + 1]], at weights kilometres.
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        # Patterns: the stops of service services[p] in direction directions[p] are pattern_stops[pattern_ptr[p]:pattern_ptr[p + 1]], in order.
+        self.services = np.asarray(services)
+        self.directions = np.asarray(directions)
+        self.pattern_ptr = pattern_ptr
+        self.pattern_stops = pattern_stops
+        self.pattern_distance = pattern_distance
+        # Incidence of stops in patterns: the k-th visit of stop i is at position stop_positions[k] of pattern stop_patterns[k], for k in stop_ptr[i]:stop_ptr[i + 1].
+        visits = np.repeat(np.arange(len(self.services)), np.diff(pattern_ptr))
+        positions = np.arange(len(pattern_stops)) - np.repeat(pattern_ptr[:-1], np.diff(pattern_ptr))
+        order = np.argsort(pattern_stops, kind = 'stable')
+        self.stop_ptr = np.concatenate([[0], np.cumsum(np.bincount(pattern_stops, minlength = len(self.stops)))])
+        self.stop_patterns = visits[order]
+        self.stop_positions = positions[order]
+        self._landmarks = None
+
+    @classmethod
+    def from_routes(cls, df):
+        """
+        Returns a BusNetwork built from a dataframe with the ServiceNo, Direction, StopSequence, BusStopCode and Distance columns of get_bus_routes.
+        Distance is the distance in kilometres from the start of the route, so that the weight of an edge is the difference between consecutive stops.
+        When several services link the same two stops, the edge keeps the shortest distance.
+        """
+        df = df.sort_values(['ServiceNo', 'Direction', 'StopSequence'], kind = 'stable')
+        stops = pd.Index(np.sort(df.BusStopCode.astype(str).unique()))
+        stop = stops.get_indexer(df.BusStopCode.astype(str)).astype(np.int32)
+        pattern, first = np.unique(df.ServiceNo.astype(str) + '\0' + df.Direction.astype(str), return_index = True)
+        # np.unique sorts patterns by (service, direction), which is also the order of the rows.
+        pattern_ptr = np.append(np.sort(first), len(df)).astype(np.int64)
+        services = df.ServiceNo.astype(str).to_numpy()[pattern_ptr[:-1]]
+        directions = df.Direction.to_numpy()[pattern_ptr[:-1]]
+        distance = pd.to_numeric(df.Distance, errors = 'coerce').fillna(0).to_numpy(dtype = np.float32)
+        same = np.ones(len(df), dtype = bool)
+        same[pattern_ptr[:-1]] = False
+        # An edge joins every row to the previous one within the same pattern.
+        head = np.flatnonzero(same)
+        source, target = stop[head - 1], stop[head]
+        weight = np.maximum(distance[head] - distance[head - 1], 0)
+        keep = source != target
+        source, target, weight = source[keep], target[keep], weight[keep]
+        n = len(stops)
+        key = source.astype(np.int64) * n + target
+        order = np.lexsort((weight, key))
+        key, weight = key[order], weight[order]
+        unique = np.ones(len(key), dtype = bool)
+        unique[1:] = key[1:] != key[:-1]
+        key, weight = key[unique], weight[unique]
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(key // n, minlength = n))])
+        return cls(stops, indptr, (key % n).astype(np.int32), weight, services, directions, pattern_ptr, stop, distance)
+
+    def save(self, path):
+        """
+        Writes the network to an uncompressed .npz file.
+        """
+        np.savez(path, stops = self.stops.to_numpy(dtype = str), indptr = self.indptr, indices = self.indices, weights = self.weights,
+                 services = self.services.astype(str), directions = self.directions, pattern_ptr = self.pattern_ptr,
+                 pattern_stops = self.pattern_stops, pattern_distance = self.pattern_distance)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Returns the network written to a .npz file by save.
+        """
+        with np.load(path) as f:
+            return cls(**{name: f[name] for name in f.files})
+
+    def _stop(self, code):
+        assert code in self.stops, f"Bus stop {code} is not served by any route."
+        return self.stops.get_loc(code)
+
+    def _landmark_distances(self, landmarks = 16):
+        """
+        Returns the distances from and to a few landmark stops spread across the network, as two arrays of one row per landmark, computed on first use.
+        Each landmark is the stop farthest from the ones chosen before, so that together they bound distances in every part of the network.
+        """
+        if self._landmarks is None:
+            n = len(self.stops)
+            # The reverse graph, in which the neighbours of stop i are the stops with an edge to it.
+            order = np.argsort(self.indices, kind = 'stable')
+            sources = np.repeat(np.arange(n), np.diff(self.indptr))[order]
+            rindptr = np.concatenate([[0], np.cumsum(np.bincount(self.indices, minlength = n))])
+            forward = [memoryview(np.ascontiguousarray(a)) for a in (self.indptr, self.indices, self.weights)]
+            backward = [memoryview(np.ascontiguousarray(a)) for a in (rindptr, sources, self.weights[order])]
+            origins, destinations = [], []
+            spread = np.zeros(n)
+            landmark = 0
+            for _ in range(min(landmarks, n)):
+                origins.append(_dijkstra(*forward, landmark))
+                destinations.append(_dijkstra(*backward, landmark))
+                around = np.array(origins[-1]) + np.array(destinations[-1])
+                around[~np.isfinite(around)] = 0
+                spread = around if len(origins) == 1 else np.minimum(spread, around)
+                landmark = int(spread.argmax())
+            self._landmarks = np.array(origins), np.array(destinations)
+        return self._landmarks
+
+    def shortest_path(self, origin, destination):
+        """
+        Returns the shortest distance in kilometres along bus routes from one bus stop to another, and the list of bus stops on the way, or (inf, []) if it cannot be reached.
+        The search is an A* search over the edge arrays, guided by lower bounds on the distance to the destination from the landmark distances (by the triangle inequality).
+        """
+        source, target = int(self._stop(origin)), int(self._stop(destination))
+        origins, destinations = self._landmark_distances()
+        # d(i, target) >= d(landmark, target) - d(landmark, i) and d(i, target) >= d(i, landmark) - d(target, landmark); a stop that cannot reach a landmark the target reaches cannot reach the target.
+        with np.errstate(invalid = 'ignore'):
+            bound = np.fmax((origins[:, [target]] - origins).max(0), (destinations - destinations[:, [target]]).max(0))
+        bound = np.fmax(bound, 0).tolist()
+        indptr, indices, weights = (memoryview(np.ascontiguousarray(a)) for a in (self.indptr, self.indices, self.weights))
+        distance = {source: 0.0}
+        previous = {}
+        done = set()
+        heap = [(bound[source], 0.0, source)] if bound[source] < np.inf else []
+        while heap:
+            _, d, i = heapq.heappop(heap)
+            if i == target:
+                path = [target]
+                while path[-1] != source:
+                    path.append(previous[path[-1]])
+                return d, [self.stops[stop] for stop in path[::-1]]
+            if i in done:
+                continue
+            done.add(i)
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if d + weights[k] < distance.get(j, np.inf) and bound[j] < np.inf:
+                    distance[j] = d + weights[k]
+                    previous[j] = i
+                    heapq.heappush(heap, (distance[j] + bound[j], distance[j], j))
+        return np.inf, []
+
+    def fewest_transfers(self, origin, destination, max_transfers = 5):
+        """
+        Returns the journey from one bus stop to another that takes the fewest buses, as a Pandas DataFrame of legs with ServiceNo, Direction, Board and Alight columns.
+        The dataframe is empty if the destination cannot be reached with at most max_transfers transfers.
+        """
+        source, target = self._stop(origin), self._stop(destination)
+        n = len(self.stops)
+        reached = np.zeros(n, dtype = bool)
+        reached[source] = True
+        # For each stop, the pattern and boarding stop of the leg that first reached it.
+        leg_pattern = np.full(n, -1, dtype = np.int64)
+        leg_board = np.full(n, -1, dtype = np.int64)
+        frontier = np.array([source])
+        for _ in range(max_transfers + 1):
+            visits = _ranges(self.stop_ptr[frontier], self.stop_ptr[frontier + 1])
+            if not len(visits):
+                break
+            patterns = self.stop_patterns[visits]
+            positions = self.stop_positions[visits]
+            # Each pattern is boarded at the earliest of its stops in the frontier.
+            order = np.lexsort((positions, patterns))
+            patterns, positions, visits = patterns[order], positions[order], visits[order]
+            first = np.ones(len(patterns), dtype = bool)
+            first[1:] = patterns[1:] != patterns[:-1]
+            patterns, positions = patterns[first], positions[first]
+            boards = self.pattern_stops[self.pattern_ptr[patterns] + positions]
+            starts = self.pattern_ptr[patterns] + positions + 1
+            ends = self.pattern_ptr[patterns + 1]
+            rides = _ranges(starts, ends)
+            ride_stops = self.pattern_stops[rides]
+            ride_patterns = np.repeat(patterns, ends - starts)
+            ride_boards = np.repeat(boards, ends - starts)
+            new = ~reached[ride_stops]
+            ride_stops, unique = np.unique(ride_stops[new], return_index = True)
+            leg_pattern[ride_stops] = ride_patterns[new][unique]
+            leg_board[ride_stops] = ride_boards[new][unique]
+            reached[ride_stops] = True
+            if reached[target]:
+                legs = []
+                stop = target
+                while stop != source:
+                    p = leg_pattern[stop]
+                    legs.append((self.services[p], self.directions[p], self.stops[leg_board[stop]], self.stops[stop]))
+                    stop = leg_board[stop]
+                return pd.DataFrame(legs[::-1], columns = ['ServiceNo', 'Direction', 'Board', 'Alight'])
+            frontier = ride_stops
+        return pd.DataFrame(columns = ['ServiceNo', 'Direction', 'Board', 'Alight'])
+
+    def reachable(self, origin, n_stops):
+        """
+        Returns a Pandas Series of the bus stops reachable from a bus stop within n_stops stops along any services, with the fewest number of stops to each.
+        """
+        source = self._stop(origin)
+        hops = np.full(len(self.stops), -1, dtype = np.int64)
+        hops[source] = 0
+        frontier = np.array([source])
+        for hop in range(1, n_stops + 1):
+            neighbours = self.indices[_ranges(self.indptr[frontier], self.indptr[frontier + 1])]
+            frontier = np.unique(neighbours[hops[neighbours] < 0])
+            if not len(frontier):
+                break
+            hops[frontier] = hop
+        found = np.flatnonzero(hops >= 0)
+        found = found[np.argsort(hops[found], kind = 'stable')]
+        return pd.Series(hops[found], index = self.stops[found], name = 'Stops')
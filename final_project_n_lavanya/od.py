@@ -0,0 +1,191 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+HOURS = 24
+
+# One sparse origin-destination matrix in compressed sparse row form: the destinations of origin i are indices[indptr[i]:indptr[i + 1]], with their trip counts in data.
+CSRMatrix = namedtuple('CSRMatrix', ['indptr', 'indices', 'data', 'shape'])
+
+def _labels(column):
+    """
+    Returns the distinct values of a column as strings, reading only the categories of a categorical column.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.categories.astype(str).to_numpy()
+    return column.astype(str).unique()
+
+def _positions(column, index):
+    """
+    Returns the position in an index of every value of a column, mapping only the categories of a categorical column.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return index.get_indexer(column.cat.categories.astype(str))[column.cat.codes.to_numpy()].astype(np.int64)
+    return index.get_indexer(column.astype(str)).astype(np.int64)
+
+class ODCube:
+    """
+    Origin-destination passenger volumes as one sparse matrix per day type and hour, over a dense integer index of the stop or station codes.
+    
+    The nonzero entries of every matrix are stored back to back, sorted by day type, hour and origin, so that rows, columns and blocks of any selection of day types and hours are aggregated with vectorized NumPy operations.
+    
+    Build it with ODCube.from_frame from the output of get_pass_vol_odbus or get_pass_vol_odtrain with download = True.
+    
+    Examples
+    --------
+    >>> cube = ODCube.from_frame(get_pass_vol_odbus([YOUR_API_KEY], '202011', download = True))
+    >>> cube.top_destinations('01012', n = 5, day_type = 'WEEKDAY', hours = range(7, 10))
+    >>> cube.flows(planning_areas, day_type = 'WEEKDAY')
+    
+    """
+    def __init__(self, codes, day_types, indptr, indices, data):
+        self.codes = pd.Index(codes)
+        self.day_types = pd.Index(day_types)
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self._transposed = None
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Returns an ODCube built from a dataframe with the DAY_TYPE, TIME_PER_HOUR, ORIGIN_PT_CODE, DESTINATION_PT_CODE and TOTAL_TRIPS columns of the origin-destination passenger volume files.
+        Trips of repeated (day type, hour, origin, destination) rows are added up.
+        """
+        codes = pd.Index(np.union1d(_labels(df.ORIGIN_PT_CODE), _labels(df.DESTINATION_PT_CODE)))
+        day_types = pd.Index(np.sort(_labels(df.DAY_TYPE)))
+        matrix = _positions(df.DAY_TYPE, day_types) * HOURS + df.TIME_PER_HOUR.to_numpy().astype(np.int64)
+        return cls._from_entries(codes, day_types, matrix, _positions(df.ORIGIN_PT_CODE, codes), _positions(df.DESTINATION_PT_CODE, codes), df.TOTAL_TRIPS.to_numpy())
+
+    @classmethod
+    def _from_entries(cls, codes, day_types, matrix, origin, destination, trips):
+        """
+        Returns an ODCube built from arrays of matrix position, origin index, destination index and trips, one element per entry.
+        """
+        n = len(codes)
+        index_dtype = np.uint16 if n <= np.iinfo(np.uint16).max else np.int32
+        # Every entry gets a single sort key, so that repeated cells end up next to each other and can be added up.
+        key = (matrix.astype(np.int64) * n + origin) * n + destination
+        key, first = np.unique(key, return_inverse = True)
+        data = np.bincount(first, weights = trips, minlength = len(key)).astype(np.int32)
+        indices = (key % n).astype(index_dtype)
+        matrices = len(day_types) * HOURS
+        row_pointers = np.concatenate([[0], np.cumsum(np.bincount(key // n, minlength = matrices * n))])
+        indptr = row_pointers[np.arange(matrices)[:, None] * n + np.arange(n + 1)[None, :]]
+        return cls(codes, day_types, indptr, indices, data)
+
+    def transpose(self):
+        """
+        Returns the cube with origins and destinations swapped, so that column queries become row queries. It is built once and kept.
+        """
+        if self._transposed is None:
+            matrices = np.arange(len(self.day_types) * HOURS)
+            positions, origins = self._entries(matrices)
+            matrix = np.repeat(matrices, self.indptr[:, -1] - self.indptr[:, 0])
+            self._transposed = self._from_entries(self.codes, self.day_types, matrix, self.indices[positions].astype(np.int64), origins, self.data[positions])
+            self._transposed._transposed = self
+        return self._transposed
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes used by the arrays of the cube.
+        """
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
+
+    def _matrices(self, day_type = None, hours = None):
+        """
+        Returns the positions of the matrices of the selected day type(s) and hours.
+        """
+        day_types = self.day_types if day_type is None else [day_type] if isinstance(day_type, str) else day_type
+        days = self.day_types.get_indexer(day_types)
+        assert (days >= 0).all(), f"Please ensure that the day type is one of {', '.join(self.day_types)}."
+        hours = np.arange(HOURS) if hours is None else np.atleast_1d(np.asarray(list(hours) if isinstance(hours, range) else hours))
+        assert ((hours >= 0) & (hours < HOURS)).all(), f"Please ensure that the hours are between 0 and {HOURS - 1}."
+        return (days[:, None] * HOURS + hours[None, :]).ravel()
+
+    def _entries(self, matrices):
+        """
+        Returns the positions of the nonzero entries of the given matrices, with the origin of each entry.
+        """
+        starts = self.indptr[matrices, 0]
+        ends = self.indptr[matrices, -1]
+        lengths = ends - starts
+        positions = np.repeat(ends - lengths.cumsum(), lengths) + np.arange(lengths.sum())
+        row_lengths = np.diff(self.indptr[matrices], axis = 1).ravel()
+        origins = np.repeat(np.tile(np.arange(len(self.codes)), len(matrices)), row_lengths)
+        return positions, origins
+
+    def matrix(self, day_type, hour):
+        """
+        Returns the origin-destination matrix of a day type and hour as a CSRMatrix.
+        """
+        m = self._matrices(day_type, [hour])[0]
+        indptr = self.indptr[m]
+        return CSRMatrix(indptr - indptr[0], self.indices[indptr[0]:indptr[-1]], self.data[indptr[0]:indptr[-1]], (len(self.codes), len(self.codes)))
+
+    def origin_totals(self, day_type = None, hours = None):
+        """
+        Returns a Pandas Series of the trips from every origin over the selected day type(s) and hours (by default, all of them).
+        """
+        totals = np.zeros(len(self.codes), dtype = np.int64)
+        for indptr in self.indptr[self._matrices(day_type, hours)]:
+            start, end = indptr[0], indptr[-1]
+            if start == end:
+                continue
+            sums = np.add.reduceat(self.data[start:end].astype(np.int64), np.minimum(indptr[:-1], end - 1) - start)
+            sums[indptr[1:] == indptr[:-1]] = 0
+            totals += sums
+        return pd.Series(totals, index = self.codes)
+
+    def destination_totals(self, day_type = None, hours = None):
+        """
+        Returns a Pandas Series of the trips to every destination over the selected day type(s) and hours (by default, all of them).
+        The first column query builds the transposed cube, doubling the memory used.
+        """
+        return self.transpose().origin_totals(day_type, hours)
+
+    def top_destinations(self, origin, n = 10, day_type = None, hours = None):
+        """
+        Returns a Pandas Series of the n destinations with the most trips from an origin over the selected day type(s) and hours, in descending order.
+        """
+        o = self.codes.get_loc(origin)
+        indptr = self.indptr[self._matrices(day_type, hours)]
+        lengths = indptr[:, o + 1] - indptr[:, o]
+        positions = np.repeat(indptr[:, o + 1] - lengths.cumsum(), lengths) + np.arange(lengths.sum())
+        totals = np.bincount(self.indices[positions], weights = self.data[positions], minlength = len(self.codes))
+        return self._top(totals, n)
+
+    def top_origins(self, destination, n = 10, day_type = None, hours = None):
+        """
+        Returns a Pandas Series of the n origins with the most trips to a destination over the selected day type(s) and hours, in descending order.
+        The first column query builds the transposed cube, doubling the memory used.
+        """
+        return self.transpose().top_destinations(destination, n, day_type, hours)
+
+    def _top(self, totals, n):
+        top = np.argsort(-totals, kind = 'stable')[:n]
+        top = top[totals[top] > 0]
+        return pd.Series(totals[top].astype(np.int64), index = self.codes[top])
+
+    def flows(self, groups, day_type = None, hours = None):
+        """
+        Returns a Pandas DataFrame of the trips between groups of stops or stations (e.g. planning areas) over the selected day type(s) and hours, with origin groups as rows and destination groups as columns.
+        
+        Parameters
+        ----------
+        groups: dict or Pandas Series
+            Mapping of stop or station code to group label. Codes that are not mapped are left out.
+        
+        """
+        labels = pd.Series(groups).reindex(self.codes)
+        group_codes, group_labels = pd.factorize(labels)
+        g = len(group_labels)
+        positions, origins = self._entries(self._matrices(day_type, hours))
+        origin_groups = group_codes[origins]
+        destination_groups = group_codes[self.indices[positions]]
+        mask = (origin_groups >= 0) & (destination_groups >= 0)
+        cells = origin_groups[mask].astype(np.int64) * g + destination_groups[mask]
+        totals = np.bincount(cells, weights = self.data[positions[mask]], minlength = g * g).reshape(g, g)
+        return pd.DataFrame(totals.astype(np.int64), index = group_labels, columns = group_labels)
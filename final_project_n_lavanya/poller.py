@@ -0,0 +1,95 @@
+import pandas as pd
+
+from . import final_project_n_lavanya
+
+# Natural key of the rows of each polled feed.
+NATURAL_KEYS = {
+    'traffic_incidents': ['Message', 'Latitude', 'Longitude'],
+    'carpark_availability': ['CarParkID', 'LotType'],
+    'traffic_speed_bands': ['LinkID'],
+}
+
+# Columns that change on every poll regardless of content, and are therefore not compared.
+IGNORED_COLUMNS = ['Date and Time Accessed']
+
+class DeltaPoller:
+    """
+    Polls a real-time feed and returns only the rows inserted, updated or removed since the previous poll.
+    
+    Only the previous snapshot is kept, indexed by the natural key of the feed, with a 64-bit hash of every row, so that memory stays bounded by the size of one snapshot.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    feed: str
+        Character input; one of 'traffic_incidents', 'carpark_availability' and 'traffic_speed_bands'.
+    
+    key: list of str
+        The columns identifying a row across polls.
+        By default, this is set to None so that the natural key of the feed in NATURAL_KEYS is used.
+    
+    **kwargs
+        Keyword arguments passed on to the get_* function of the feed, e.g. workers.
+    
+    Examples
+    --------
+    >>> poller = DeltaPoller([YOUR_API_KEY], 'traffic_speed_bands', workers = 8)
+    >>> delta = poller.poll()
+    >>> delta[delta.Change == 'update']
+    
+    """
+    def __init__(self, api_key, feed, key = None, **kwargs):
+        assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+        assert feed in NATURAL_KEYS, f"Please ensure that the feed is one of {', '.join(NATURAL_KEYS)}."
+        self.api_key = api_key
+        self.fetch = getattr(final_project_n_lavanya, f'get_{feed}')
+        self.key = list(key or NATURAL_KEYS[feed])
+        self.kwargs = kwargs
+        self.previous = None
+        self._hashes = None
+
+    def poll(self):
+        """
+        Fetches the feed and returns its delta against the previous poll (see diff).
+        """
+        return self.diff(self.fetch(self.api_key, **self.kwargs))
+
+    def diff(self, df):
+        """
+        Returns the delta of a snapshot against the previous one and keeps it as the new previous snapshot.
+        
+        Parameters
+        ----------
+        df: Pandas DataFrame
+            The new snapshot of the feed.
+        
+        Returns
+        -------
+        Pandas DataFrame
+            The output is a dataframe of the inserted and updated rows, as they are in the new snapshot, followed by the removed rows, as they were in the previous one.
+            A categorical Change column holds 'insert', 'update' or 'remove'. On the first poll every row is inserted.
+        
+        """
+        df = df.drop_duplicates(self.key, keep = 'last').set_index(self.key)
+        compared = df.drop(columns = [c for c in IGNORED_COLUMNS if c in df.columns])
+        hashes = pd.util.hash_pandas_object(compared, index = False)
+        if self.previous is None:
+            inserted = pd.Series(True, index = df.index)
+            updated = ~inserted
+            removed = pd.Series(dtype = bool)
+        else:
+            previous_hashes = self._hashes.reindex(df.index)
+            inserted = previous_hashes.isna()
+            updated = ~inserted & (previous_hashes != hashes)
+            removed = ~self.previous.index.isin(df.index)
+        parts = [df[inserted.to_numpy()].assign(Change = 'insert'), df[updated.to_numpy()].assign(Change = 'update')]
+        if self.previous is not None:
+            parts.append(self.previous[removed].assign(Change = 'remove'))
+        delta = pd.concat(parts).reset_index()
+        delta['Change'] = pd.Categorical(delta.Change, categories = ['insert', 'update', 'remove'])
+        self.previous = df
+        self._hashes = hashes
+        return delta
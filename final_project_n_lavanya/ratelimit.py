@@ -0,0 +1,209 @@
+import email.utils
+import math
+import random
+import threading
+import time
+
+# Status codes of responses that are retried: throttled requests, and server errors that are usually transient.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+def _retry_after(r):
+    """
+    Returns the number of seconds a response asks clients to wait through its Retry-After header, or 0 if it does not.
+    """
+    value = r.headers.get('Retry-After')
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+class RateLimiter:
+    """
+    A token bucket shared by every thread sending requests through a DataMall client, whose rate adapts to throttling and which retries throttled and failed requests.
+    
+    Requests start at most rate per second on average, with bursts of up to burst requests. The rate grows exponentially with successful responses until the first throttled or failed one,
+    and additively afterwards, by about increase requests per second every second, but only with requests that had to wait for a token, so that a light workload does not raise it past what the server was seen to accept; it is multiplied by decrease on a throttled (429) or server error (5xx) response, once per round of requests in flight.
+    Throttled and failed requests are retried up to retries times after a jittered exponential backoff, and a Retry-After time sent with a response holds back every thread.
+    
+    Parameters
+    ----------
+    rate: float
+        Numeric input; this is the number of requests started per second to begin with.
+        By default, this is set to 10.
+    
+    burst: int
+        Integer input; this is the number of requests that can start at once after a pause.
+        By default, this is set to None so that it is the initial rate rounded up.
+    
+    min_rate: float
+        Numeric input; this is the lowest rate the limiter backs off to.
+        By default, this is set to 1.
+    
+    max_rate: float
+        Numeric input; this is the highest rate the limiter grows to.
+        By default, this is set to None so that the rate is not capped.
+    
+    increase: float
+        Numeric input; this is the number of requests per second added to the rate per second of successful requests once throttled.
+        By default, this is set to 10.
+    
+    decrease: float
+        Numeric input between 0 and 1; this is the factor the rate is multiplied by on a throttled or server error response.
+        By default, this is set to 0.7.
+    
+    retries: int
+        Integer input; this is the number of times a throttled or failed request is retried before its response is returned as is.
+        By default, this is set to 5.
+    
+    backoff: float
+        Numeric input; this is the longest wait in seconds before the first retry, doubled for each further retry.
+        By default, this is set to 0.5.
+    
+    max_backoff: float
+        Numeric input; this is the longest wait in seconds before any retry.
+        By default, this is set to 30.
+    
+    Examples
+    --------
+    >>> limiter = RateLimiter(rate = 20, max_rate = 100)
+    >>> client = DataMall(limiter = limiter)
+    >>> arrivals, failures = client.get_bus_arrivals_many([YOUR_API_KEY], stop_codes, workers = 32)
+    >>> limiter.stats()
+    
+    """
+    def __init__(self, rate = 10, burst = None, min_rate = 1, max_rate = None, increase = 10, decrease = 0.7, retries = 5, backoff = 0.5, max_backoff = 30):
+        assert rate > 0 and min_rate > 0, "Please ensure that the rates are entered as positive numbers."
+        assert max_rate is None or max_rate >= min_rate, "Please ensure that the maximum rate is at least the minimum rate."
+        assert 0 < decrease < 1, "Please ensure that the decrease is entered as a number between 0 and 1."
+        assert isinstance(retries, int) and retries >= 0, "Please ensure that the number of retries is entered as a non-negative integer."
+        self.rate = rate
+        self.burst = burst or math.ceil(rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.requests = 0
+        self.successes = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.retried = 0
+        self.waited = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._decreased = self._updated
+        self._started = None
+        self._throttled_once = False
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # The lock cannot be pickled; a copy sent to another process gets its own.
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Waits until a request may start, and returns the time it was allowed to start.
+        A token is taken under the lock and the wait happens outside it, so waiting threads start one after another at the current rate.
+        """
+        return self._acquire()[0]
+
+    def _acquire(self):
+        """
+        Waits until a request may start, and returns the time it was allowed to start and whether it had to wait for a token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.requests += 1
+            self.waited += delay
+            if self._started is None:
+                self._started = now
+        if delay:
+            time.sleep(delay)
+        return now + delay, delay > 0
+
+    def record(self, status, sent, retry_after = 0.0, limited = True):
+        """
+        Adapts the rate to the status of a response to a request started at the time sent, and pauses every thread for retry_after seconds.
+        Responses to requests started before the last decrease do not decrease the rate again, so that one burst of throttled requests decreases it once.
+        Successful responses only increase the rate if their request was limited, i.e. had to wait for a token.
+        """
+        with self._lock:
+            if status not in RETRY_STATUSES:
+                self.successes += 1
+                if not limited:
+                    return
+                # Until the first throttled response, each success adds one request per second, doubling the rate about every 0.7 seconds to find the limit quickly.
+                rate = self.rate + (self.increase / self.rate if self._throttled_once else 1)
+                self.rate = rate if self.max_rate is None else min(self.max_rate, rate)
+                return
+            if status == 429:
+                self.throttled += 1
+            else:
+                self.server_errors += 1
+            self._throttled_once = True
+            if sent >= self._decreased:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._decreased = time.monotonic()
+                # Tokens saved up at the old rate would let a burst through right after being throttled.
+                self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._tokens = min(self._tokens, 0.0) - retry_after * self.rate
+
+    def delay(self, attempt):
+        """
+        Returns the number of seconds to wait before a retry, a random time up to the exponential backoff of the attempt (full jitter), so that threads throttled together do not retry together.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def send(self, request):
+        """
+        Sends a request through the limiter, retrying it while its response is throttled or a server error, and returns the last response.
+        
+        Parameters
+        ----------
+        request: function
+            A function of no arguments sending the request and returning its response, e.g. lambda: session.get(url).
+        
+        """
+        for attempt in range(self.retries + 1):
+            sent, limited = self._acquire()
+            r = request()
+            retry_after = _retry_after(r) if r.status_code in RETRY_STATUSES else 0.0
+            self.record(r.status_code, sent, retry_after, limited)
+            if r.status_code not in RETRY_STATUSES or attempt == self.retries:
+                return r
+            r.close()
+            with self._lock:
+                self.retried += 1
+            # The Retry-After time is waited for in acquire, where it holds back every thread and not only this one.
+            time.sleep(self.delay(attempt))
+        return r
+
+    def stats(self):
+        """
+        Returns a dictionary of the counters of requests sent, successful, throttled, server errors and retries, the seconds spent waiting for a token,
+        the current rate and the achieved rate of successful requests per second since the first request.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started if self._started is not None else 0.0
+            return {'requests': self.requests, 'successes': self.successes, 'throttled': self.throttled, 'server_errors': self.server_errors,
+                    'retries': self.retried, 'waited': self.waited, 'rate': self.rate,
+                    'achieved_rate': self.successes / elapsed if elapsed else 0.0}
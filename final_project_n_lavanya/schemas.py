@@ -0,0 +1,74 @@
+from .lazy import LazyModule
+
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+
+# The dtype of each column of each DataMall endpoint's dataframe. 'datetime' columns are parsed into datetime64, integer columns holding
+# missing values fall back to float32, and columns not listed here, such as identifiers and free text, are left as they are.
+SCHEMAS = {
+    'BusServices': {'Operator': 'category', 'Direction': 'int8', 'Category': 'category', 'LoopDesc': 'category'},
+    'BusRoutes': {'ServiceNo': 'category', 'Operator': 'category', 'Direction': 'int8', 'StopSequence': 'int16', 'BusStopCode': 'category',
+                  'Distance': 'float32', 'WD_FirstBus': 'category', 'WD_LastBus': 'category', 'SAT_FirstBus': 'category',
+                  'SAT_LastBus': 'category', 'SUN_FirstBus': 'category', 'SUN_LastBus': 'category'},
+    'BusStops': {'RoadName': 'category', 'Latitude': 'float32', 'Longitude': 'float32'},
+    'Taxi-Availability': {'Latitude': 'float32', 'Longitude': 'float32'},
+    'TaxiStands': {'Latitude': 'float32', 'Longitude': 'float32', 'Bfa': 'category', 'Ownership': 'category', 'Type': 'category'},
+    'CarParkAvailabilityv2': {'Area': 'category', 'Development': 'category', 'AvailableLots': 'int16', 'LotType': 'category',
+                              'Agency': 'category', 'Latitude': 'float32', 'Longitude': 'float32'},
+    'ERPRates': {'VehicleType': 'category', 'DayType': 'category', 'StartTime': 'category', 'EndTime': 'category', 'ZoneID': 'category',
+                 'ChargeAmount': 'float32', 'EffectiveDate': 'datetime'},
+    'EstTravelTimes': {'Name': 'category', 'Direction': 'int8', 'FarEndPoint': 'category', 'StartPoint': 'category', 'EndPoint': 'category',
+                       'EstTime': 'int16'},
+    'FaultyTrafficLights': {'Type': 'int8', 'StartDate': 'datetime', 'EndDate': 'datetime'},
+    'RoadOpenings': {'StartDate': 'datetime', 'EndDate': 'datetime', 'SvcDept': 'category', 'RoadName': 'category'},
+    'RoadWorks': {'StartDate': 'datetime', 'EndDate': 'datetime', 'SvcDept': 'category', 'RoadName': 'category'},
+    'Traffic_Imagesv2': {'Latitude': 'float32', 'Longitude': 'float32'},
+    'TrafficIncidents': {'Type': 'category', 'Latitude': 'float32', 'Longitude': 'float32'},
+    'TrafficSpeedBandsv2': {'RoadName': 'category', 'RoadCategory': 'category', 'SpeedBand': 'int8', 'MinimumSpeed': 'int16',
+                            'MaximumSpeed': 'int16', 'Latitude': 'float32', 'Longitude': 'float32'},
+    'VMS': {'Latitude': 'float32', 'Longitude': 'float32'},
+    'BicycleParkingv2': {'Latitude': 'float32', 'Longitude': 'float32', 'RackType': 'category', 'RackCount': 'int16', 'ShelterIndicator': 'category'},
+    'FacilitiesMaintenance': {'Line': 'category', 'StationCode': 'category', 'StationName': 'category'},
+}
+
+def _cast(column, dtype):
+    if dtype == 'category':
+        return column.astype('category')
+    if dtype == 'datetime':
+        return pd.to_datetime(column, errors = 'coerce')
+    values = pd.to_numeric(column, errors = 'coerce')
+    if np.issubdtype(np.dtype(dtype), np.integer) and values.isna().any():
+        return values.astype(np.float32)
+    return values.astype(dtype)
+
+def apply_schema(df, endpoint):
+    """
+    Returns a copy of a dataframe of a DataMall endpoint with its columns cast to the compact dtypes of SCHEMAS.
+    Columns missing from the dataframe are skipped, and endpoints without a schema are returned unchanged.
+    
+    Examples
+    --------
+    >>> apply_schema(pd.DataFrame(records), 'BusRoutes')
+    
+    """
+    schema = SCHEMAS.get(endpoint, {})
+    columns = {name: _cast(df[name], dtype) for name, dtype in schema.items() if name in df.columns}
+    return df.assign(**columns) if columns else df
+
+def memory_report(df, endpoint):
+    """
+    Returns a Pandas DataFrame comparing the dtype and memory in bytes of each column of a dataframe of a DataMall endpoint before and after apply_schema, with a Total row.
+    Pass the frame as built from the JSON records, e.g. from a client created with DataMall(typed = False).
+    
+    Examples
+    --------
+    >>> with DataMall(typed = False):
+    ...     memory_report(get_bus_routes([YOUR_API_KEY]), 'BusRoutes')
+    
+    """
+    typed = apply_schema(df, endpoint)
+    report = pd.DataFrame({'DtypeBefore': df.dtypes.astype(str), 'DtypeAfter': typed.dtypes.astype(str),
+                           'BytesBefore': df.memory_usage(index = False, deep = True), 'BytesAfter': typed.memory_usage(index = False, deep = True)})
+    report.loc['Total'] = ['', '', report.BytesBefore.sum(), report.BytesAfter.sum()]
+    report['Ratio'] = (report.BytesAfter / report.BytesBefore).round(3)
+    return report
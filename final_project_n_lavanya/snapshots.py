@@ -0,0 +1,144 @@
+import json
+import os
+import time
+
+from . import final_project_n_lavanya
+
+# Static datasets that can be kept on disk, by name, with the get_* function that fetches them.
+DATASETS = {
+    'bus_routes': 'get_bus_routes',
+    'bus_stops': 'get_bus_stops',
+    'bus_services': 'get_bus_services',
+    'taxi_stands': 'get_taxi_stands',
+    'erp_rates': 'get_erp_rates',
+}
+
+def _feather():
+    try:
+        from pyarrow import feather
+    except ImportError:
+        raise ImportError("Snapshots are stored in the Feather format, which requires pyarrow. Please install it with `pip install pyarrow`.")
+    return feather
+
+class SnapshotStore:
+    """
+    An on-disk store of the static datasets (bus routes, bus stops, bus services, taxi stands and ERP rates), so that they need not be downloaded again after a restart.
+    
+    Each dataset is written as an uncompressed Feather file next to a JSON sidecar holding the fetch time and row count.
+    Read as a pyarrow Table, a snapshot is memory-mapped without copying, so that only the pages that are used are read from disk; read as a Pandas DataFrame, its columns are copied out of the map once.
+    Requires pyarrow.
+    
+    Parameters
+    ----------
+    directory: str
+        Character input; this is the directory the snapshots are written to. It is created if it does not exist.
+    
+    max_age: float
+        Numeric input; this is the age in seconds after which a snapshot is fetched again when loaded.
+        By default, this is set to 86400 (a day).
+    
+    Examples
+    --------
+    >>> store = SnapshotStore('~/.cache/datamall')
+    >>> store.load('bus_routes', [YOUR_API_KEY], workers = 8)
+    >>> store.load('bus_routes', [YOUR_API_KEY], output = 'arrow')
+    >>> store.refresh('erp_rates', [YOUR_API_KEY])
+    
+    """
+    def __init__(self, directory, max_age = 86400):
+        assert isinstance(directory, str), "Please ensure that the directory is entered as a string."
+        self.directory = os.path.expanduser(directory)
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok = True)
+
+    def _path(self, name, extension):
+        assert name in DATASETS, f"Please ensure that the dataset is one of {', '.join(DATASETS)}."
+        return os.path.join(self.directory, f'{name}.{extension}')
+
+    def metadata(self, name):
+        """
+        Returns the sidecar of a snapshot, a dictionary holding its fetch time (as a Unix timestamp) and row count, or None if there is no snapshot.
+        """
+        try:
+            with open(self._path(name, 'json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def is_fresh(self, name, max_age = None):
+        """
+        Returns whether a snapshot exists and is younger than max_age seconds (by default, the max_age of the store).
+        """
+        meta = self.metadata(name)
+        max_age = self.max_age if max_age is None else max_age
+        return meta is not None and time.time() - meta['fetched_at'] < max_age and os.path.exists(self._path(name, 'feather'))
+
+    def save(self, name, df):
+        """
+        Writes a dataframe, or a pyarrow Table, as the snapshot of a dataset, replacing any previous snapshot.
+        """
+        feather = _feather()
+        import pyarrow as pa
+        path = self._path(name, 'feather')
+        # Files are written under temporary names and then renamed, so a reader never sees a partial snapshot.
+        feather.write_feather(df if isinstance(df, pa.Table) else df.reset_index(drop = True), f'{path}.tmp', compression = 'uncompressed')
+        os.replace(f'{path}.tmp', path)
+        with open(self._path(name, 'json.tmp'), 'w') as f:
+            json.dump({'fetched_at': time.time(), 'rows': len(df)}, f)
+        os.replace(self._path(name, 'json.tmp'), self._path(name, 'json'))
+
+    def read(self, name, output = 'pandas'):
+        """
+        Returns the snapshot of a dataset as a Pandas DataFrame, or as a pyarrow Table with output = 'arrow'.
+        The table is a memory map of the file, whose columns are not copied into memory. The dataframe is converted from it one column at a time,
+        without consolidating columns of the same dtype into blocks (split_blocks) and releasing each Arrow column once converted (self_destruct), so that the data is copied once.
+        """
+        assert output in ('pandas', 'arrow'), "Please ensure that the output is either 'pandas' or 'arrow'."
+        table = _feather().read_table(self._path(name, 'feather'), memory_map = True)
+        if output == 'arrow':
+            return table
+        return table.to_pandas(split_blocks = True, self_destruct = True)
+
+    def refresh(self, name, api_key, **kwargs):
+        """
+        Fetches a dataset with its get_* function, passing on any keyword arguments (such as output = 'arrow'), writes it as the snapshot and returns it.
+        """
+        df = getattr(final_project_n_lavanya, DATASETS[name])(api_key, **kwargs)
+        self.save(name, df)
+        return df
+
+    def load(self, name, api_key, refresh = False, max_age = None, output = 'pandas', **kwargs):
+        """
+        Returns a dataset, read from its snapshot if it is fresh and otherwise fetched and written as the new snapshot.
+        
+        Parameters
+        ----------
+        name: str
+            Character input; one of 'bus_routes', 'bus_stops', 'bus_services', 'taxi_stands' and 'erp_rates'.
+        
+        api_key: str
+            Character input.
+            Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+        
+        refresh: bool
+            Boolean input; whether to fetch the dataset even if its snapshot is fresh.
+            By default, this is set to False.
+        
+        max_age: float
+            Numeric input; this is the age in seconds after which the snapshot is fetched again.
+            By default, this is set to None so that the max_age of the store is used.
+        
+        output: str
+            Character input; either 'pandas' for a dataframe or 'arrow' for a pyarrow Table, which is memory-mapped when read from the snapshot (see read).
+            By default, this is set to 'pandas'.
+        
+        Returns
+        -------
+        Pandas DataFrame
+            The output is the dataframe returned by the get_* function of the dataset, or its table with output = 'arrow'.
+        
+        """
+        assert output in ('pandas', 'arrow'), "Please ensure that the output is either 'pandas' or 'arrow'."
+        if refresh or not self.is_fresh(name, max_age):
+            return self.refresh(name, api_key, output = output, **kwargs)
+        return self.read(name, output)
@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6371.0088
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Returns the great-circle distance in kilometres between points given in degrees, broadcasting over arrays.
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype = np.float64)) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1)))
+
+class SpatialIndex:
+    """
+    A uniform grid index over points given in latitude and longitude, for batched nearest-neighbour and radius queries.
+    
+    Points are projected onto a plane around their mean latitude, which is accurate to well under a metre over an area the size of Singapore, and bucketed into square cells.
+    A query only looks at the cells around it, and distances of the candidates found are computed with the haversine formula.
+    
+    Parameters
+    ----------
+    lat: array-like
+        The latitudes of the points, in degrees.
+    
+    lon: array-like
+        The longitudes of the points, in degrees.
+    
+    cell_km: float
+        Numeric input; this is the side of a grid cell in kilometres.
+        By default, this is set to 0.5.
+    
+    Examples
+    --------
+    >>> stops = get_bus_stops([YOUR_API_KEY])
+    >>> index = SpatialIndex.from_frame(stops)
+    >>> distances, positions = index.knn([1.3521, 1.2834], [103.8198, 103.8607], k = 5)
+    >>> index.nearest(stops, 1.3521, 103.8198, k = 5)
+    
+    """
+    def __init__(self, lat, lon, cell_km = 0.5):
+        self.lat = np.asarray(lat, dtype = np.float64)
+        self.lon = np.asarray(lon, dtype = np.float64)
+        assert self.lat.shape == self.lon.shape and self.lat.ndim == 1, "Please ensure that the latitudes and longitudes are one-dimensional arrays of the same length."
+        self.cell_km = cell_km
+        self._lat0 = np.radians(self.lat.mean()) if len(self.lat) else 0.0
+        x, y = self._project(self.lat, self.lon)
+        self._x0 = x.min() if len(x) else 0.0
+        self._y0 = y.min() if len(y) else 0.0
+        cx, cy = self._cells(x, y)
+        self._nx = int(cx.max()) + 1 if len(cx) else 1
+        self._ny = int(cy.max()) + 1 if len(cy) else 1
+        cell = cy * self._nx + cx
+        self._order = np.argsort(cell, kind = 'stable')
+        # The points of cell c are self._order[self._cell_ptr[c]:self._cell_ptr[c + 1]].
+        self._cell_ptr = np.concatenate([[0], np.cumsum(np.bincount(cell, minlength = self._nx * self._ny))])
+
+    @classmethod
+    def from_frame(cls, df, lat = 'Latitude', lon = 'Longitude', cell_km = 0.5):
+        """
+        Returns a SpatialIndex over the rows of a dataframe, such as the output of get_bus_stops, get_taxi_stands or get_carpark_availability.
+        Coordinates held as strings are converted to numbers; positions returned by queries are row positions in the dataframe.
+        """
+        return cls(pd.to_numeric(df[lat]).to_numpy(), pd.to_numeric(df[lon]).to_numpy(), cell_km)
+
+    def __len__(self):
+        return len(self.lat)
+
+    def _project(self, lat, lon):
+        return EARTH_RADIUS_KM * np.radians(lon) * np.cos(self._lat0), EARTH_RADIUS_KM * np.radians(lat)
+
+    def _cells(self, x, y):
+        return np.floor((x - self._x0) / self.cell_km).astype(np.int64), np.floor((y - self._y0) / self.cell_km).astype(np.int64)
+
+    def _candidates(self, cx, cy, ring):
+        """
+        Returns the positions of the points in the square of cells within ring cells of cell (cx, cy).
+        """
+        x0, x1 = max(cx - ring, 0), min(cx + ring, self._nx - 1)
+        y0, y1 = max(cy - ring, 0), min(cy + ring, self._ny - 1)
+        if x0 > x1 or y0 > y1:
+            return self._order[:0]
+        rows = np.arange(y0, y1 + 1) * self._nx
+        starts = self._cell_ptr[rows + x0]
+        ends = self._cell_ptr[rows + x1 + 1]
+        lengths = ends - starts
+        # Each row of the square is a contiguous run of cells, and hence of points.
+        return self._order[np.repeat(ends - lengths.cumsum(), lengths) + np.arange(lengths.sum())]
+
+    def _query_cells(self, lat, lon):
+        lat = np.atleast_1d(np.asarray(lat, dtype = np.float64))
+        lon = np.atleast_1d(np.asarray(lon, dtype = np.float64))
+        assert lat.shape == lon.shape, "Please ensure that there are as many latitudes as longitudes."
+        cx, cy = self._cells(*self._project(lat, lon))
+        return lat, lon, cx, cy
+
+    def knn(self, lat, lon, k = 5):
+        """
+        Returns the k nearest points to each query point.
+        
+        Parameters
+        ----------
+        lat: float or array-like
+            The latitudes of the query points, in degrees.
+        
+        lon: float or array-like
+            The longitudes of the query points, in degrees.
+        
+        k: int
+            Integer input; this is the number of neighbours returned per query point.
+            By default, this is set to 5.
+        
+        Returns
+        -------
+        tuple of NumPy arrays
+            The distances in kilometres and the positions of the neighbours, each of shape (number of query points, k), nearest first.
+            When there are fewer than k points, the remaining distances are inf and positions -1.
+        
+        """
+        lat, lon, cx, cy = self._query_cells(lat, lon)
+        k = min(k, len(self)) if len(self) else 0
+        distances = np.full((len(lat), k), np.inf)
+        positions = np.full((len(lat), k), -1, dtype = np.int64)
+        if k == 0:
+            return distances, positions
+        for i in range(len(lat)):
+            # The square of cells within max_ring of the query cell covers the whole grid, even when the query point lies outside it.
+            max_ring = max(cx[i], self._nx - 1 - cx[i], cy[i], self._ny - 1 - cy[i])
+            # Start from the ring of cells that holds about k points on average, and grow it until the k-th nearest candidate lies within the searched square.
+            ring = max(int(np.sqrt(k * self._nx * self._ny / len(self)) / 2), 1)
+            while True:
+                candidates = self._candidates(cx[i], cy[i], ring)
+                if len(candidates) >= k or ring >= max_ring:
+                    d = haversine(lat[i], lon[i], self.lat[candidates], self.lon[candidates])
+                    nearest = np.argpartition(d, k - 1)[:k] if len(d) > k else np.arange(len(d))
+                    kth = d[nearest].max() if len(nearest) else np.inf
+                    if kth <= ring * self.cell_km or ring >= max_ring:
+                        break
+                    ring = int(np.ceil(kth / self.cell_km))
+                else:
+                    ring *= 2
+            nearest = nearest[np.argsort(d[nearest], kind = 'stable')]
+            distances[i, :len(nearest)] = d[nearest]
+            positions[i, :len(nearest)] = candidates[nearest]
+        return distances, positions
+
+    def radius(self, lat, lon, km):
+        """
+        Returns the points within a radius of each query point.
+        
+        Parameters
+        ----------
+        lat: float or array-like
+            The latitudes of the query points, in degrees.
+        
+        lon: float or array-like
+            The longitudes of the query points, in degrees.
+        
+        km: float
+            Numeric input; this is the radius of search in kilometres.
+        
+        Returns
+        -------
+        tuple of lists
+            For each query point, a NumPy array of the distances in kilometres and a NumPy array of the positions of the points within the radius, nearest first.
+        
+        """
+        lat, lon, cx, cy = self._query_cells(lat, lon)
+        ring = int(np.ceil(km / self.cell_km))
+        all_distances, all_positions = [], []
+        for i in range(len(lat)):
+            candidates = self._candidates(cx[i], cy[i], ring)
+            d = haversine(lat[i], lon[i], self.lat[candidates], self.lon[candidates])
+            within = np.flatnonzero(d <= km)
+            within = within[np.argsort(d[within], kind = 'stable')]
+            all_distances.append(d[within])
+            all_positions.append(candidates[within])
+        return all_distances, all_positions
+
+    def nearest(self, df, lat, lon, k = 5):
+        """
+        Returns the rows of the dataframe the index was built from that are nearest to a point, nearest first, with their distance in kilometres in a Distance_km column.
+        """
+        distances, positions = self.knn(lat, lon, k)
+        found = positions[0] >= 0
+        return df.iloc[positions[0][found]].assign(Distance_km = distances[0][found])
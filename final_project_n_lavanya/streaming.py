@@ -0,0 +1,299 @@
+import contextvars
+import queue
+import threading
+
+import pandas as pd
+
+from . import final_project_n_lavanya
+from .formats import OUTPUTS, from_frame
+from .history import KINDS
+
+_DONE = object()
+
+def _buffered(chunks, size):
+    """
+    Yields the items of an iterator produced in a background thread, which runs at most size items ahead of the consumer.
+    The thread blocks on a bounded queue while the consumer is slow, and stops when the generator is closed.
+    """
+    items = queue.Queue(maxsize = size)
+    stop = threading.Event()
+
+    def put(item):
+        # Waits for room in the queue, giving up once the consumer has stopped.
+        while not stop.is_set():
+            try:
+                items.put(item, timeout = 0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_DONE, e))
+        finally:
+            chunks.close()
+
+    # The thread runs in a copy of the caller's context, so that it sends its requests through the caller's active client.
+    thread = threading.Thread(target = contextvars.copy_context().run, args = (produce,), name = 'datamall-stream', daemon = True)
+    thread.start()
+    try:
+        while True:
+            chunk, error = items.get()
+            if chunk is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+    finally:
+        stop.set()
+        thread.join()
+
+def _iter_endpoint(api_key, endpoint, chunksize, output, workers, buffer):
+    assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert isinstance(chunksize, int) and chunksize >= 1, "Please ensure that the chunk size is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    assert isinstance(workers, int) and workers >= 1, "Please ensure that the number of workers is entered as a positive integer."
+    assert isinstance(buffer, int) and buffer >= 1, "Please ensure that the buffer is entered as a positive integer."
+    return _buffered(_iter_endpoint_chunks(api_key, endpoint, chunksize, output, workers), buffer)
+
+def _take(records, start, stop):
+    if isinstance(records, list):
+        return records[start:stop]
+    return {name: values[start:stop] for name, values in records.items()}
+
+def _iter_endpoint_chunks(api_key, endpoint, chunksize, output, workers):
+    """
+    Yields the chunks of a paginated endpoint, gathering the decoded records of its pages and building each chunk from them at once rather than concatenating a dataframe or table per page.
+    """
+    client = final_project_n_lavanya.current_client()
+    headers = {'AccountKey': api_key, 'accept': 'application/json'}
+    build = lambda r, records: final_project_n_lavanya._batch(client, r, records, endpoint, output)
+    records, rows = None, 0
+    for r, page, n in final_project_n_lavanya._iter_pages(client, headers, endpoint, workers):
+        records = final_project_n_lavanya._extend(records, page, rows, n)
+        rows += n
+        if rows < chunksize:
+            continue
+        start = 0
+        while rows - start >= chunksize:
+            yield build(r, _take(records, start, start + chunksize))
+            start += chunksize
+        records = _take(records, start, rows) if start < rows else None
+        rows -= start
+    if rows:
+        yield build(r, records)
+
+def iter_bus_routes(api_key, chunksize = 10000, output = 'pandas', workers = 1, buffer = 2):
+    """
+    Yields the detailed route information of get_bus_routes in chunks of chunksize rows as pages arrive, so that memory is bounded by the chunk size rather than the size of the dataset.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    chunksize: int
+        Integer input; this is the number of rows of each chunk; the last chunk may be shorter.
+        By default, this is set to 10000.
+    
+    output: str
+        Character input; this is the form of each chunk: 'pandas' for a dataframe, 'records' for a list of dicts, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    buffer: int
+        Integer input; this is the number of chunks prepared ahead of the consumer. Pages are fetched in a background thread that waits while this many chunks are ready, so that a slow consumer holds fetching back instead of letting chunks pile up.
+        By default, this is set to 2.
+    
+    Returns
+    -------
+    generator
+        The output is a generator of chunks, in order.
+    
+    Examples
+    --------
+    >>> for chunk in iter_bus_routes([YOUR_API_KEY], chunksize = 5000):
+    ...     chunk.to_csv('routes.csv', mode = 'a', header = False)
+    
+    """
+    return _iter_endpoint(api_key, 'BusRoutes', chunksize, output, workers, buffer)
+
+def iter_bus_stops(api_key, chunksize = 10000, output = 'pandas', workers = 1, buffer = 2):
+    """
+    Yields the bus stops of get_bus_stops in chunks of chunksize rows as pages arrive, so that memory is bounded by the chunk size rather than the size of the dataset.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    chunksize: int
+        Integer input; this is the number of rows of each chunk; the last chunk may be shorter.
+        By default, this is set to 10000.
+    
+    output: str
+        Character input; this is the form of each chunk: 'pandas' for a dataframe, 'records' for a list of dicts, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    buffer: int
+        Integer input; this is the number of chunks prepared ahead of the consumer. Pages are fetched in a background thread that waits while this many chunks are ready, so that a slow consumer holds fetching back instead of letting chunks pile up.
+        By default, this is set to 2.
+    
+    Returns
+    -------
+    generator
+        The output is a generator of chunks, in order.
+    
+    Examples
+    --------
+    >>> for chunk in iter_bus_stops([YOUR_API_KEY], output = 'arrow'):
+    ...     writer.write_table(chunk)
+    
+    """
+    return _iter_endpoint(api_key, 'BusStops', chunksize, output, workers, buffer)
+
+def iter_carpark_availability(api_key, chunksize = 10000, output = 'pandas', workers = 1, buffer = 2):
+    """
+    Yields the car park availability of get_carpark_availability in chunks of chunksize rows as pages arrive, so that memory is bounded by the chunk size rather than the size of the dataset.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    chunksize: int
+        Integer input; this is the number of rows of each chunk; the last chunk may be shorter.
+        By default, this is set to 10000.
+    
+    output: str
+        Character input; this is the form of each chunk: 'pandas' for a dataframe, 'records' for a list of dicts, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    buffer: int
+        Integer input; this is the number of chunks prepared ahead of the consumer. Pages are fetched in a background thread that waits while this many chunks are ready, so that a slow consumer holds fetching back instead of letting chunks pile up.
+        By default, this is set to 2.
+    
+    Returns
+    -------
+    generator
+        The output is a generator of chunks, in order.
+    
+    Examples
+    --------
+    >>> for chunk in iter_carpark_availability([YOUR_API_KEY], chunksize = 1000):
+    ...     print(chunk.AvailableLots.sum())
+    
+    """
+    return _iter_endpoint(api_key, 'CarParkAvailabilityv2', chunksize, output, workers, buffer)
+
+def iter_traffic_speed_bands(api_key, chunksize = 10000, output = 'pandas', workers = 1, buffer = 2):
+    """
+    Yields the speed bands of get_traffic_speed_bands in chunks of chunksize rows as pages arrive, so that memory is bounded by the chunk size rather than the size of the dataset.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    chunksize: int
+        Integer input; this is the number of rows of each chunk; the last chunk may be shorter.
+        By default, this is set to 10000.
+    
+    output: str
+        Character input; this is the form of each chunk: 'pandas' for a dataframe, 'records' for a list of dicts, 'numpy' for a NumPy structured array or 'arrow' for a pyarrow Table (see formats.OUTPUTS).
+        By default, this is set to 'pandas'.
+    
+    workers: int
+        Integer input; this is the number of pages requested in parallel.
+        By default, this is set to 1 so that pages are requested one at a time.
+    
+    buffer: int
+        Integer input; this is the number of chunks prepared ahead of the consumer. Pages are fetched in a background thread that waits while this many chunks are ready, so that a slow consumer holds fetching back instead of letting chunks pile up.
+        By default, this is set to 2.
+    
+    Returns
+    -------
+    generator
+        The output is a generator of chunks, in order.
+    
+    Examples
+    --------
+    >>> for chunk in iter_traffic_speed_bands([YOUR_API_KEY], output = 'arrow', workers = 4):
+    ...     writer.write_table(chunk)
+    
+    """
+    return _iter_endpoint(api_key, 'TrafficSpeedBandsv2', chunksize, output, workers, buffer)
+
+def _iter_pass_vol_chunks(api_key, kind, date, chunksize, output):
+    link = getattr(final_project_n_lavanya, KINDS[kind])(api_key, date).Link[0]
+    with final_project_n_lavanya._open_pass_vol(link) as csv:
+        for chunk in pd.read_csv(csv, chunksize = chunksize, dtype = final_project_n_lavanya.PASS_VOLUME_DTYPES):
+            yield from_frame(chunk, output)
+
+def iter_pass_vol(api_key, kind, date = None, chunksize = 250000, output = 'pandas', buffer = 2):
+    """
+    Yields a month of a passenger volume dataset in chunks of chunksize rows, parsed from the downloaded CSV file one chunk at a time, so that memory is bounded by the chunk size rather than the size of the dataset.
+    
+    Parameters
+    ----------
+    api_key: str
+        Character input.
+        Please visit https://datamall.lta.gov.sg/content/datamall/en/request-for-api.html to obtain your own API key.
+    
+    kind: str
+        Character input; one of 'bus', 'odbus', 'train' and 'odtrain'.
+    
+    date: str
+        Character input; this is the month of data, as YYYYMM.
+        By default, this is set such that the last month of data is returned.
+    
+    chunksize: int
+        Integer input; this is the number of rows of each chunk; the last chunk may be shorter.
+        By default, this is set to 250000.
+    
+    output: str
+        Character input; this is the form of each chunk: 'pandas' for a dataframe with the compact dtypes of read_pass_vol_csv, 'records' for a list of dicts, 'numpy' for a NumPy record array or 'arrow' for a pyarrow Table.
+        By default, this is set to 'pandas'.
+    
+    buffer: int
+        Integer input; this is the number of chunks parsed ahead of the consumer, in a background thread that waits while this many chunks are ready.
+        By default, this is set to 2.
+    
+    Returns
+    -------
+    generator
+        The output is a generator of chunks, in order.
+    
+    Examples
+    --------
+    >>> for chunk in iter_pass_vol([YOUR_API_KEY], 'odbus', '202011', output = 'arrow'):
+    ...     writer.write_table(chunk)
+    
+    """
+    assert isinstance(api_key, str), "Please ensure that the API key is entered as a string."
+    assert kind in KINDS, "Please ensure that the kind is one of 'bus', 'odbus', 'train' and 'odtrain'."
+    assert isinstance(chunksize, int) and chunksize >= 1, "Please ensure that the chunk size is entered as a positive integer."
+    assert output in OUTPUTS, "Please ensure that the output is one of 'pandas', 'records', 'numpy' or 'arrow'."
+    assert isinstance(buffer, int) and buffer >= 1, "Please ensure that the buffer is entered as a positive integer."
+    return _buffered(_iter_pass_vol_chunks(api_key, kind, date, chunksize, output), buffer)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+DAY_TYPES = ['WD', 'SAT', 'SUN']
+
+# The day type of each weekday, Monday first, and of the weekday before it.
+_DAY_TYPE = np.array([0, 0, 0, 0, 0, 1, 2])
+_PREVIOUS_DAY_TYPE = np.array([2, 0, 0, 0, 0, 0, 1])
+
+def _minutes(hhmm):
+    """
+    Returns "HHMM" strings as minutes after midnight, with -1 for a missing time such as "-".
+    """
+    hhmm = pd.to_numeric(pd.Series(np.asarray(hhmm, dtype = object).ravel()), errors = 'coerce').to_numpy()
+    minutes = hhmm // 100 * 60 + hhmm % 100
+    return np.where(np.isnan(minutes), -1, minutes).astype(np.int16)
+
+class Timetable:
+    """
+    First and last bus times of every service at every bus stop, as integer minutes after midnight indexed by (bus stop, service, direction).
+    
+    A service whose last bus is earlier in the day than its first bus runs past midnight; its last bus is stored as minutes after the midnight that starts its operating day, so that 00:30 the following night is 1470.
+    
+    Examples
+    --------
+    >>> timetable = Timetable.from_routes(get_bus_routes([YOUR_API_KEY], workers = 8))
+    >>> timetable.running('01012', '2', 1, '2020-12-06 23:40')
+    >>> timetable.running(stops, services, directions, pd.date_range('2020-12-06', periods = 1440, freq = 'min'))
+    >>> timetable.services_at('01012', '2020-12-06 23:40')
+    
+    """
+    def __init__(self, keys, first, last):
+        self.keys = keys
+        # first[i, d] and last[i, d] are the first and last bus of key i on DAY_TYPES[d], or -1 where there is no service.
+        self.first = first
+        self.last = last
+
+    @classmethod
+    def from_routes(cls, df):
+        """
+        Returns a Timetable built from a dataframe with the BusStopCode, ServiceNo, Direction and WD/SAT/SUN_FirstBus/LastBus columns of get_bus_routes.
+        A stop visited twice by the same route, as at the ends of a loop service, keeps the earliest first bus and latest last bus.
+        """
+        first = np.column_stack([_minutes(df[f'{day}_FirstBus']) for day in DAY_TYPES])
+        last = np.column_stack([_minutes(df[f'{day}_LastBus']) for day in DAY_TYPES])
+        last = np.where((last >= 0) & (last < first), last + 1440, last).astype(np.int16)
+        first = np.where(last >= 0, first, -1).astype(np.int16)
+        last = np.where(first >= 0, last, -1).astype(np.int16)
+        keys = pd.MultiIndex.from_arrays([df.BusStopCode.astype(str).to_numpy(), df.ServiceNo.astype(str).to_numpy(), df.Direction.astype(int).to_numpy()])
+        codes, keys = keys.factorize()
+        earliest = np.full((len(keys), 3), np.iinfo(np.int16).max, dtype = np.int16)
+        latest = np.full((len(keys), 3), -1, dtype = np.int16)
+        np.minimum.at(earliest, codes, np.where(first >= 0, first, np.iinfo(np.int16).max).astype(np.int16))
+        np.maximum.at(latest, codes, last)
+        earliest[latest < 0] = -1
+        return cls(pd.MultiIndex.from_tuples(keys, names = ['BusStopCode', 'ServiceNo', 'Direction']), earliest, latest)
+
+    def _lookup(self, stop, service, direction):
+        stop, service, direction = np.broadcast_arrays(np.atleast_1d(np.asarray(stop, dtype = object)).astype(str),
+                                                       np.atleast_1d(np.asarray(service, dtype = object)).astype(str),
+                                                       np.atleast_1d(np.asarray(direction)).astype(int))
+        return self.keys.get_indexer(pd.MultiIndex.from_arrays([stop, service, direction]))
+
+    def windows(self, stop, service, direction, day_type):
+        """
+        Returns the first and last bus in minutes after midnight of each (stop, service, direction) on a day type of 'WD', 'SAT' or 'SUN', as two arrays with -1 where there is no service.
+        """
+        assert day_type in DAY_TYPES, "Please ensure that the day type is one of 'WD', 'SAT' or 'SUN'."
+        i = self._lookup(stop, service, direction)
+        d = DAY_TYPES.index(day_type)
+        return np.where(i >= 0, self.first[i, d], -1), np.where(i >= 0, self.last[i, d], -1)
+
+    def running(self, stop, service, direction, when, day_type = None):
+        """
+        Returns a boolean array telling whether each service is running at each stop at the given times, broadcasting over all arguments.
+        
+        With day_type = None, when holds dates and times, and a time after midnight also counts as running when the service of the previous day runs past it.
+        Otherwise, when holds minutes after midnight on day_type, with values of 1440 and above for the hours after the following midnight.
+        """
+        i = self._lookup(stop, service, direction)
+        if day_type is None:
+            when = pd.DatetimeIndex(np.atleast_1d(pd.to_datetime(when)))
+            minutes = (when.hour * 60 + when.minute).to_numpy()
+            weekday = when.weekday.to_numpy()
+            i, minutes, weekday = np.broadcast_arrays(i, minutes, weekday)
+            today, yesterday = _DAY_TYPE[weekday], _PREVIOUS_DAY_TYPE[weekday]
+            running = (self.first[i, today] <= minutes) & (minutes <= self.last[i, today])
+            running |= minutes + 1440 <= self.last[i, yesterday]
+        else:
+            assert day_type in DAY_TYPES, "Please ensure that the day type is one of 'WD', 'SAT' or 'SUN'."
+            i, minutes = np.broadcast_arrays(i, np.atleast_1d(np.asarray(when)))
+            d = DAY_TYPES.index(day_type)
+            running = (self.first[i, d] <= minutes) & (minutes <= self.last[i, d])
+        return running & (i >= 0)
+
+    def services_at(self, stop, when):
+        """
+        Returns a Pandas DataFrame of the services and directions running at a bus stop at a given date and time.
+        """
+        keys = self.keys[self.keys.get_level_values(0) == str(stop)]
+        running = self.running(keys.get_level_values(0), keys.get_level_values(1), keys.get_level_values(2), when)
+        return keys[running].to_frame(index = False)[['ServiceNo', 'Direction']]
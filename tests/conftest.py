@@ -0,0 +1,74 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from final_project_n_lavanya import final_project_n_lavanya
+
+class FakeDataMall:
+    """
+    A local DataMall stand-in serving in-memory records, paginated through $skip.
+    """
+    def __init__(self):
+        self.datasets = {}
+        self.paths = []
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._server.server_port}'
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+            wbufsize = -1
+
+            def do_GET(self):
+                fake.paths.append(self.path)
+                url = urlsplit(self.path)
+                endpoint = url.path.strip('/')
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                data = fake.datasets.get(endpoint)
+                if isinstance(data, bytes):
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/zip')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                headers = {}
+                if data is None:
+                    status, payload = 404, {}
+                elif callable(data):
+                    # A function may return the payload, or a tuple of the status, the payload and optionally the headers of the response.
+                    result = data(query)
+                    status, payload, headers = (*result, {})[:3] if isinstance(result, tuple) else (200, result, {})
+                else:
+                    skip = int(query.get('$skip', 0))
+                    status, payload = 200, {'value': data[skip:skip + final_project_n_lavanya.PAGE_SIZE]}
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+@pytest.fixture
+def datamall(monkeypatch):
+    fake = FakeDataMall()
+    thread = threading.Thread(target = fake._server.serve_forever, daemon = True)
+    thread.start()
+    monkeypatch.setattr(final_project_n_lavanya, 'BASE_URL', fake.url)
+    yield fake
+    fake._server.shutdown()
+    fake._server.server_close()
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+
+import pandas as pd
+
+from final_project_n_lavanya import final_project_n_lavanya
+from final_project_n_lavanya.aio import AsyncDataMall
+from final_project_n_lavanya.cache import ResponseCache
+
+def test_async_and_sync_frames_are_identical(datamall):
+    datamall.datasets['BusStops'] = [{'BusStopCode': f'{i:05d}', 'Latitude': 1.3, 'Longitude': 103.8} for i in range(1200)]
+
+    async def fetch():
+        async with AsyncDataMall(concurrency = 4) as client:
+            return await client.get_bus_stops('key', workers = 2)
+
+    pd.testing.assert_frame_equal(asyncio.run(fetch()), final_project_n_lavanya.get_bus_stops('key'))
+
+def test_fan_out_respects_concurrency(datamall):
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def arrivals(query):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        # Each request is held open long enough for every call allowed in flight to reach the server at once.
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return {'BusStopCode': query['BusStopCode'], 'Services': [{'ServiceNo': '15'}]}
+
+    datamall.datasets['BusArrivals'] = arrivals
+
+    async def fetch():
+        async with AsyncDataMall(concurrency = 3) as client:
+            return await asyncio.gather(*(client.get_bus_arrivals('key', f'{i:05d}') for i in range(30)))
+
+    frames = asyncio.run(fetch())
+    assert len(frames) == 30
+    assert peak[0] == 3
+
+def test_client_options_reach_the_underlying_client(datamall):
+    datamall.datasets['BusStops'] = [{'BusStopCode': '01012', 'Latitude': '1.3'}]
+    cache = ResponseCache()
+
+    async def fetch():
+        async with AsyncDataMall(concurrency = 2, cache = cache, typed = False, decoder = 'json') as client:
+            return [await client.get_bus_stops('key') for _ in range(3)]
+
+    frames = asyncio.run(fetch())
+    assert len(datamall.paths) == 1 and cache.stats()['hits'] == 2
+    assert frames[0].Latitude.tolist() == ['1.3']
@@ -0,0 +1,43 @@
+import numpy as np
+
+from final_project_n_lavanya import final_project_n_lavanya
+from final_project_n_lavanya.bicycle import BicycleParking
+from final_project_n_lavanya.spatial import haversine
+
+rng = np.random.default_rng(0)
+LOCATIONS = [{'Description': f'Rack {i}', 'Latitude': float(lat), 'Longitude': float(long), 'RackType': 'Yellow Box', 'RackCount': 10}
+             for i, (lat, long) in enumerate(zip(rng.uniform(1.28, 1.32, 300), rng.uniform(103.8, 103.86, 300)))]
+
+def within(query, locations = LOCATIONS):
+    lat, long, dist = float(query['Lat']), float(query['Long']), float(query['Dist'])
+    return {'value': [l for l in locations if haversine(lat, long, l['Latitude'], l['Longitude']) <= dist]}
+
+def within_paged(locations):
+    """
+    Returns a BicycleParkingv2 stand-in that, like DataMall, returns at most PAGE_SIZE locations per response, paginated through $skip.
+    """
+    def serve(query):
+        skip = int(query.get('$skip', 0))
+        return {'value': within(query, locations)['value'][skip:skip + final_project_n_lavanya.PAGE_SIZE]}
+    return serve
+
+def test_get_bicyle_parking_accepts_string_distance(datamall):
+    datamall.datasets['BicycleParkingv2'] = within
+    df = final_project_n_lavanya.get_bicyle_parking('key', '1.3', '103.83', '0.5')
+    assert len(df) == len(within({'Lat': '1.3', 'Long': '103.83', 'Dist': '0.5'})['value'])
+
+def test_prefetched_queries_match_remote_queries(datamall):
+    datamall.datasets['BicycleParkingv2'] = within
+    parking = BicycleParking.prefetch('key', dist = 1.0, workers = 4, bounds = (1.27, 103.79, 1.33, 103.87))
+    assert len(parking.df) == len(LOCATIONS)
+    for lat, long in [('1.3', '103.83'), ('1.285', '103.81'), ('1.31', '103.85')]:
+        local = parking.query(lat, long, '0.4')
+        remote = final_project_n_lavanya.get_bicyle_parking('key', lat, long, '0.4')
+        assert sorted(local.Description) == sorted(remote.Description)
+
+def test_prefetch_walks_every_page_of_a_dense_tile(datamall):
+    dense = [{'Description': f'Rack {i}', 'Latitude': 1.3 + i * 1e-6, 'Longitude': 103.83, 'RackType': 'Yellow Box', 'RackCount': 10} for i in range(1200)]
+    datamall.datasets['BicycleParkingv2'] = within_paged(dense)
+    parking = BicycleParking.prefetch('key', dist = 1.0, workers = 2, bounds = (1.295, 103.825, 1.305, 103.835))
+    assert len(parking.df) == 1200
+    assert any(path.endswith('$skip=1000') for path in datamall.paths)
@@ -0,0 +1,67 @@
+import time
+
+from final_project_n_lavanya import final_project_n_lavanya
+
+def bus(minute):
+    return {'OriginCode': '77009', 'DestinationCode': '77009', 'EstimatedArrival': f'2026-10-17T08:{minute:02d}:00+08:00',
+            'Latitude': '1.3', 'Longitude': '103.8', 'VisitNumber': '1', 'Load': 'SEA', 'Feature': 'WAB', 'Type': 'DD'}
+
+def arrivals(query):
+    if query['BusStopCode'] == '99999':
+        return {}
+    empty = dict.fromkeys(bus(0), '')
+    return {'BusStopCode': query['BusStopCode'],
+            'Services': [{'ServiceNo': '15', 'Operator': 'GAS', 'NextBus': bus(1), 'NextBus2': bus(9), 'NextBus3': empty}]}
+
+def test_get_bus_arrivals_many_returns_long_frame_and_failures(datamall):
+    datamall.datasets['BusArrivals'] = arrivals
+    codes = (f'{i:05d}' for i in [1, 2, 99999, 3])
+    df, failures = final_project_n_lavanya.get_bus_arrivals_many('key', codes, workers = 2)
+    assert sorted(df.BusStopCode.unique()) == ['00001', '00002', '00003']
+    assert len(df) == 6
+    assert sorted(df.Sequence.unique()) == [1, 2]
+    assert failures.BusStopCode.tolist() == ['99999']
+
+def test_get_bus_arrivals_many_when_every_stop_fails(datamall):
+    datamall.datasets['BusArrivals'] = lambda query: (429, {})
+    df, failures = final_project_n_lavanya.get_bus_arrivals_many('key', ['00001', '00002'])
+    assert df.empty and str(df.EstimatedArrival.dtype) == 'datetime64[ns, Asia/Singapore]'
+    assert sorted(failures.BusStopCode) == ['00001', '00002']
+
+def test_arrival_columns_skip_empty_entries():
+    columns = final_project_n_lavanya._arrival_columns(arrivals({'BusStopCode': '00001'})['Services'], '00001')
+    assert columns['Sequence'] == [1, 2]
+    assert len(columns['BusStopCode']) == len(columns['EstimatedArrival']) == 2
+
+def test_get_bus_arrivals_many_rate_limits(datamall):
+    datamall.datasets['BusArrivals'] = arrivals
+    start = time.monotonic()
+    final_project_n_lavanya.get_bus_arrivals_many('key', [f'{i:05d}' for i in range(6)], workers = 6, rate = 20)
+    assert time.monotonic() - start >= 0.25
+
+def test_flatten_bus_arrivals_long_and_wide():
+    services = arrivals({'BusStopCode': '00001'})['Services']
+    long = final_project_n_lavanya.flatten_bus_arrivals(services)
+    assert long.Sequence.tolist() == [1, 2]
+    assert str(long.EstimatedArrival.dt.tz) == 'Asia/Singapore'
+    assert long.EstimatedArrival[1].minute == 9
+    assert long.Latitude.dtype == 'float32'
+    assert long.Load.dtype == 'category'
+    wide = final_project_n_lavanya.flatten_bus_arrivals(services, 'wide')
+    assert len(wide) == 1
+    assert wide.NextBus3_EstimatedArrival.isna().all()
+    assert wide.NextBus3_Load.isna().all()
+    assert wide.NextBus2_Longitude.dtype == 'float32'
+
+def test_flatten_bus_arrivals_without_services():
+    long = final_project_n_lavanya.flatten_bus_arrivals([])
+    assert long.empty and str(long.EstimatedArrival.dtype) == 'datetime64[ns, Asia/Singapore]'
+    wide = final_project_n_lavanya.flatten_bus_arrivals([], 'wide')
+    assert wide.empty and str(wide.NextBus3_EstimatedArrival.dtype) == 'datetime64[ns, Asia/Singapore]'
+    assert wide.NextBus_Latitude.dtype == 'float32'
+
+def test_get_bus_arrivals_flatten(datamall):
+    datamall.datasets['BusArrivals'] = arrivals
+    df = final_project_n_lavanya.get_bus_arrivals('key', '00001', flatten = 'long')
+    assert df.ServiceNo.tolist() == ['15', '15']
+    assert 'NextBus' not in df
@@ -0,0 +1,51 @@
+import time
+
+from final_project_n_lavanya.cache import ResponseCache, endpoint_of
+from final_project_n_lavanya.client import DataMall
+
+def test_endpoint_of():
+    assert endpoint_of('http://datamall2.mytransport.sg/ltaodataservice/PV/ODBus?Date=202011') == 'PV/ODBus'
+    assert endpoint_of('http://127.0.0.1:8000/BusRoutes?$skip=500') == 'BusRoutes'
+
+def test_cached_responses_are_reused_until_they_expire(datamall):
+    datamall.datasets['BusStops'] = [{'BusStopCode': '01012'}]
+    datamall.datasets['TrainServiceAlerts'] = lambda query: {'value': {'Status': 1, 'AffectedSegments': [], 'Message': []}}
+    cache = ResponseCache(ttls = {'TrainServiceAlerts': 0.2})
+    client = DataMall(cache = cache)
+    for _ in range(3):
+        client.get_bus_stops('key')
+        client.get_train_service_alerts('key')
+    assert len(datamall.paths) == 2
+    assert cache.stats()['hits'] == 4
+    time.sleep(0.3)
+    client.get_train_service_alerts('key')
+    assert len(datamall.paths) == 3
+
+def test_responses_are_cached_per_account_key(datamall):
+    datamall.datasets['BusStops'] = [{'BusStopCode': '01012'}]
+    cache = ResponseCache()
+    DataMall(cache = cache).get_bus_stops('key')
+    DataMall(cache = cache).get_bus_stops('other key')
+    assert len(datamall.paths) == 2
+    DataMall(cache = cache).get_bus_stops('key')
+    assert len(datamall.paths) == 2 and cache.stats()['hits'] == 1
+
+def test_least_recently_used_responses_are_evicted(datamall):
+    datamall.datasets['BusStops'] = lambda query: {'value': [{'BusStopCode': query['$skip']}] * 10}
+    size = len(DataMall().get(f'{datamall.url}/BusStops?$skip=0').content)
+    cache = ResponseCache(max_bytes = 2 * size)
+    client = DataMall(cache = cache)
+    for skip in ['0', '1', '0', '2']:
+        client.get(f'{datamall.url}/BusStops?$skip={skip}')
+    assert cache.stats()['evictions'] == 1
+    assert cache.get(f'{datamall.url}/BusStops?$skip=0') is not None
+    assert cache.get(f'{datamall.url}/BusStops?$skip=1') is None
+
+def test_uncached_endpoints_always_reach_the_api(datamall):
+    datamall.datasets['BusArrivals'] = lambda query: {'Services': []}
+    cache = ResponseCache(ttls = {'BusArrivals': 0})
+    client = DataMall(cache = cache)
+    client.get_bus_arrivals('key', '01012')
+    client.get_bus_arrivals('key', '01012')
+    assert len(datamall.paths) == 2
+    assert cache.stats()['misses'] == 0
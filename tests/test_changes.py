@@ -0,0 +1,29 @@
+from final_project_n_lavanya import final_project_n_lavanya
+from final_project_n_lavanya.changes import NO_CHANGE, ChangeDetector
+from final_project_n_lavanya.client import DataMall
+
+def test_unchanged_content_reuses_previous_frame(datamall):
+    works = [{'EventID': 'RMAPP-201812-0001', 'Message': 'Road works'}]
+    datamall.datasets['RoadWorks'] = lambda query: {'value': works}
+    changes = ChangeDetector()
+    client = DataMall(changes = changes)
+    first = client.get_road_works('key')
+    second = client.get_road_works('key')
+    assert second is not first
+    assert second.EventID.tolist() == first.EventID.tolist()
+    works.append({'EventID': 'RMAPP-201812-0002', 'Message': 'More road works'})
+    third = client.get_road_works('key')
+    assert len(third) == 2
+    assert changes.stats()['changed'] == 2
+    assert changes.stats()['unchanged'] == 1
+
+def test_sentinel_is_returned_when_content_is_unchanged(datamall):
+    datamall.datasets['VMS'] = lambda query: {'value': [{'EquipmentID': 'amvms_v0001'}]}
+    client = DataMall(changes = ChangeDetector(sentinel = True))
+    assert len(client.get_variable_messages('key')) == 1
+    assert client.get_variable_messages('key') is NO_CHANGE
+
+def test_without_detector_every_response_is_parsed(datamall):
+    datamall.datasets['FaultyTrafficLights'] = lambda query: {'value': []}
+    assert final_project_n_lavanya.get_faulty_traffic_lights('key') is not NO_CHANGE
+    assert final_project_n_lavanya.get_faulty_traffic_lights('key') is not NO_CHANGE
@@ -0,0 +1,22 @@
+from final_project_n_lavanya.client import DataMall, current_client
+
+def test_client_methods_route_through_its_session(datamall):
+    datamall.datasets['TaxiStands'] = lambda query: {'value': [{'TaxiCode': 'A01'}]}
+    client = DataMall(pool_size = 2)
+    sent = []
+    original = client.session.get
+    client.session.get = lambda url, **kwargs: sent.append(url) or original(url, **kwargs)
+    df = client.get_taxi_stands('key')
+    assert df.TaxiCode.tolist() == ['A01']
+    assert sent == [f'{datamall.url}/TaxiStands']
+
+def test_with_block_activates_client():
+    client = DataMall()
+    assert current_client() is not client
+    with client:
+        assert current_client() is client
+    assert current_client() is not client
+
+def test_session_requests_gzip():
+    assert 'gzip' in DataMall().session.headers['Accept-Encoding']
+    assert DataMall(gzip = False).session.headers['Accept-Encoding'] == 'identity'
@@ -0,0 +1,67 @@
+import json
+
+import pandas as pd
+import pytest
+
+from final_project_n_lavanya import client, decode, final_project_n_lavanya
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.decode import decode_columns
+
+def body(records):
+    return json.dumps({'odata.metadata': 'x', 'value': records}).encode()
+
+def test_decode_columns_keeps_values_and_learns_new_fields(monkeypatch):
+    monkeypatch.setattr(decode, '_decoders', {})
+    columns = decode_columns(body([{'LinkID': '1', 'SpeedBand': '3', 'RoadName': 'A'}]), 'TrafficSpeedBandsv2')
+    assert columns == {'LinkID': ['1'], 'SpeedBand': ['3'], 'RoadName': ['A']}
+    columns = decode_columns(body([{'LinkID': '2', 'SpeedBand': 4, 'RoadName': 'B'}, {'LinkID': '3', 'RoadName': 'C'}]), 'TrafficSpeedBandsv2')
+    assert columns == {'LinkID': ['2', '3'], 'SpeedBand': [4, None], 'RoadName': ['B', 'C']}
+    columns = decode_columns(body([{'LinkID': '4', 'SpeedBand': 5, 'RoadName': 'D', 'New': True}]), 'TrafficSpeedBandsv2')
+    assert columns == {'LinkID': ['4'], 'SpeedBand': [5], 'RoadName': ['D'], 'New': [True]}
+    columns = decode_columns(body([{'LinkID': '5', 'SpeedBand': None, 'RoadName': 'E'}]), 'TrafficSpeedBandsv2')
+    assert columns == {'LinkID': ['5'], 'SpeedBand': [None], 'RoadName': ['E']}
+
+def test_decode_columns_leaves_objects_to_the_json_path():
+    assert decode_columns(body({'Status': 1, 'AffectedSegments': [], 'Message': []}), 'TrainServiceAlerts') is None
+
+def test_train_service_alerts_with_either_decoder(datamall):
+    datamall.datasets['TrainServiceAlerts'] = lambda query: {'value': {'Status': 1, 'AffectedSegments': [], 'Message': []}}
+    frames = {}
+    for decoder in ['msgspec', 'json']:
+        with DataMall(decoder = decoder):
+            frames[decoder] = final_project_n_lavanya.get_train_service_alerts('key')
+    assert list(frames['msgspec'].columns) == ['Status', 'AffectedSegments', 'Message', 'Date and Time Accessed']
+    pd.testing.assert_frame_equal(frames['msgspec'].drop(columns = 'Date and Time Accessed'), frames['json'].drop(columns = 'Date and Time Accessed'))
+
+def test_msgspec_and_json_decoders_build_the_same_frame(datamall):
+    records = [{'ServiceNo': str(i % 7), 'Direction': 1 + i % 2, 'StopSequence': i, 'BusStopCode': f'{i:05d}', 'Distance': i / 10}
+               for i in range(1200)]
+    records[700]['Extra'] = 'x'
+    datamall.datasets['BusRoutes'] = records
+    frames = {}
+    for decoder in ['msgspec', 'json']:
+        with DataMall(decoder = decoder):
+            frames[decoder] = final_project_n_lavanya.get_bus_routes('key', workers = 2).drop(columns = 'Extra')
+    pd.testing.assert_frame_equal(frames['msgspec'], frames['json'])
+
+def test_msgspec_and_json_decoders_return_the_same_columns_on_heterogeneous_pages(datamall, monkeypatch):
+    monkeypatch.setattr(decode, '_decoders', {})
+    records = [{'ServiceNo': str(i % 7), 'Direction': 1 + i % 2, 'StopSequence': i, 'BusStopCode': f'{i:05d}', 'Distance': i / 10}
+               for i in range(1200)]
+    first = [dict(record) for record in records]
+    first[0]['Extra'] = 'x'
+    del first[600]['Distance']
+    for dataset in [first, records]:
+        datamall.datasets['BusRoutes'] = dataset
+        frames = {}
+        for decoder in ['msgspec', 'json']:
+            with DataMall(decoder = decoder):
+                frames[decoder] = final_project_n_lavanya.get_bus_routes('key', workers = 2)
+        pd.testing.assert_frame_equal(frames['msgspec'], frames['json'])
+
+def test_falls_back_to_json_without_msgspec(monkeypatch):
+    monkeypatch.setattr(decode, 'msgspec', None)
+    monkeypatch.setattr(client, 'msgspec', None)
+    assert DataMall().decoder == 'json'
+    with pytest.raises(ImportError):
+        DataMall(decoder = 'msgspec')
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from final_project_n_lavanya.erp import ERPIndex
+
+CAR = 'Passenger Cars/Light Goods Vehicles/Taxis'
+
+def rates():
+    return pd.DataFrame({'VehicleType': [CAR, CAR, CAR, 'Motorcycles', CAR, CAR],
+                         'DayType': ['Weekdays', 'Weekdays', 'Saturday', 'Weekdays', 'Weekdays', 'Weekdays'],
+                         'StartTime': ['07:30', '08:00', '12:00', '07:30', '07:30', '23:00'],
+                         'EndTime': ['08:00', '09:00', '13:00', '08:00', '09:00', '00:00'],
+                         'ZoneID': ['AY1', 'AY1', 'AY1', 'AY1', 'AY1', 'BKE'],
+                         'ChargeAmount': ['1.00', '2.00', '0.50', '0.50', '3.00', '1.00'],
+                         'EffectiveDate': ['2020-08-03', '2020-08-03', '2020-08-03', '2020-08-03', '2021-01-04', '2020-08-03']})
+
+def test_charge_by_time_of_day_and_day_type():
+    index = ERPIndex.from_rates(rates())
+    # 2020-12-07 is a Monday.
+    when = pd.to_datetime(['2020-12-07 07:29', '2020-12-07 07:30', '2020-12-07 08:15', '2020-12-07 09:00', '2020-12-12 12:30', '2020-12-13 12:30'])
+    assert index.charge('AY1', CAR, when).tolist() == [0, 1, 2, 0, 0.5, 0]
+    assert index.charge(['AY1', 'AY1', 'XYZ'], ['Motorcycles', 'Buses', CAR], '2020-12-07 07:45').tolist() == [0.5, 0, 0]
+
+def test_end_of_day_and_explicit_day_type():
+    index = ERPIndex.from_rates(rates())
+    assert index.charge('BKE', CAR, ['2020-12-07 23:59', '2020-12-08 00:00']).tolist() == [1, 0]
+    assert index.charge('AY1', CAR, '2020-12-25 07:45', day_type = 'Saturday').tolist() == [0]
+
+def test_effective_date_replaces_schedule():
+    index = ERPIndex.from_rates(rates())
+    when = pd.to_datetime(['2021-01-03 07:45', '2021-01-04 07:45', '2021-01-04 08:30'])
+    assert index.charge('AY1', CAR, when).tolist() == [0, 3, 3]
+    assert index.charge('AY1', CAR, '2020-12-31 08:30').tolist() == [2]
+
+def test_time_zone_aware_times():
+    index = ERPIndex.from_rates(rates())
+    assert index.charge('AY1', CAR, pd.Timestamp('2020-12-07 00:15', tz = 'UTC')).tolist() == [2]
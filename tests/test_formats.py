@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from final_project_n_lavanya import decode, final_project_n_lavanya
+from final_project_n_lavanya.changes import ChangeDetector
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.streaming import iter_traffic_speed_bands
+
+def routes(n = 1200):
+    return [{'ServiceNo': str(i % 7), 'Direction': 1 + i % 2, 'StopSequence': i, 'BusStopCode': f'{i:05d}', 'Distance': str(i / 10)} for i in range(n)]
+
+def test_records_output_is_the_api_records(datamall, monkeypatch):
+    monkeypatch.setattr(decode, '_decoders', {})
+    datamall.datasets['BusRoutes'] = routes()
+    with DataMall(decoder = 'json'):
+        records = final_project_n_lavanya.get_bus_routes('key', workers = 2, output = 'records')
+    assert records == routes()
+    # Values sent as strings stay strings whichever decoder is used, as the schema is only applied to typed outputs.
+    with DataMall(decoder = 'msgspec'):
+        records = final_project_n_lavanya.get_bus_routes('key', workers = 2, output = 'records')
+    assert records == routes()
+
+def test_numpy_output_is_typed_and_its_fields_are_views(datamall):
+    datamall.datasets['BusRoutes'] = routes()
+    array = final_project_n_lavanya.get_bus_routes('key', output = 'numpy')
+    assert array.dtype['StopSequence'] == np.int16 and array.dtype['Distance'] == np.float32 and array.dtype['BusStopCode'] == object
+    assert np.shares_memory(array['StopSequence'], array)
+    assert array['Distance'][11] == np.float32(1.1)
+
+def test_arrow_output_is_typed_and_zero_copy(datamall):
+    datamall.datasets['BusRoutes'] = routes()
+    table = final_project_n_lavanya.get_bus_routes('key', output = 'arrow')
+    assert table.num_rows == 1200
+    assert table.schema.field('ServiceNo').type == pa.dictionary(pa.int32(), pa.string())
+    assert table.schema.field('StopSequence').type == pa.int16()
+    assert b'accessed' in table.schema.metadata
+    sequence = table.column('StopSequence').chunk(0)
+    assert sequence.to_numpy(zero_copy_only = True).tolist() == list(range(1200))
+
+def test_polled_outputs_are_tracked_separately(datamall):
+    datamall.datasets['RoadWorks'] = [{'EventID': '1', 'StartDate': '2020-12-01', 'EndDate': '2020-12-31', 'RoadName': 'A'}]
+    with DataMall(changes = ChangeDetector()):
+        first = final_project_n_lavanya.get_road_works('key', output = 'arrow')
+        assert isinstance(final_project_n_lavanya.get_road_works('key'), pd.DataFrame)
+        second = final_project_n_lavanya.get_road_works('key', output = 'arrow')
+    assert second.equals(first) and first.schema.field('StartDate').type == pa.timestamp('ns')
+
+def test_stream_batches_yields_pages_in_order(datamall):
+    datamall.datasets['BusRoutes'] = routes()
+    for workers in [1, 3]:
+        batches = list(final_project_n_lavanya.stream_batches('key', 'BusRoutes', workers = workers))
+        assert [batch.num_rows for batch in batches] == [500, 500, 200]
+        assert pa.concat_tables(batches).column('StopSequence').to_pylist() == list(range(1200))
+    frames = list(final_project_n_lavanya.stream_batches('key', 'BusRoutes', output = 'pandas'))
+    assert frames[1].StopSequence.dtype == 'int16' and 'Date and Time Accessed' in frames[1]
+
+def test_every_output_splits_location(datamall):
+    datamall.datasets['TrafficSpeedBandsv2'] = [{'LinkID': str(i), 'SpeedBand': 1, 'Location': '1.3 103.8 1.31 103.81' if i else ''} for i in range(600)]
+    for decoder in ['json', 'msgspec']:
+        with DataMall(decoder = decoder):
+            df = final_project_n_lavanya.get_traffic_speed_bands('key', output = 'pandas')
+            records = final_project_n_lavanya.get_traffic_speed_bands('key', output = 'records')
+            array = final_project_n_lavanya.get_traffic_speed_bands('key', output = 'numpy')
+            table = final_project_n_lavanya.get_traffic_speed_bands('key', output = 'arrow')
+            batches = list(final_project_n_lavanya.stream_batches('key', 'TrafficSpeedBandsv2', output = 'arrow'))
+            chunks = list(iter_traffic_speed_bands('key', chunksize = 400, output = 'numpy'))
+        assert df.Latitude.dtype == 'float32' and df.Latitude.isna().sum() == 1
+        assert records[0]['Latitude'] is None and (records[1]['Latitude'], records[1]['Longitude']) == ('1.3', '103.8')
+        assert array.dtype['Latitude'] == np.float32 and array['Longitude'][1] == np.float32(103.8) and np.isnan(array['Latitude'][0])
+        assert table.schema.field('Latitude').type == pa.float32() and table.column('Latitude').to_numpy(zero_copy_only = False)[1] == np.float32(1.3)
+        assert all(batch.schema.field('Longitude').type == pa.float32() for batch in batches)
+        assert [chunk.dtype['Latitude'] for chunk in chunks] == [np.float32, np.float32]
+
+def test_bus_arrivals_and_train_service_alerts_outputs(datamall):
+    bus = {'EstimatedArrival': '2026-10-17T08:01:00+08:00', 'Latitude': '1.3', 'Load': 'SEA'}
+    datamall.datasets['BusArrivals'] = lambda query: {'Services': [{'ServiceNo': '15', 'Operator': 'GAS', 'NextBus': bus, 'NextBus2': {}, 'NextBus3': {}}]}
+    datamall.datasets['TrainServiceAlerts'] = lambda query: {'value': {'Status': 1, 'AffectedSegments': [], 'Message': []}}
+    records = final_project_n_lavanya.get_bus_arrivals('key', '00001', output = 'records')
+    assert records[0]['NextBus'] == bus
+    long = final_project_n_lavanya.get_bus_arrivals('key', '00001', flatten = 'long', output = 'arrow')
+    assert long.num_rows == 1 and long.column('EstimatedArrival').to_pylist() == [bus['EstimatedArrival']]
+    wide = final_project_n_lavanya.get_bus_arrivals('key', '00001', flatten = 'wide', output = 'numpy')
+    assert len(wide) == 1 and wide['NextBus_Load'][0] == 'SEA' and wide['NextBus2_Load'][0] is None
+    for decoder in ['json', 'msgspec']:
+        with DataMall(decoder = decoder):
+            assert final_project_n_lavanya.get_train_service_alerts('key', output = 'records') == [{'Status': 1, 'AffectedSegments': [], 'Message': []}]
+            assert final_project_n_lavanya.get_train_service_alerts('key', output = 'arrow').column('Status').to_pylist() == [1]
@@ -0,0 +1,55 @@
+import io
+import pickle
+import zipfile
+
+import pytest
+
+from final_project_n_lavanya.cache import ResponseCache
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.history import load_pass_vol_history, month_range
+from final_project_n_lavanya.ratelimit import RateLimiter
+
+def zipped(month, trips):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr(f'transport_node_train_{month}.csv', 'YEAR_MONTH,DAY_TYPE,TIME_PER_HOUR,PT_TYPE,PT_CODE,TOTAL_TAP_IN_VOLUME,TOTAL_TAP_OUT_VOLUME\n'
+                         f'{month[:4]}-{month[4:]},WEEKDAY,8,TRAIN,NS1,{trips},{trips}\n')
+    return buffer.getvalue()
+
+@pytest.fixture
+def months(datamall):
+    for month, trips in [('202011', 1), ('202012', 2), ('202101', 3)]:
+        datamall.datasets[f'files/{month}.zip'] = zipped(month, trips)
+    datamall.datasets['PV/Train'] = lambda query: {'value': [{'Link': f"{datamall.url}/files/{query['Date']}.zip"}]}
+    return datamall
+
+def test_month_range_crosses_years():
+    assert month_range('202011', '202102') == ['202011', '202012', '202101', '202102']
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_history_concatenates_months_in_order(months, processes):
+    df = load_pass_vol_history('key', 'train', '202011', '202101', processes = processes)
+    assert df.YEAR_MONTH.astype(str).tolist() == ['2020-11', '2020-12', '2021-01']
+    assert df.TOTAL_TAP_IN_VOLUME.tolist() == [1, 2, 3]
+    assert df.YEAR_MONTH.dtype == 'category'
+
+def test_cached_months_are_not_fetched_again(months, tmp_path):
+    pytest.importorskip('pyarrow')
+    load_pass_vol_history('key', 'train', '202011', '202012', processes = 1, cache_dir = str(tmp_path))
+    months.paths.clear()
+    df = load_pass_vol_history('key', 'train', '202011', '202101', processes = 1, cache_dir = str(tmp_path))
+    assert len(df) == 3
+    assert [p for p in months.paths if p.startswith('/PV')] == ['/PV/Train?Date=202101']
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_history_uses_the_active_client(months, processes):
+    cache, limiter = ResponseCache(), RateLimiter(rate = 50)
+    with DataMall(cache = cache, limiter = limiter):
+        df = load_pass_vol_history('key', 'train', '202011', '202101', processes = processes)
+    assert df.TOTAL_TAP_IN_VOLUME.tolist() == [1, 2, 3]
+    if processes == 1:
+        # Worker processes use copies of the cache and limiter, which are not shared with the calling process.
+        assert cache.stats()['misses'] == 3 and limiter.stats()['requests'] == 6
+    # They reach workers started with the spawn method pickled.
+    assert pickle.loads(pickle.dumps(limiter)).stats()['requests'] == limiter.stats()['requests']
+    assert pickle.loads(pickle.dumps(cache)).stats() == cache.stats()
@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+
+# The cumulative import time, in microseconds, allowed for the main module as measured by python -X importtime.
+IMPORT_BUDGET_US = 150000
+
+HEAVY = ['pandas', 'numpy', 'requests', 'pyarrow']
+
+def import_times(statement):
+    """
+    Returns the cumulative import time in microseconds of each module imported by a statement run in a fresh interpreter.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output = True, text = True, check = True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line and 'cumulative' not in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_import_skips_heavy_dependencies_within_budget():
+    times = import_times('import final_project_n_lavanya.final_project_n_lavanya')
+    assert not [name for name in HEAVY if name in times]
+    assert times['final_project_n_lavanya.final_project_n_lavanya'] < IMPORT_BUDGET_US
+
+def test_raw_records_never_import_pandas(datamall):
+    datamall.datasets['BusStops'] = [{'BusStopCode': '01012', 'RoadName': 'Victoria St', 'Latitude': 1.29, 'Longitude': 103.85}]
+    script = f'''
+import json, sys
+from final_project_n_lavanya import final_project_n_lavanya as lta
+from final_project_n_lavanya.client import DataMall
+lta.BASE_URL = {datamall.url!r}
+outputs = {{}}
+for decoder in ['json', 'msgspec']:
+    with DataMall(decoder = decoder):
+        outputs[decoder] = lta.get_bus_stops('key', output = 'records')
+print(json.dumps([outputs, [name for name in {HEAVY!r} if name in sys.modules]]))
+'''
+    result = subprocess.run([sys.executable, '-c', script], capture_output = True, text = True, check = True)
+    outputs, loaded = json.loads(result.stdout.splitlines()[-1])
+    assert outputs['json'] == outputs['msgspec'] == datamall.datasets['BusStops']
+    assert loaded == ['requests']
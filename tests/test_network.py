@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.network import BusNetwork, _dijkstra
+
+def routes():
+    rows = []
+    # Service 1 runs A-B-C-D, service 2 runs D-E-F and service 3 is a long way round from A to F.
+    for service, direction, stops, distances in [('1', 1, 'ABCD', [0, 1, 2, 3]), ('1', 2, 'DCBA', [0, 1, 2, 3]),
+                                                ('2', 1, 'DEF', [0, 0.5, 1.0]), ('3', 1, 'AXF', [0, 5, 9])]:
+        for sequence, (stop, distance) in enumerate(zip(stops, distances), 1):
+            rows.append({'ServiceNo': service, 'Direction': direction, 'StopSequence': sequence, 'BusStopCode': stop, 'Distance': distance})
+    # Rows arrive in any order and with Distance as text.
+    return pd.DataFrame(rows).sample(frac = 1, random_state = 0).astype({'Distance': str})
+
+def test_shortest_path_by_distance():
+    network = BusNetwork.from_routes(routes())
+    distance, path = network.shortest_path('A', 'F')
+    assert np.isclose(distance, 4.0)
+    assert path == ['A', 'B', 'C', 'D', 'E', 'F']
+    assert network.shortest_path('F', 'A') == (np.inf, [])
+
+def test_shortest_path_matches_dijkstra_between_every_pair():
+    network = BusNetwork.from_routes(routes())
+    graph = [memoryview(a) for a in (network.indptr, network.indices, network.weights)]
+    for i, origin in enumerate(network.stops):
+        distances = _dijkstra(*graph, i)
+        for j, destination in enumerate(network.stops):
+            distance, path = network.shortest_path(origin, destination)
+            if distances[j] == np.inf:
+                assert (distance, path) == (np.inf, [])
+            else:
+                assert np.isclose(distance, distances[j]) and path[0] == origin and path[-1] == destination
+
+def test_fewest_transfers_prefers_one_bus():
+    network = BusNetwork.from_routes(routes())
+    legs = network.fewest_transfers('A', 'F')
+    assert legs.values.tolist() == [['3', 1, 'A', 'F']]
+    legs = network.fewest_transfers('B', 'F')
+    assert legs[['ServiceNo', 'Board', 'Alight']].values.tolist() == [['1', 'B', 'D'], ['2', 'D', 'F']]
+    assert network.fewest_transfers('B', 'F', max_transfers = 0).empty
+
+def test_reachable_within_stops():
+    network = BusNetwork.from_routes(routes())
+    hops = network.reachable('B', 2)
+    assert hops.to_dict() == {'B': 0, 'A': 1, 'C': 1, 'D': 2, 'X': 2}
+
+def test_save_and_load(tmp_path):
+    network = BusNetwork.from_routes(routes())
+    network.save(tmp_path / 'network.npz')
+    loaded = BusNetwork.load(tmp_path / 'network.npz')
+    assert loaded.shortest_path('A', 'F') == network.shortest_path('A', 'F')
+    assert loaded.fewest_transfers('B', 'F').equals(network.fewest_transfers('B', 'F'))
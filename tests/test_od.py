@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from final_project_n_lavanya.od import ODCube
+
+def frame():
+    return pd.DataFrame({
+        'DAY_TYPE': ['WEEKDAY', 'WEEKDAY', 'WEEKDAY', 'WEEKENDS/HOLIDAY', 'WEEKDAY', 'WEEKDAY'],
+        'TIME_PER_HOUR': [7, 7, 8, 7, 7, 9],
+        'ORIGIN_PT_CODE': ['A', 'A', 'A', 'B', 'B', 'A'],
+        'DESTINATION_PT_CODE': ['B', 'C', 'B', 'A', 'C', 'B'],
+        'TOTAL_TRIPS': [10, 5, 7, 3, 2, 1],
+    })
+
+def test_matrix_is_csr_of_one_day_type_and_hour():
+    cube = ODCube.from_frame(frame())
+    m = cube.matrix('WEEKDAY', 7)
+    dense = np.zeros(m.shape, dtype = int)
+    for i in range(m.shape[0]):
+        dense[i, m.indices[m.indptr[i]:m.indptr[i + 1]]] = m.data[m.indptr[i]:m.indptr[i + 1]]
+    assert dense.tolist() == [[0, 10, 5], [0, 0, 2], [0, 0, 0]]
+
+def test_hours_outside_the_day_are_rejected():
+    cube = ODCube.from_frame(frame())
+    for hours in [[24], [-1], range(20, 26)]:
+        with pytest.raises(AssertionError):
+            cube.origin_totals('WEEKDAY', hours)
+    with pytest.raises(AssertionError):
+        cube.top_destinations('A', day_type = 'WEEKDAY', hours = [24])
+    with pytest.raises(AssertionError):
+        cube.matrix('WEEKDAY', 24)
+
+def test_row_and_column_aggregation_match_groupby():
+    df = frame()
+    cube = ODCube.from_frame(df)
+    weekday = df[df.DAY_TYPE == 'WEEKDAY']
+    assert cube.origin_totals('WEEKDAY').to_dict() == {'A': 23, 'B': 2, 'C': 0}
+    assert cube.destination_totals().to_dict() == df.groupby('DESTINATION_PT_CODE').TOTAL_TRIPS.sum().to_dict()
+    assert cube.top_destinations('A', day_type = 'WEEKDAY', hours = range(7, 9)).to_dict() == {'B': 17, 'C': 5}
+    assert cube.top_origins('C', n = 1).to_dict() == {'A': 5}
+    assert cube.origin_totals(hours = [7]).sum() == df[df.TIME_PER_HOUR == 7].TOTAL_TRIPS.sum()
+    assert weekday.TOTAL_TRIPS.sum() == cube.origin_totals('WEEKDAY').sum()
+
+def test_flows_between_groups():
+    cube = ODCube.from_frame(frame())
+    flows = cube.flows({'A': 'North', 'B': 'North', 'C': 'South'}, day_type = 'WEEKDAY')
+    assert flows.loc['North', 'North'] == 18
+    assert flows.loc['North', 'South'] == 7
+    assert flows.loc['South'].sum() == 0
+
+def test_categorical_frame_builds_same_cube():
+    df = frame()
+    compact = df.astype({'DAY_TYPE': 'category', 'ORIGIN_PT_CODE': 'category', 'DESTINATION_PT_CODE': 'category'})
+    expected, cube = ODCube.from_frame(df), ODCube.from_frame(compact)
+    assert list(cube.codes) == list(expected.codes)
+    assert (cube.indptr == expected.indptr).all() and (cube.data == expected.data).all()
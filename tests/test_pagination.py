@@ -0,0 +1,35 @@
+import numpy as np
+
+from final_project_n_lavanya import final_project_n_lavanya
+
+def test_get_bus_routes_walks_every_page(datamall):
+    datamall.datasets['BusRoutes'] = [{'ServiceNo': str(i), 'StopSequence': i} for i in range(1234)]
+    df = final_project_n_lavanya.get_bus_routes('key')
+    assert len(df) == 1234
+    assert df.StopSequence.tolist() == list(range(1234))
+    assert [p.split('$skip=')[1] for p in datamall.paths] == ['0', '500', '1000']
+
+def test_exact_multiple_of_page_size_stops_on_empty_page(datamall):
+    datamall.datasets['BusStops'] = [{'BusStopCode': f'{i:05d}'} for i in range(1000)]
+    df = final_project_n_lavanya.get_bus_stops('key')
+    assert len(df) == 1000
+    assert len(datamall.paths) == 3
+
+def test_concurrent_pages_keep_stable_order(datamall):
+    datamall.datasets['BusRoutes'] = [{'ServiceNo': str(i), 'StopSequence': i} for i in range(2750)]
+    df = final_project_n_lavanya.get_bus_routes('key', workers = 4)
+    assert df.StopSequence.tolist() == list(range(2750))
+
+def test_concurrent_pages_split_location(datamall):
+    datamall.datasets['TrafficSpeedBandsv2'] = [{'LinkID': str(i), 'Location': '1.3 103.8 1.31 103.81'} for i in range(600)]
+    df = final_project_n_lavanya.get_traffic_speed_bands('key', workers = 3)
+    assert len(df) == 600
+    assert df.Latitude.dtype == 'float32' and (df.Latitude == np.float32(1.3)).all()
+
+def test_pages_without_coordinates_split_location(datamall):
+    datamall.datasets['TrafficSpeedBandsv2'] = [{'LinkID': str(i), 'Location': '' if i < 500 else '1.3'} for i in range(600)]
+    df = final_project_n_lavanya.get_traffic_speed_bands('key')
+    assert len(df) == 600
+    assert df.Latitude.isna().sum() == 500 and df.Longitude.isna().all()
+    batches = list(final_project_n_lavanya.stream_batches('key', 'TrafficSpeedBandsv2', output = 'pandas'))
+    assert [len(b) for b in batches] == [500, 100] and batches[0].Latitude.isna().all()
@@ -0,0 +1,42 @@
+import io
+import zipfile
+
+from final_project_n_lavanya import final_project_n_lavanya
+
+CSV = '''YEAR_MONTH,DAY_TYPE,TIME_PER_HOUR,PT_TYPE,ORIGIN_PT_CODE,DESTINATION_PT_CODE,TOTAL_TRIPS
+2020-11,WEEKDAY,7,BUS,01012,01013,25
+2020-11,WEEKENDS/HOLIDAY,7,BUS,01012,01019,3
+2020-11,WEEKDAY,8,BUS,01013,01012,11
+'''
+
+def zipped(text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('origin_destination_bus_202011.csv', text)
+    return buffer.getvalue()
+
+def test_read_pass_vol_csv_uses_compact_dtypes_across_chunks():
+    df = final_project_n_lavanya.read_pass_vol_csv(io.StringIO(CSV), chunksize = 2)
+    assert len(df) == 3
+    assert df.DAY_TYPE.dtype == 'category'
+    assert df.ORIGIN_PT_CODE.tolist() == ['01012', '01012', '01013']
+    assert df.TIME_PER_HOUR.dtype == 'int8'
+    assert df.TOTAL_TRIPS.dtype == 'int32'
+
+def test_get_pass_vol_odbus_downloads_linked_archive(datamall):
+    datamall.datasets['files/odbus.zip'] = zipped(CSV)
+    datamall.datasets['PV/ODBus'] = lambda query: {'value': [{'Link': f'{datamall.url}/files/odbus.zip'}]}
+    df = final_project_n_lavanya.get_pass_vol_odbus('key', '202011', download = True)
+    assert df.TOTAL_TRIPS.tolist() == [25, 3, 11]
+    assert final_project_n_lavanya.get_pass_vol_odbus('key', '202011').Link[0].endswith('odbus.zip')
+
+def test_pass_vol_outputs(datamall):
+    datamall.datasets['files/odbus.zip'] = zipped(CSV)
+    datamall.datasets['PV/ODBus'] = lambda query: {'value': [{'Link': f'{datamall.url}/files/odbus.zip'}]}
+    assert final_project_n_lavanya.get_pass_vol_odbus('key', '202011', output = 'records') == [{'Link': f'{datamall.url}/files/odbus.zip'}]
+    records = final_project_n_lavanya.get_pass_vol_odbus('key', '202011', download = True, output = 'records')
+    assert [record['TOTAL_TRIPS'] for record in records] == [25, 3, 11]
+    array = final_project_n_lavanya.get_pass_vol_odbus('key', '202011', download = True, output = 'numpy')
+    assert array['TOTAL_TRIPS'].dtype == 'int32' and array['ORIGIN_PT_CODE'][2] == '01013'
+    table = final_project_n_lavanya.get_pass_vol_odbus('key', '202011', download = True, output = 'arrow')
+    assert table.column('TOTAL_TRIPS').to_pylist() == [25, 3, 11]
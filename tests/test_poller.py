@@ -0,0 +1,24 @@
+import pandas as pd
+
+from final_project_n_lavanya.poller import DeltaPoller
+
+def test_diff_emits_inserted_updated_and_removed_rows():
+    poller = DeltaPoller('key', 'traffic_speed_bands')
+    first = pd.DataFrame({'LinkID': ['1', '2', '3'], 'SpeedBand': [1, 2, 3], 'Date and Time Accessed': ['t0'] * 3})
+    delta = poller.diff(first)
+    assert (delta.Change == 'insert').all()
+    second = pd.DataFrame({'LinkID': ['1', '2', '4'], 'SpeedBand': [1, 5, 4], 'Date and Time Accessed': ['t1'] * 3})
+    delta = poller.diff(second)
+    assert dict(zip(delta.LinkID, delta.Change)) == {'4': 'insert', '2': 'update', '3': 'remove'}
+    assert delta.set_index('LinkID').SpeedBand.to_dict() == {'4': 4, '2': 5, '3': 3}
+    assert len(poller.diff(second)) == 0
+
+def test_poll_uses_natural_key_of_feed(datamall):
+    lots = {'1': 10, '2': 20}
+    datamall.datasets['CarParkAvailabilityv2'] = lambda query: {'value': [
+        {'CarParkID': k, 'LotType': 'C', 'AvailableLots': v, 'Location': '1.3 103.8 1.3 103.8'} for k, v in lots.items()]}
+    poller = DeltaPoller('key', 'carpark_availability')
+    assert len(poller.poll()) == 2
+    lots['2'] = 19
+    delta = poller.poll()
+    assert delta[['CarParkID', 'AvailableLots']].values.tolist() == [['2', 19]]
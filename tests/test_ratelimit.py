@@ -0,0 +1,80 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.ratelimit import RateLimiter
+
+def flaky(responses):
+    """
+    Returns an endpoint serving the given (status, headers) responses in turn, then a successful response.
+    """
+    responses = list(responses)
+    lock = threading.Lock()
+
+    def serve(query):
+        with lock:
+            status, headers = responses.pop(0) if responses else (200, {})
+        return status, {'value': [{'BusStopCode': '01012'}]} if status == 200 else {}, headers
+    return serve
+
+def test_token_bucket_spaces_requests_across_threads():
+    limiter = RateLimiter(rate = 50, burst = 1)
+    start = time.monotonic()
+    threads = [threading.Thread(target = lambda: [limiter.acquire() for _ in range(3)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The first of 12 requests starts at once and the other 11 at 20ms intervals.
+    assert time.monotonic() - start >= 0.2
+    assert limiter.stats()['requests'] == 12
+
+def test_rate_grows_additively_and_halves_once_per_burst():
+    limiter = RateLimiter(rate = 10, max_rate = 11, decrease = 0.5)
+    sent = limiter.acquire()
+    for _ in range(20):
+        limiter.record(200, sent)
+    assert limiter.rate == 11
+    for _ in range(5):
+        limiter.record(429, sent)
+    assert limiter.rate == 5.5
+    limiter.record(503, limiter.acquire())
+    assert limiter.rate == 2.75
+    assert (limiter.throttled, limiter.server_errors) == (5, 1)
+
+def test_rate_only_grows_when_requests_wait_for_tokens():
+    ok = lambda: SimpleNamespace(status_code = 200, headers = {})
+    # A light workload, whose requests never run out of tokens, leaves the rate where it was.
+    limiter = RateLimiter(rate = 10, burst = 100)
+    for _ in range(50):
+        limiter.send(ok)
+    assert limiter.rate == 10 and limiter.successes == 50
+    limiter = RateLimiter(rate = 100, burst = 1)
+    for _ in range(5):
+        limiter.send(ok)
+    assert limiter.rate == 104
+
+def test_retry_after_holds_back_every_thread():
+    limiter = RateLimiter(rate = 100)
+    limiter.record(429, limiter.acquire(), retry_after = 0.2)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.19
+
+def test_throttled_requests_are_retried(datamall):
+    datamall.datasets['BusStops'] = flaky([(429, {'Retry-After': '0'}), (503, {})])
+    limiter = RateLimiter(backoff = 0.01)
+    df = DataMall(limiter = limiter).get_bus_stops('key')
+    assert df.BusStopCode.tolist() == ['01012']
+    stats = limiter.stats()
+    assert (stats['requests'], stats['throttled'], stats['server_errors'], stats['retries'], stats['successes']) == (3, 1, 1, 2, 1)
+    assert stats['rate'] < 10 and stats['achieved_rate'] > 0
+
+def test_gives_up_after_the_last_retry(datamall):
+    datamall.datasets['BusStops'] = flaky([(429, {})] * 3)
+    with pytest.raises(AssertionError):
+        DataMall(limiter = RateLimiter(retries = 2, backoff = 0.01)).get_bus_stops('key')
+    assert len(datamall.paths) == 3
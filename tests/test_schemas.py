@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya import final_project_n_lavanya
+from final_project_n_lavanya.client import DataMall
+from final_project_n_lavanya.schemas import apply_schema, memory_report
+
+def carparks():
+    return [{'CarParkID': str(i), 'Area': 'Marina', 'Development': f'Mall {i % 3}', 'Location': '1.29 103.85', 'AvailableLots': i,
+             'LotType': 'C', 'Agency': 'LTA'} for i in range(20)]
+
+def test_carpark_availability_is_typed(datamall):
+    datamall.datasets['CarParkAvailabilityv2'] = carparks()
+    df = final_project_n_lavanya.get_carpark_availability('key')
+    assert df.AvailableLots.dtype == 'int16'
+    assert df.Latitude.dtype == 'float32' and df.Longitude.dtype == 'float32'
+    assert all(df[c].dtype == 'category' for c in ['Area', 'Development', 'LotType', 'Agency'])
+    assert df.CarParkID.dtype == object
+
+def test_typed_false_keeps_json_columns(datamall):
+    datamall.datasets['CarParkAvailabilityv2'] = carparks()
+    with DataMall(typed = False):
+        df = final_project_n_lavanya.get_carpark_availability('key')
+    assert df.AvailableLots.dtype == 'int64' and df.Agency.dtype == object
+
+def test_apply_schema_handles_missing_values_and_dates():
+    df = pd.DataFrame({'EventID': ['1', '2'], 'StartDate': ['2020-12-01', 'bad'], 'RoadName': ['A', 'A']})
+    typed = apply_schema(df, 'RoadWorks')
+    assert typed.StartDate.dtype == 'datetime64[ns]' and typed.StartDate.isna().tolist() == [False, True]
+    assert apply_schema(pd.DataFrame({'SpeedBand': ['1', None]}), 'TrafficSpeedBandsv2').SpeedBand.dtype == 'float32'
+    assert apply_schema(df, 'NoSuchEndpoint') is df
+
+def test_memory_report_totals():
+    df = pd.DataFrame({'ServiceNo': ['10', '12'] * 500, 'StopSequence': np.arange(1000), 'Distance': ['1.5'] * 1000})
+    report = memory_report(df, 'BusRoutes')
+    assert report.loc['StopSequence', 'DtypeAfter'] == 'int16'
+    assert report.loc['Total', 'BytesAfter'] < report.loc['Total', 'BytesBefore'] / 5
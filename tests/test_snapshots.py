@@ -0,0 +1,41 @@
+import json
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from final_project_n_lavanya.snapshots import SnapshotStore
+
+def test_load_writes_then_reads_snapshot(datamall, tmp_path):
+    datamall.datasets['BusStops'] = [{'BusStopCode': f'{i:05d}', 'Latitude': 1.3} for i in range(700)]
+    store = SnapshotStore(str(tmp_path))
+    fetched = store.load('bus_stops', 'key')
+    assert json.loads((tmp_path / 'bus_stops.json').read_text())['rows'] == 700
+    requests_made = len(datamall.paths)
+    pd.testing.assert_frame_equal(store.load('bus_stops', 'key'), fetched)
+    assert len(datamall.paths) == requests_made
+    store.load('bus_stops', 'key', refresh = True)
+    assert len(datamall.paths) == 2 * requests_made
+
+def test_stale_snapshot_is_fetched_again(datamall, tmp_path):
+    datamall.datasets['ERPRates'] = [{'ZoneID': 'AY1', 'ChargeAmount': 1.0}]
+    store = SnapshotStore(str(tmp_path), max_age = 0)
+    store.load('erp_rates', 'key')
+    store.load('erp_rates', 'key')
+    assert len(datamall.paths) == 2
+    assert not store.is_fresh('erp_rates')
+    assert store.is_fresh('erp_rates', max_age = 60)
+
+def test_arrow_snapshots_are_memory_mapped(datamall, tmp_path):
+    datamall.datasets['BusStops'] = [{'BusStopCode': f'{i:05d}', 'Latitude': 1.3, 'Longitude': 103.8} for i in range(700)]
+    store = SnapshotStore(str(tmp_path))
+    fetched = store.load('bus_stops', 'key', output = 'arrow')
+    table = store.load('bus_stops', 'key', output = 'arrow')
+    assert table.equals(fetched)
+    # Columns of a memory-mapped table are not allocated from the Arrow memory pool.
+    pa = pytest.importorskip('pyarrow')
+    allocated = pa.total_allocated_bytes()
+    mapped = store.read('bus_stops', 'arrow')
+    assert pa.total_allocated_bytes() - allocated < mapped.nbytes
+    pd.testing.assert_frame_equal(store.read('bus_stops'), table.to_pandas())
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.spatial import SpatialIndex, haversine
+
+def points(n = 3000, seed = 0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(1.24, 1.46, n), rng.uniform(103.6, 104.0, n)
+
+def test_knn_matches_brute_force():
+    lat, lon = points()
+    index = SpatialIndex(lat, lon)
+    qlat, qlon = points(50, seed = 1)
+    distances, positions = index.knn(qlat, qlon, k = 7)
+    for i in range(50):
+        brute = haversine(qlat[i], qlon[i], lat, lon)
+        assert np.allclose(distances[i], np.sort(brute)[:7])
+        assert np.allclose(brute[positions[i]], distances[i])
+
+def test_radius_matches_brute_force():
+    lat, lon = points()
+    index = SpatialIndex(lat, lon, cell_km = 0.3)
+    qlat, qlon = points(50, seed = 2)
+    distances, positions = index.radius(qlat, qlon, 1.2)
+    for i in range(50):
+        brute = haversine(qlat[i], qlon[i], lat, lon)
+        assert set(positions[i]) == set(np.flatnonzero(brute <= 1.2))
+        assert (np.diff(distances[i]) >= 0).all()
+
+def test_knn_outside_the_grid():
+    rng = np.random.default_rng(3)
+    lat, lon = rng.uniform(1.3, 1.4, 100), rng.uniform(103.8, 103.9, 100)
+    index = SpatialIndex(lat, lon)
+    distances, positions = index.knn([1.3, 1.0], [104.2, 103.5], k = 5)
+    for i, (qlat, qlon) in enumerate([(1.3, 104.2), (1.0, 103.5)]):
+        brute = haversine(qlat, qlon, lat, lon)
+        assert np.allclose(distances[i], np.sort(brute)[:5])
+        assert np.allclose(brute[positions[i]], distances[i])
+
+def test_knn_with_fewer_points_than_k():
+    index = SpatialIndex([1.3, 1.31], [103.8, 103.81])
+    distances, positions = index.knn(1.3, 103.8, k = 5)
+    assert positions.tolist() == [[0, 1]]
+
+def test_nearest_rows_of_frame_with_string_coordinates():
+    df = pd.DataFrame({'CarParkID': ['1', '2', '3'], 'Latitude': ['1.30', '1.35', '1.31'], 'Longitude': ['103.80', '103.85', '103.81']})
+    index = SpatialIndex.from_frame(df)
+    assert index.nearest(df, 1.301, 103.801, k = 2).CarParkID.tolist() == ['1', '3']
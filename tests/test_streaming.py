@@ -0,0 +1,70 @@
+import io
+import threading
+import time
+import zipfile
+
+import pandas as pd
+
+from final_project_n_lavanya import streaming
+from final_project_n_lavanya.streaming import iter_bus_routes, iter_pass_vol, iter_traffic_speed_bands
+
+CSV = '''YEAR_MONTH,DAY_TYPE,TIME_PER_HOUR,PT_TYPE,ORIGIN_PT_CODE,DESTINATION_PT_CODE,TOTAL_TRIPS
+2020-11,WEEKDAY,7,BUS,01012,01013,25
+2020-11,WEEKENDS/HOLIDAY,7,BUS,01012,01019,3
+2020-11,WEEKDAY,8,BUS,01013,01012,11
+'''
+
+def zipped(text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('origin_destination_bus_202011.csv', text)
+    return buffer.getvalue()
+
+def routes(n):
+    return [{'ServiceNo': str(i % 7), 'Direction': 1 + i % 2, 'StopSequence': i, 'BusStopCode': f'{i:05d}', 'Distance': i / 10} for i in range(n)]
+
+def test_iter_bus_routes_in_chunks_with_merged_categories(datamall):
+    datamall.datasets['BusRoutes'] = routes(1234)
+    chunks = list(iter_bus_routes('key', chunksize = 300, workers = 2))
+    assert [len(c) for c in chunks] == [300, 300, 300, 300, 34]
+    assert all(c.ServiceNo.dtype == 'category' for c in chunks)
+    assert pd.concat(chunks).StopSequence.tolist() == list(range(1234))
+    arrays = list(iter_bus_routes('key', chunksize = 1000, output = 'numpy'))
+    assert [len(a) for a in arrays] == [1000, 234] and arrays[1]['StopSequence'][0] == 1000
+
+def test_iter_splits_location(datamall):
+    datamall.datasets['TrafficSpeedBandsv2'] = [{'LinkID': str(i), 'SpeedBand': 1, 'Location': '1.3 103.8 1.31 103.81'} for i in range(700)]
+    chunk = next(iter_traffic_speed_bands('key', chunksize = 600))
+    assert len(chunk) == 600 and chunk.Latitude.dtype == 'float32'
+
+def test_slow_consumer_holds_back_fetching(datamall):
+    datamall.datasets['BusRoutes'] = routes(5000)
+    chunks = iter_bus_routes('key', chunksize = 500, buffer = 1)
+    next(chunks)
+    time.sleep(0.3)
+    # One chunk taken, one waiting in the queue and one held by the producer thread.
+    assert len(datamall.paths) <= 3
+    chunks.close()
+    assert not any(t.name == 'datamall-stream' for t in threading.enumerate())
+
+def test_errors_reach_the_consumer():
+    def failing():
+        yield 1
+        raise ValueError('page failed')
+    chunks = streaming._buffered(failing(), 2)
+    assert next(chunks) == 1
+    try:
+        next(chunks)
+    except ValueError as e:
+        assert str(e) == 'page failed'
+    else:
+        raise AssertionError('the error was not raised')
+
+def test_iter_pass_vol_parses_the_archive_in_chunks(datamall):
+    datamall.datasets['files/odbus.zip'] = zipped(CSV)
+    datamall.datasets['PV/ODBus'] = lambda query: {'value': [{'Link': f'{datamall.url}/files/odbus.zip'}]}
+    chunks = list(iter_pass_vol('key', 'odbus', '202011', chunksize = 2))
+    assert [len(c) for c in chunks] == [2, 1]
+    assert chunks[0].TOTAL_TRIPS.dtype == 'int32' and chunks[1].ORIGIN_PT_CODE.tolist() == ['01013']
+    records = list(iter_pass_vol('key', 'odbus', '202011', chunksize = 5, output = 'records'))
+    assert records[0][0]['TOTAL_TRIPS'] == 25
@@ -0,0 +1,27 @@
+import pandas as pd
+import requests
+
+from final_project_n_lavanya import final_project_n_lavanya
+
+def test_time_accessed_is_server_time_in_singapore(datamall):
+    datamall.datasets['Taxi-Availability'] = [{'Latitude': 1.3, 'Longitude': 103.8}] * 3
+    before = pd.Timestamp.now(tz = 'UTC').floor('s')
+    df = final_project_n_lavanya.get_taxi_availability('key')
+    column = df['Date and Time Accessed']
+    assert str(column.dtype) == 'datetime64[ns, Asia/Singapore]'
+    assert column.nunique() == 1 and column[0] == df.attrs['accessed']
+    assert before <= df.attrs['accessed'] <= pd.Timestamp.now(tz = 'UTC')
+
+def test_polls_concatenate_into_time_index(datamall):
+    datamall.datasets['Taxi-Availability'] = [{'Latitude': 1.3, 'Longitude': 103.8}] * 2
+    frames = [final_project_n_lavanya.get_taxi_availability('key') for _ in range(2)]
+    polls = pd.concat(frames).set_index('Date and Time Accessed')
+    assert isinstance(polls.index, pd.DatetimeIndex) and str(polls.index.tz) == 'Asia/Singapore'
+    assert polls.index.is_monotonic_increasing
+
+def test_accessed_falls_back_to_local_clock():
+    r = requests.Response()
+    r.headers['Date'] = 'Mon, 07 Dec 2020 01:30:00 GMT'
+    assert final_project_n_lavanya._accessed(r) == pd.Timestamp('2020-12-07 09:30', tz = 'Asia/Singapore')
+    r.headers['Date'] = 'not a date'
+    assert str(final_project_n_lavanya._accessed(r).tz) == 'Asia/Singapore'
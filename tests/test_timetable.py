@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from final_project_n_lavanya.timetable import Timetable
+
+def routes():
+    return pd.DataFrame({'ServiceNo': ['2', '2', 'NR1', '2'], 'Direction': [1, 1, 1, 1], 'BusStopCode': ['01012', '01013', '01012', '01012'],
+                         'WD_FirstBus': ['0530', '0532', '2330', '0545'], 'WD_LastBus': ['2330', '2332', '0200', '2345'],
+                         'SAT_FirstBus': ['0530', '0532', '2330', '0545'], 'SAT_LastBus': ['0030', '0032', '0200', '0045'],
+                         'SUN_FirstBus': ['0600', '0602', '-', '0615'], 'SUN_LastBus': ['2300', '2302', '-', '2315']})
+
+def test_windows_in_minutes_with_loop_stop_merged():
+    timetable = Timetable.from_routes(routes())
+    first, last = timetable.windows(['01012', '01012', '99999'], ['2', 'NR1', '2'], 1, 'SAT')
+    assert first.tolist() == [330, 1410, -1]
+    assert last.tolist() == [1485, 1560, -1]
+
+def test_running_past_midnight_counts_for_previous_day():
+    timetable = Timetable.from_routes(routes())
+    # 2020-12-05 is a Saturday.
+    when = ['2020-12-05 23:40', '2020-12-06 00:40', '2020-12-06 00:50', '2020-12-06 23:40', '2020-12-07 05:50']
+    assert timetable.running('01012', '2', 1, when).tolist() == [True, True, False, False, True]
+    assert timetable.running('01012', 'NR1', 1, when).tolist() == [True, True, True, False, False]
+
+def test_running_with_minutes_and_day_type():
+    timetable = Timetable.from_routes(routes())
+    running = timetable.running(['01012', '01013', '01012'], '2', 1, np.array([1480, 1470, 20]), day_type = 'SAT')
+    assert running.tolist() == [True, True, False]
+
+def test_services_at_stop():
+    timetable = Timetable.from_routes(routes())
+    assert timetable.services_at('01012', '2020-12-06 01:00').values.tolist() == [['NR1', 1]]